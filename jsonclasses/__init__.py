@@ -14,6 +14,6 @@ from .jsonclass import jsonclass
 from .jsonenum import jsonenum
 from .types import types
 from .typing import linkto, linkedby, linkedthru
-from .encoder import JSONEncoder
+from .encoder import JSONEncoder, iter_tojson, dump_ndjson
 from .isjsonclass import isjsonclass, isjsonobject
 from .uconf import uconf
@@ -0,0 +1,39 @@
+"""This module defines `arity`, which counts the parameters of user provided
+callables. Modifiers and lifecycle callbacks call user callables with as many
+arguments as the callables accept. Inspecting a signature is slow, thus the
+count of each callable is figured out once and remembered.
+"""
+from __future__ import annotations
+from typing import Callable
+from types import MethodType
+from inspect import signature
+from weakref import WeakKeyDictionary
+
+
+_arities: WeakKeyDictionary[Callable, int] = WeakKeyDictionary()
+
+
+def arity(fn: Callable) -> int:
+    """Get the count of parameters of a callable.
+
+    The count is remembered until the callable is garbage collected. Bound
+    methods are counted with their underlying functions. Callables which
+    cannot be weakly referenced are inspected on every call.
+
+    Args:
+        fn (Callable): The callable to count parameters of.
+
+    Returns:
+        int: The count of parameters.
+    """
+    if isinstance(fn, MethodType):
+        return arity(fn.__func__) - 1
+    try:
+        return _arities[fn]
+    except KeyError:
+        pass
+    except TypeError:
+        return len(signature(fn).parameters)
+    count = len(signature(fn).parameters)
+    _arities[fn] = count
+    return count
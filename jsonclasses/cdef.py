@@ -11,8 +11,17 @@ from dataclasses import fields as dataclass_fields
 from .jfield import JField
 from .fdef import FStore, DeleteRule, FType
 from .rtypes import rtypes, rnamedtypes
+from .ntable import NTable
+from .snapshot import snapshot_cdef, keep_cdef
+from .compiler import (
+    Transformer, Serializer, StreamSerializer, compile_transform,
+    compile_tojson, compile_iter_tojson
+)
 if TYPE_CHECKING:
     from .jconf import JConf
+    from .fdef import FDef
+    from .modifiers.instanceof_modifier import InstanceOfModifier
+    from .types import Types
 
 
 @final
@@ -39,6 +48,14 @@ class CDef:
         jconf._cls = cls
         self._name: str = cls.__name__
         self._jconf: JConf = jconf
+        self._ntable = NTable(jconf.output_key_strategy)
+        self._snapshot_name = (f'{jconf.cgraph.name}:{cls.__module__}.'
+                               f'{cls.__qualname__}')
+        self._snapshot_refs: Optional[list[tuple[str, str, str]]] = None
+        snapshot = snapshot_cdef(self._snapshot_name)
+        if snapshot is not None:
+            self._ntable.load(snapshot['names'])
+            self._snapshot_refs = snapshot['refs']
         self._list_fields: list[JField] = []
         self._dict_fields: dict[str, JField] = {}
         self._primary_field: Optional[JField] = None
@@ -61,6 +78,13 @@ class CDef:
         self._auth_identity_fields: list[JField] = []
         self._auth_by_fields: list[JField] = []
         self._rfmap: dict[str, JField] = {}
+        self._compiled_transform: Optional[Transformer] = None
+        self._compiled_tojson: Optional[Serializer] = None
+        self._compiled_iter_tojson: Optional[StreamSerializer] = None
+        self._leaf_field_names: Optional[frozenset[str]] = None
+        self._closed_validation: Optional[bool] = None
+        self._root_fdef: Optional[FDef] = None
+        self._root_modifier: Optional[InstanceOfModifier] = None
         for field in dataclass_fields(cls):
             name = field.name
             self._field_names.append(name)
@@ -73,9 +97,9 @@ class CDef:
             else:
                 types = rtypes(field.type)
                 default = field.default
-            types.fdef._cdef = self
+            types = types._owned(self)
             jfield = JField(cdef=self, name=name, default=default, types=types)
-            self._camelized_field_names.append(jfield.json_name)
+            self._camelized_field_names.append(self._ntable.add(name))
             self._list_fields.append(jfield)
             self._dict_fields[name] = jfield
             if types.fdef._primary:
@@ -120,6 +144,13 @@ class CDef:
         """
         return self._jconf
 
+    @property
+    def ntable(self: CDef) -> NTable:
+        """The name table of the JSON class on which this class definition is
+        defined.
+        """
+        return self._ntable
+
     def field_named(self: CDef, name: str) -> JField:
         """
         Get the field which is named `name`.
@@ -269,6 +300,85 @@ class CDef:
         self._resolve_ref_names_if_needed()
         return self._virtual_reference_fields
 
+    @property
+    def compiled_transform(self: CDef) -> Transformer:
+        """The compiled field assigning function of this class definition.
+        This is compiled on first use and recompiled after references are
+        resolved.
+        """
+        if self._compiled_transform is None:
+            self._compiled_transform = compile_transform(self)
+        return self._compiled_transform
+
+    @property
+    def compiled_tojson(self: CDef) -> Serializer:
+        """The compiled JSON outputting function of this class definition.
+        This is compiled on first use and recompiled after references are
+        resolved.
+        """
+        if self._compiled_tojson is None:
+            self._compiled_tojson = compile_tojson(self)
+        return self._compiled_tojson
+
+    @property
+    def compiled_iter_tojson(self: CDef) -> StreamSerializer:
+        """The compiled JSON streaming function of this class definition.
+        This is compiled on first use and recompiled after references are
+        resolved.
+        """
+        if self._compiled_iter_tojson is None:
+            self._compiled_iter_tojson = compile_iter_tojson(self)
+        return self._compiled_iter_tojson
+
+    @property
+    def leaf_field_names(self: CDef) -> frozenset[str]:
+        """The names of the embedded fields of which values never hold JSON
+        class objects and are validated without reading the context.
+        Validating these fields of an object which hasn't changed since its
+        last successful validation is skipped.
+        """
+        if self._leaf_field_names is None:
+            self._resolve_ref_types_if_needed()
+            self._leaf_field_names = frozenset(
+                f.name for f in self._tuple_fields
+                if f.fdef.fstore == FStore.EMBEDDED
+                and not _holds_objects(f.fdef)
+                and f.types.modifier.pure_validation)
+        return self._leaf_field_names
+
+    @property
+    def closed_validation(self: CDef) -> bool:
+        """Whether objects of this class and the objects they hold are
+        validated by built-in validators only, which read nothing but the
+        objects. If no object has changed since an object's last successful
+        validation, the object is known to be valid without validating.
+        """
+        if self._closed_validation is None:
+            self._closed_validation = _closed_cdef(self, set())
+        return self._closed_validation
+
+    @property
+    def root_fdef(self: CDef) -> FDef:
+        """The field definition of objects of this class at the root of
+        contexts. This is created once and shared by every root context.
+        """
+        if self._root_fdef is None:
+            from .types import types
+            fdef = types.objof(self._cls).fdef
+            fdef._cdef = self
+            self._root_fdef = fdef
+        return self._root_fdef
+
+    @property
+    def root_modifier(self: CDef) -> InstanceOfModifier:
+        """The modifier which transforms, validates and outputs objects of
+        this class from the root.
+        """
+        if self._root_modifier is None:
+            from .modifiers.instanceof_modifier import InstanceOfModifier
+            self._root_modifier = InstanceOfModifier(self._cls)
+        return self._root_modifier
+
     def rname_to_jfield(self: CDef, ref_name: str) -> JField:
         self._resolve_ref_names_if_needed()
         return self._rfmap[ref_name]
@@ -287,6 +397,28 @@ class CDef:
         else:
             return None
 
+    def finalize(self: CDef) -> None:
+        """Resolve every field of this class definition ahead of time and
+        compile its pipelines. Unresolved type names raise here instead of
+        on first use.
+
+        Raises:
+            JSONClassNotFoundException: If a class name is not found in the \
+                class graph.
+            UnresolvedTypeNameException: If a type name is not found in the \
+                class graph.
+        """
+        self._resolve_ref_types_if_needed()
+        self._resolve_ref_names_if_needed()
+        self.root_fdef.finalize()
+        for field in self._tuple_fields:
+            field.finalize()
+        self._leaf_field_names = None
+        self._closed_validation = None
+        self._compiled_transform = compile_transform(self)
+        self._compiled_tojson = compile_tojson(self)
+        self._compiled_iter_tojson = compile_iter_tojson(self)
+
     def _resolve_ref_types_if_needed(self: CDef) -> None:
         if self._ref_types_resolved is False:
             self._resolve_types()
@@ -302,30 +434,36 @@ class CDef:
             if jfield.types.fdef._unresolved:
                 cgraph = self.jconf.cgraph
                 jfield._types = rnamedtypes(jfield.types, cgraph, self.name)
+        self._compiled_transform = None
+        self._compiled_tojson = None
+        self._compiled_iter_tojson = None
+        self._leaf_field_names = None
+        self._closed_validation = None
 
     def _resolve_ref_names(self: CDef) -> None:
-        for jfield in self._tuple_fields:
-            if jfield.types.fdef._fstore == FStore.LOCAL_KEY:
-                ref_name_strategy = self.jconf.ref_name_strategy
-                if jfield.fdef.ftype == FType.INSTANCE:
-                    self._reference_names.append(ref_name_strategy(jfield))
-                    self._camelized_reference_names.append(
-                        self.jconf.output_key_strategy(ref_name_strategy(jfield)))
-                    self._rfmap[ref_name_strategy(jfield)] = jfield
-                elif jfield.fdef.ftype == FType.LIST:
-                    self._list_reference_names.append(ref_name_strategy(jfield))
-                    self._camelized_list_reference_names.append(
-                        self.jconf.output_key_strategy(ref_name_strategy(jfield)))
-                    self._rfmap[ref_name_strategy(jfield)] = jfield
-            elif jfield.types.fdef._fstore == FStore.FOREIGN_KEY:
-                if jfield.types.fdef._use_join_table:
-                    rkes = self.jconf.ref_name_strategy
-                    jkes = self.jconf.output_key_strategy
-                    rk = rkes(jfield)
-                    self._virtual_reference_names.append(rk)
-                    self._camelized_virtual_reference_names.append(jkes(rk))
-                    self._virtual_reference_fields[rk] = jfield
-                    self._rfmap[rk] = jfield
+        from .fdescr import install_local_key_fdescrs
+        refs = self._snapshot_refs
+        if refs is None or any(n not in self._dict_fields for *_, n in refs):
+            refs = self._ref_entries()
+        for kind, rk, name in refs:
+            jfield = self._dict_fields[name]
+            jfield._ref_name = rk
+            jname = self._ntable.add(rk)
+            if kind == 'list':
+                self._list_reference_names.append(rk)
+                self._camelized_list_reference_names.append(jname)
+            elif kind == 'virtual':
+                self._virtual_reference_names.append(rk)
+                self._camelized_virtual_reference_names.append(jname)
+                self._virtual_reference_fields[rk] = jfield
+            else:
+                self._reference_names.append(rk)
+                self._camelized_reference_names.append(jname)
+            self._rfmap[rk] = jfield
+        keep_cdef(self._snapshot_name,
+                  {'names': self._ntable.encoded, 'refs': refs})
+        install_local_key_fdescrs(self.cls, self._reference_names
+                                  + self._list_reference_names)
         self._available_names: set[str] = set(self._field_names
                                               + self._camelized_field_names
                                               + self._reference_names
@@ -335,3 +473,55 @@ class CDef:
         self._update_names: set[str] = set(self._field_names
                                            + self._reference_names
                                            + self._list_reference_names)
+
+    def _ref_entries(self: CDef) -> list[tuple[str, str, str]]:
+        ref_name_strategy = self.jconf.ref_name_strategy
+        refs: list[tuple[str, str, str]] = []
+        for jfield in self._tuple_fields:
+            if jfield.types.fdef._fstore == FStore.LOCAL_KEY:
+                self._resolve_ref_types_if_needed()
+                if jfield.fdef.ftype == FType.INSTANCE:
+                    kind = 'instance'
+                elif jfield.fdef.ftype == FType.LIST:
+                    kind = 'list'
+                else:
+                    continue
+            elif jfield.types.fdef._fstore == FStore.FOREIGN_KEY:
+                if not jfield.types.fdef._use_join_table:
+                    continue
+                kind = 'virtual'
+            else:
+                continue
+            refs.append((kind, ref_name_strategy(jfield), jfield.name))
+        return refs
+
+
+def _holds_objects(fdef: Any) -> bool:
+    if fdef.ftype in (FType.INSTANCE, FType.UNION, FType.ANY):
+        return True
+    if fdef.ftype in (FType.LIST, FType.DICT):
+        item_types = fdef.item_types
+        return item_types is None or _holds_objects(item_types.fdef)
+    return False
+
+
+def _closed_cdef(cdef: CDef, visiting: set[int]) -> bool:
+    if id(cdef) in visiting:
+        return True
+    visiting.add(id(cdef))
+    cdef._resolve_ref_types_if_needed()
+    return all(_closed_types(f.types, visiting) for f in cdef._tuple_fields)
+
+
+def _closed_types(types: Types, visiting: set[int]) -> bool:
+    if not types.modifier.closed_validation:
+        return False
+    fdef = types.fdef
+    if fdef.ftype == FType.INSTANCE:
+        cls = fdef.inst_cls
+        return cls is not None and _closed_cdef(cls.cdef, visiting)
+    if fdef.ftype in (FType.LIST, FType.DICT):
+        item_types = fdef.item_types
+        return item_types is not None \
+            and _closed_types(item_types, visiting)
+    return fdef.ftype not in (FType.UNION, FType.ANY)
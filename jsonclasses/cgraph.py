@@ -61,7 +61,8 @@ class CGraph:
                                      can_create=[],
                                      can_update=[],
                                      can_delete=[],
-                                     can_read=[])
+                                     can_read=[],
+                                     compact=False)
         self.__class__._initialized_map[name] = True
         return None
 
@@ -130,6 +131,21 @@ class CGraph:
             name = name_or_class
         return self._map.get(name) is not None
 
+    def finalize(self: CGraph) -> None:
+        """Resolve every class of this class graph ahead of time. References,
+        item types, foreign fields and enums are resolved, and pipelines are
+        compiled. Call this after all classes of the graph are defined, thus
+        unresolved names raise at startup instead of on first use.
+
+        Raises:
+            JSONClassNotFoundException: If a class name is not found in this \
+                class graph.
+            UnresolvedTypeNameException: If a type name is not found in this \
+                class graph.
+        """
+        for cdef in list(self._map.values()):
+            cdef.finalize()
+
     def put_enum(self: CGraph, enum_class: type[Enum]) -> None:
         """Put a enum class onto this class graph.
 
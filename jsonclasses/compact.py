@@ -0,0 +1,268 @@
+"""This module defines compact JSON classes. A compact JSON class stores field
+values in slots, packs its status booleans into a single flags int and
+allocates its tracking containers on first use. Use `@jsonclass(compact=True)`
+for classes of which a lot of objects are held in memory.
+"""
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+from types import MemberDescriptorType
+from .fdef import FStore
+from .fdescr import FieldDescriptor
+from .vclock import tick
+if TYPE_CHECKING:
+    from .jobject import JObject
+
+
+FLAG_NEW = 1
+FLAG_MODIFIED = 2
+FLAG_PARTIAL = 4
+FLAG_DELETED = 8
+
+
+FLAGS: dict[str, int] = {
+    '_is_new': FLAG_NEW,
+    '_is_modified': FLAG_MODIFIED,
+    '_is_partial': FLAG_PARTIAL,
+    '_is_deleted': FLAG_DELETED,
+}
+
+
+LAZY_SLOTS: dict[str, Callable[[], Any]] = {
+    '_modified_fields': set,
+    '_previous_values': dict,
+    '_local_keys': set,
+    '_local_key_map': dict,
+    '_unlinked_objects': dict,
+    '_link_keys': dict,
+    '_unlink_keys': dict,
+}
+
+
+class Flag:
+    """A status boolean packed into the flags int of a compact object."""
+
+    __slots__ = ('bit',)
+
+    def __init__(self: Flag, bit: int) -> None:
+        self.bit = bit
+
+    def __get__(self: Flag, obj: Any, cls: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return obj._flags & self.bit != 0
+
+    def __set__(self: Flag, obj: Any, value: bool) -> None:
+        if value:
+            obj._flags |= self.bit
+        else:
+            obj._flags &= ~self.bit
+
+
+class LazySlot:
+    """A slot of a compact object which holds a tracking container. The
+    container is created on first access.
+    """
+
+    __slots__ = ('member', 'factory')
+
+    def __init__(self: LazySlot, member: Any,
+                 factory: Callable[[], Any]) -> None:
+        self.member = member
+        self.factory = factory
+
+    def __get__(self: LazySlot, obj: Any, cls: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.member.__get__(obj, cls)
+        except AttributeError:
+            value = self.factory()
+            self.member.__set__(obj, value)
+            return value
+
+    def __set__(self: LazySlot, obj: Any, value: Any) -> None:
+        self.member.__set__(obj, value)
+
+    def __delete__(self: LazySlot, obj: Any) -> None:
+        try:
+            self.member.__delete__(obj)
+        except AttributeError:
+            pass
+
+
+class SlotStore:
+    """A dict like view of the stored values of a compact object. Field
+    values live in slots and other values live in the instance dict.
+    """
+
+    __slots__ = ('obj', 'members')
+
+    def __init__(self: SlotStore, obj: Any) -> None:
+        self.obj = obj
+        self.members: dict[str, Any] = obj.__class__.__slot_members__
+
+    def get(self: SlotStore, name: str, default: Any = None) -> Any:
+        member = self.members.get(name)
+        if member is None:
+            return self.obj.__dict__.get(name, default)
+        try:
+            return member.__get__(self.obj)
+        except AttributeError:
+            return default
+
+    def __setitem__(self: SlotStore, name: str, value: Any) -> None:
+        member = self.members.get(name)
+        if member is None:
+            self.obj.__dict__[name] = value
+        else:
+            member.__set__(self.obj, value)
+
+
+class SlotFieldDescriptor(FieldDescriptor):
+    """The descriptor of a stored field of a compact JSON class. Field values
+    are read from and written to the field's slot.
+    """
+
+    __slots__ = ('member',)
+
+    def __init__(self: SlotFieldDescriptor, name: str, member: Any) -> None:
+        super().__init__(name, False)
+        self.member = member
+
+    def __get__(self: SlotFieldDescriptor, obj: Any,
+                cls: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.member.__get__(obj, cls)
+        except AttributeError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self: SlotFieldDescriptor, obj: JObject, value: Any) -> None:
+        try:
+            setter = self.setters[obj.__class__]
+        except KeyError:
+            setter = self._setter(obj.__class__)
+            self.setters[obj.__class__] = setter
+        setter(obj, self.name, value, SlotStore(obj))
+
+
+def compact_class(cls: type) -> type:
+    """Create the slotted version of a dataclass decorated class.
+
+    Args:
+        cls (type): The dataclass decorated class.
+
+    Returns:
+        type: A slotted class with the same name, bases and namespace.
+    """
+    from .types import Types
+    names: list[str] = []
+    for name, field in cls.__dataclass_fields__.items():
+        types = field.default
+        if isinstance(types, Types):
+            if types.fdef._fstore == FStore.CALCULATED:
+                continue
+        names.append(name)
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    slots = [*names, '_flags', '_operator', '_ograph', '_version',
+             '_valid_at', *LAZY_SLOTS.keys()]
+    if not any('__dict__' in b.__dict__ for b in cls.__mro__[1:]):
+        slots.append('__dict__')
+    namespace['__slots__'] = tuple(slots)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def compactify(cls: type[JObject]) -> None:
+    """Install compact object descriptors and methods onto a slotted JSON
+    class.
+
+    Args:
+        cls (type[JObject]): A slotted class created by `compact_class` with \
+            JSON class methods installed.
+    """
+    members: dict[str, Any] = {}
+    for name in cls.__dataclass_fields__.keys():
+        if isinstance(cls.__dict__.get(name), MemberDescriptorType):
+            members[name] = cls.__dict__[name]
+    cls.__slot_members__ = members
+    for name, bit in FLAGS.items():
+        setattr(cls, name, Flag(bit))
+    for name, factory in LAZY_SLOTS.items():
+        setattr(cls, name, LazySlot(cls.__dict__[name], factory))
+    cls._mark_new = _mark_new
+    cls._mark_unmodified = _mark_unmodified
+    cls._set_initial_status = _set_initial_status
+    cls._data_dict = _data_dict
+    cls.__original_setattr__ = __original_setattr__
+
+
+def install_slot_fdescrs(cls: type[JObject]) -> None:
+    """Install slot field descriptors onto a compact JSON class.
+
+    Args:
+        cls (type[JObject]): The compact JSON class with class definition \
+            assigned.
+    """
+    for name, member in cls.__slot_members__.items():
+        setattr(cls, name, SlotFieldDescriptor(name, member))
+
+
+def _clear_tracking(self: JObject) -> None:
+    del self._modified_fields
+    del self._previous_values
+
+
+def _mark_new(self: JObject) -> None:
+    """Mark the jsonclass object as a new object."""
+    self._version = tick()
+    self._flags = (self._flags | FLAG_NEW) & ~FLAG_MODIFIED
+    _clear_tracking(self)
+
+
+def _mark_unmodified(self: JObject) -> None:
+    """Mark this jsonclass object as an unmodified object."""
+    self._version = tick()
+    self._flags &= ~(FLAG_NEW | FLAG_MODIFIED)
+    _clear_tracking(self)
+
+
+def _set_initial_status(self: JObject) -> None:
+    """Set the initial status of the compact JSON class object."""
+    self._flags = FLAG_NEW
+    self._operator = None
+    self._version = tick()
+    self._valid_at = -1
+
+
+@property
+def _data_dict(self: JObject) -> dict[str, Any]:
+    """A dict which contains public data field items."""
+    retval = {}
+    for name, member in self.__class__.__slot_members__.items():
+        try:
+            retval[name] = member.__get__(self)
+        except AttributeError:
+            pass
+    if self.__dict__:
+        for k, v in self.__dict__.items():
+            if not k.startswith('_'):
+                if k not in self._local_keys:
+                    retval[k] = v
+    return retval
+
+
+def __original_setattr__(self: JObject, name: str, value: Any) -> None:
+    """Set an attribute value without running field setters."""
+    self._version = tick()
+    member = self.__class__.__slot_members__.get(name)
+    if member is not None:
+        member.__set__(self, value)
+    elif name.startswith('_'):
+        object.__setattr__(self, name, value)
+    else:
+        self.__dict__[name] = value
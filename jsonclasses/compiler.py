@@ -0,0 +1,371 @@
+"""This module defines the pipeline compiler. The compiler generates a
+specialized function for a class definition once, with everything that doesn't
+change between calls bound as local values. The generated functions replace
+the generic field loops of the hot object pipelines.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
+from .fdef import FStore, FType, Nullability, ReadRule, WriteRule
+from .snapshot import compile_source
+if TYPE_CHECKING:
+    from .cdef import CDef
+    from .jfield import JField
+    from .ctx import Ctx
+    from .jobject import JObject
+
+
+Transformer = Callable[['Ctx', 'JObject', bool], None]
+Serializer = Callable[['Ctx', 'JObject'], dict[str, Any]]
+StreamSerializer = Callable[['Ctx', 'JObject'],
+                            Iterator[tuple[str, Any, Any, Optional['Ctx']]]]
+
+
+SCALAR_FTYPES = (FType.STR, FType.INT, FType.FLOAT, FType.BOOL)
+
+
+class _Source:
+    """A tiny line based source code builder."""
+
+    def __init__(self: _Source) -> None:
+        self.lines: list[str] = []
+        self.level = 0
+        self.params: dict[str, Any] = {}
+
+    def line(self: _Source, code: str) -> None:
+        self.lines.append('    ' * self.level + code)
+
+    def bind(self: _Source, name: str, value: Any) -> str:
+        self.params[name] = value
+        return name
+
+    def indent(self: _Source) -> None:
+        self.level += 1
+
+    def dedent(self: _Source) -> None:
+        self.level -= 1
+
+    def build(self: _Source, fname: str, args: str, filename: str) -> Callable:
+        params = ', '.join(self.params.keys())
+        head = [f'def __make__({params}):', f'    def {fname}({args}):']
+        body = ['        ' + line for line in self.lines] or ['        pass']
+        tail = [f'    return {fname}']
+        source = '\n'.join(head + body + tail) + '\n'
+        namespace: dict[str, Any] = {}
+        exec(compile_source(source, filename), namespace)
+        return namespace['__make__'](**self.params)
+
+
+def compile_transform(cdef: CDef) -> Transformer:
+    """Compile the field assigning loop of `InstanceOfModifier.transform` for
+    a class definition.
+
+    The generated function takes the transforming context, the destination
+    object and whether soft apply mode is on. Field names, JSON names, write
+    rules, default values and modifier chains are bound as local values of the
+    generated function.
+
+    Args:
+        cdef (CDef): The class definition to compile transformer for.
+
+    Returns:
+        Transformer: The compiled transformer.
+    """
+    from .types import Types
+    cdef._resolve_ref_types_if_needed()
+    src = _Source()
+    src.bind('Types', Types)
+    src.line('val = ctx.val')
+    src.line('fill = ctx.ctxcfg.fill_dest_blanks')
+    nonnull_ref_lists: list[int] = []
+    for i, field in enumerate(cdef.fields):
+        fdef = field.fdef
+        calculated = fdef.fstore == FStore.CALCULATED
+        name = src.bind(f'n{i}', field.name)
+        jname = src.bind(f'j{i}', field.json_name)
+        fd = src.bind(f'f{i}', fdef)
+        md = src.bind(f'm{i}', field.types.modifier)
+        src.line(f'# {field.name}')
+        if field.json_name == field.name:
+            src.line(f'if {name} in val:')
+        else:
+            src.line(f'if {jname} in val or {name} in val:')
+        src.indent()
+        if field.json_name == field.name:
+            src.line(f'fv = val.get({name})')
+        else:
+            src.line(f'fv = val.get({jname})')
+            src.line('if fv is None:')
+            src.line(f'    fv = val.get({name})')
+        write_rule = fdef.write_rule
+        if write_rule == WriteRule.NO_WRITE:
+            allow = 'False'
+        elif write_rule == WriteRule.WRITE_ONCE:
+            src.line(f'cfv = getattr(dest, {name})')
+            allow = '(cfv is None) or isinstance(cfv, Types)'
+        elif write_rule == WriteRule.WRITE_NONNULL:
+            allow = 'fv is not None'
+        else:
+            allow = 'True'
+        if allow != 'True':
+            src.line(f'if not ({allow}):')
+            src.indent()
+            if not calculated:
+                src.line('if fill:')
+                src.indent()
+                _fill_default(src, i, field)
+                src.dedent()
+            src.line('pass')
+            src.dedent()
+        if allow != 'False':
+            if allow != 'True':
+                src.line('else:')
+                src.indent()
+            bulk = field.types.modifier.bulk_transformer
+            if calculated and not has_transform_hook(field):
+                src.line('pass')
+            elif calculated or bulk is None:
+                src.line(f'fctx = ctx.nextvo(fv, {name}, {fd}, dest)')
+                src.line(f'tsfmd = {md}.transform(fctx)')
+                if not calculated:
+                    src.line(f'setattr(dest, {name}, tsfmd)')
+            elif not has_transform_hook(field):
+                src.line(f'setattr(dest, {name}, fv)')
+            else:
+                # the chain transforms values without the context, the
+                # context is only built to report an invalid value
+                b = src.bind(f'b{i}', bulk)
+                src.line('try:')
+                src.line(f'    tsfmd = {b}(fv)')
+                src.line('except ValueError:')
+                src.line(f'    fctx = ctx.nextvo(fv, {name}, {fd}, dest)')
+                src.line(f'    tsfmd = {md}.transform(fctx)')
+                src.line(f'setattr(dest, {name}, tsfmd)')
+            if allow != 'True':
+                src.dedent()
+        src.dedent()
+        src.line('else:')
+        src.indent()
+        if fdef.is_ref:
+            if fdef.ftype == FType.LIST:
+                if fdef.collection_nullability == Nullability.NONNULL:
+                    nonnull_ref_lists.append(i)
+                    src.line(f'z{i} = True')
+            if fdef.fstore == FStore.LOCAL_KEY:
+                refname = cdef.jconf.ref_name_strategy(field)
+                crefname = cdef.ntable.encode(refname)
+                rn = src.bind(f'r{i}', refname)
+                crn = src.bind(f'c{i}', crefname)
+                src.line(f'if val.get({rn}) is not None:')
+                src.line(f'    setattr(dest, {rn}, val.get({rn}))')
+                src.line(f'if val.get({crn}) is not None:')
+                src.line(f'    setattr(dest, {rn}, val.get({crn}))')
+            src.line('pass')
+        elif not calculated:
+            src.line('if fill and not soft_apply_mode:')
+            src.indent()
+            _fill_default(src, i, field)
+            src.dedent()
+        else:
+            src.line('pass')
+        src.dedent()
+    for i in nonnull_ref_lists:
+        src.lines.insert(2, f'z{i} = False')
+        src.line(f'if z{i} and getattr(dest, n{i}) is None:')
+        src.line(f'    setattr(dest, n{i}, [])')
+    return src.build(f'transform_{cdef.name}', 'ctx, dest, soft_apply_mode',
+                     f'<jsonclasses transform {cdef.name}>')
+
+
+def _fill_default(src: _Source, i: int, field: JField) -> None:
+    bulk = field.types.modifier.bulk_transformer
+    if field.default is not None:
+        dv = src.bind(f'd{i}', field.default)
+        src.line(f'setattr(dest, n{i}, {dv})')
+    elif bulk is None:
+        src.line(f'dctx = ctx.default(ctx.original, n{i}, f{i})')
+        src.line(f'setattr(dest, n{i}, m{i}.transform(dctx))')
+    elif not has_transform_hook(field):
+        src.line(f'setattr(dest, n{i}, None)')
+    else:
+        b = src.bind(f'b{i}', bulk)
+        src.line('try:')
+        src.line(f'    dv = {b}(None)')
+        src.line('except ValueError:')
+        src.line(f'    dctx = ctx.default(ctx.original, n{i}, f{i})')
+        src.line(f'    dv = m{i}.transform(dctx)')
+        src.line(f'setattr(dest, n{i}, dv)')
+
+
+def has_transform_hook(field: JField) -> bool:
+    """Check whether any modifier in the field's chain transforms values.
+
+    Args:
+        field (JField): The field to check.
+
+    Returns:
+        bool: True if the field value needs to go through the chain.
+    """
+    modifier = field.types.modifier
+    return len(modifier._ttvs) > 0 or len(modifier._ntvs) > 0
+
+
+def has_tojson_hook(field: JField) -> bool:
+    """Check whether any modifier in the field's chain overrides `tojson`.
+
+    Args:
+        field (JField): The field to check.
+
+    Returns:
+        bool: True if the field value needs to go through the chain.
+    """
+    return len(field.types.modifier._jvs) > 0
+
+
+def compile_tojson(cdef: CDef) -> Serializer:
+    """Compile the field loop of `InstanceOfModifier.tojson` for a class
+    definition.
+
+    The generated function takes the serializing context and the object to
+    serialize. Key names, reference names, read rules, foreign field checks and
+    partial picks checks are figured out when compiling. Scalar fields without
+    any tojson hook in their chains output their values directly.
+
+    Args:
+        cdef (CDef): The class definition to compile serializer for.
+
+    Returns:
+        Serializer: The compiled serializer.
+    """
+    return _compile_tojson(cdef, False)
+
+
+def compile_iter_tojson(cdef: CDef) -> StreamSerializer:
+    """Compile the field loop of `InstanceOfModifier.tojson` for a class
+    definition into a generator which streams the fields.
+
+    The generated generator takes the serializing context and the object to
+    serialize. It yields the JSON key, the value, the chain and the context of
+    each output field in the order of `compile_tojson`. The value of a field
+    whose chain streams its output, like a list or an object, is yielded with
+    its chain and its context, and isn't converted. Other values are yielded
+    converted, with None as the chain and the context.
+
+    Args:
+        cdef (CDef): The class definition to compile serializer for.
+
+    Returns:
+        StreamSerializer: The compiled streaming serializer.
+    """
+    return _compile_tojson(cdef, True)
+
+
+def _compile_tojson(cdef: CDef, stream: bool) -> Callable:
+    cdef._resolve_ref_types_if_needed()
+    src = _Source()
+    src.bind('cn', cdef.name)
+    src.bind('default_output_null', cdef.jconf.output_null)
+    if stream:
+        # a class without output fields still makes a generator
+        src.line('yield from ()')
+    else:
+        src.line('retval = {}')
+    src.line('ctxcfg = ctx.ctxcfg')
+    src.line('rr = ctxcfg.reverse_relationship')
+    src.line('ignore_writeonly = ctxcfg.ignore_writeonly')
+    src.line('output_null = ctxcfg.output_null')
+    src.line('if output_null is None:')
+    src.line('    output_null = default_output_null')
+    src.line('no_key_refs = cn in ctx.idchain')
+    src.line('partial = val._is_partial')
+    src.line('picks = val._partial_picks if partial else None')
+    for i, field in enumerate(cdef.fields):
+        fdef = field.fdef
+        fstore = fdef.fstore
+        if fstore == FStore.TEMP:
+            continue
+        name = src.bind(f'n{i}', field.name)
+        src.line(f'# {field.name}')
+        is_ref = fstore in (FStore.LOCAL_KEY, FStore.FOREIGN_KEY)
+        ffield = field.foreign_field if is_ref else None
+        if ffield is not None:
+            ffd = src.bind(f'ff{i}', ffield.fdef)
+            ffn = src.bind(f'fn{i}', ffield.name)
+            src.line('isrf = False')
+            src.line('if not rr:')
+            src.line(f'    isrf = {ffd} is ctx.fdef')
+            src.line('    if not isrf:')
+            src.line('        kp = ctx.kp')
+            src.line('        if kp is not None and kp.depth > 1:')
+            src.line(f'            isrf = {ffn} == kp.parent.key')
+            skip = 'isrf or no_key_refs'
+        else:
+            skip = 'no_key_refs'
+        if fstore == FStore.LOCAL_KEY:
+            rk = cdef.jconf.ref_name_strategy(field)
+            rn = src.bind(f'r{i}', rk)
+            jrn = src.bind(f'c{i}', cdef.ntable.encode(rk))
+            src.line(f'if not partial or {name} in picks:')
+            src.indent()
+            src.line(f'valatk = getattr(val, {rn})')
+            src.line('if output_null or (valatk is not None):')
+            _output(src, jrn, 'valatk', stream)
+            src.line(f'if not ({skip}):')
+            src.indent()
+            _output_field(src, i, field, False, stream)
+            src.dedent()
+            src.dedent()
+        elif fstore == FStore.FOREIGN_KEY:
+            src.line(f'if not ({skip}):')
+            src.indent()
+            _output_field(src, i, field, True, stream)
+            src.dedent()
+        else:
+            _output_field(src, i, field, True, stream)
+    if stream:
+        return src.build(f'iter_tojson_{cdef.name}', 'ctx, val',
+                         f'<jsonclasses iter_tojson {cdef.name}>')
+    src.line('return retval')
+    return src.build(f'tojson_{cdef.name}', 'ctx, val',
+                     f'<jsonclasses tojson {cdef.name}>')
+
+
+def _output(src: _Source, jname: str, value: str, stream: bool) -> None:
+    if stream:
+        src.line(f'    yield {jname}, {value}, None, None')
+    else:
+        src.line(f'    retval[{jname}] = {value}')
+
+
+def _output_field(src: _Source, i: int, field: JField, pick: bool,
+                  stream: bool) -> None:
+    fdef = field.fdef
+    levels = 0
+    if fdef.read_rule == ReadRule.NO_READ:
+        src.line('if ignore_writeonly:')
+        src.indent()
+        levels += 1
+    if pick:
+        src.line(f'if not partial or n{i} in picks:')
+        src.indent()
+        levels += 1
+    jname = src.bind(f'j{i}', field.json_name)
+    src.line(f'fval = getattr(val, n{i})')
+    if fdef.ftype in SCALAR_FTYPES and not has_tojson_hook(field):
+        src.line('fv = fval')
+    else:
+        fd = src.bind(f'f{i}', fdef)
+        md = src.bind(f'm{i}', field.types.modifier)
+        nexter = 'nextoc' if fdef.ftype == FType.INSTANCE else 'nextvc'
+        fctx = f'ctx.{nexter}(fval, n{i}, {fd}, cn)'
+        if stream and field.types.modifier.stream_tojson is not None:
+            # the chain outputs None for None
+            src.line('if output_null or (fval is not None):')
+            src.line(f'    yield {jname}, fval, {md}, {fctx}')
+            for _ in range(levels):
+                src.dedent()
+            return
+        src.line(f'fv = {md}.tojson({fctx})')
+    src.line('if output_null or (fv is not None):')
+    _output(src, jname, 'fv', stream)
+    for _ in range(levels):
+        src.dedent()
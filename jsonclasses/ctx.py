@@ -2,7 +2,6 @@
 from __future__ import annotations
 from typing import Any, NamedTuple, Optional, cast, TYPE_CHECKING
 from .jconf import JConf
-from .types import types
 from .mgraph import MGraph
 from .excs import ValidationException
 if TYPE_CHECKING:
@@ -34,6 +33,50 @@ class CtxCfg(NamedTuple):
     """On tojson, whether output null value instead of unexisting field.
     """
 
+class CtxKey:
+    """A key in a context keypath. Each key links to the key of the context it
+    descends from, thus descending into a field or an item costs a single
+    small object. Keypath lists are only built when they are read.
+    """
+
+    __slots__ = ('parent', 'key', 'owner', 'depth')
+
+    def __init__(self: CtxKey, parent: Optional[CtxKey], key: str | int,
+                 owner: Optional[JObject]) -> None:
+        self.parent = parent
+        self.key = key
+        self.owner = owner
+        """The owner whose output key strategy encodes this key. This is None
+        for collection keys, which are output as is.
+        """
+        self.depth: int = 1 if parent is None else parent.depth + 1
+
+    @property
+    def jkey(self: CtxKey) -> str | int:
+        """The key encoded with the owner's output key strategy."""
+        if self.owner is None:
+            return self.key
+        return self.owner.__class__.cdef.ntable.encode(self.key)
+
+
+def _keys(kp: Optional[CtxKey], start: int) -> list[str | int]:
+    retval: list[str | int] = []
+    while kp is not None and kp.depth > start:
+        retval.append(kp.key)
+        kp = kp.parent
+    retval.reverse()
+    return retval
+
+
+def _jkeys(kp: Optional[CtxKey], start: int) -> list[str | int]:
+    retval: list[str | int] = []
+    while kp is not None and kp.depth > start:
+        retval.append(kp.jkey)
+        kp = kp.parent
+    retval.reverse()
+    return retval
+
+
 class Ctx(NamedTuple):
     root: JObject
     owner: JObject
@@ -42,14 +85,16 @@ class Ctx(NamedTuple):
     val: Any
     original: Any
     ctxcfg: CtxCfg
-    keypathr: list[str | int]
-    fkeypathr: list[str | int]
-    keypatho: list[str | int]
-    fkeypatho: list[str | int]
-    keypathp: list[str | int]
-    fkeypathp: list[str | int]
-    keypathh: list[str | int]
-    fkeypathh: list[str | int]
+    kp: Optional[CtxKey]
+    """The last key of the keypath from root. Keypaths relative to the owner,
+    the parent and the holder are suffixes of this keypath.
+    """
+    odepth: int
+    """The depth at which the keypath relative to the owner starts."""
+    pdepth: int
+    """The depth at which the keypath relative to the parent starts."""
+    hdepth: int
+    """The depth at which the keypath relative to the holder starts."""
     fdef: FDef
     operator: Any
     mgraph: MGraph = MGraph()
@@ -84,6 +129,38 @@ class Ctx(NamedTuple):
     def iscreate(self: Ctx) -> bool:
         return self.original is None
 
+    @property
+    def keypathr(self: Ctx) -> list[str | int]:
+        return _keys(self.kp, 0)
+
+    @property
+    def keypatho(self: Ctx) -> list[str | int]:
+        return _keys(self.kp, self.odepth)
+
+    @property
+    def keypathp(self: Ctx) -> list[str | int]:
+        return _keys(self.kp, self.pdepth)
+
+    @property
+    def keypathh(self: Ctx) -> list[str | int]:
+        return _keys(self.kp, self.hdepth)
+
+    @property
+    def fkeypathr(self: Ctx) -> list[str | int]:
+        return _jkeys(self.kp, 0)
+
+    @property
+    def fkeypatho(self: Ctx) -> list[str | int]:
+        return _jkeys(self.kp, self.odepth)
+
+    @property
+    def fkeypathp(self: Ctx) -> list[str | int]:
+        return _jkeys(self.kp, self.pdepth)
+
+    @property
+    def fkeypathh(self: Ctx) -> list[str | int]:
+        return _jkeys(self.kp, self.hdepth)
+
     @property
     def skeypathr(self: Ctx) -> str:
         return '.'.join([str(k) for k in self.keypathr])
@@ -118,27 +195,22 @@ class Ctx(NamedTuple):
 
     @classmethod
     def rootctx(cls: type[Ctx], root: JObject, ctxcfg: CtxCfg,
-                value: Any = None) -> Ctx:
-        fdef = types.objof(root.__class__).fdef
-        fdef._cdef = root.__class__.cdef
+                value: Any = None, mgraph: Optional[MGraph] = None) -> Ctx:
+        fdef = root.__class__.cdef.root_fdef
         return Ctx(root=root, owner=root, parent=root, holder=None,
                    val=value if value is not None else root,
-                   original=root, ctxcfg=ctxcfg, keypatho=[], fkeypatho=[],
-                   keypathr=[], fkeypathr=[], keypathp=[], fkeypathp=[],
-                   keypathh=[], fkeypathh=[], fdef=fdef,
-                   operator=root._operator, mgraph=MGraph(), idchain=[])
+                   original=root, ctxcfg=ctxcfg, kp=None,
+                   odepth=0, pdepth=0, hdepth=0, fdef=fdef,
+                   operator=root._operator,
+                   mgraph=mgraph if mgraph is not None else MGraph(),
+                   idchain=[])
 
     @classmethod
     def rootctxp(cls: type[Ctx], root: JObject, key: str, val: Any, passin: Any) -> Ctx:
-        fdef = types.objof(root.__class__).fdef
-        fdef._cdef = root.__class__.cdef
-        ekey = root.__class__.cdef.jconf.output_key_strategy(key)
+        fdef = root.__class__.cdef.root_fdef
         return Ctx(root=root, owner=root, parent=root, holder=None, val=val,
                    original=root, ctxcfg=CtxCfg(),
-                   keypatho=[key], fkeypatho=[ekey],
-                   keypathr=[key], fkeypathr=[ekey],
-                   keypathp=[key], fkeypathp=[ekey],
-                   keypathh=[key], fkeypathh=[ekey],
+                   kp=CtxKey(None, key, root), odepth=0, pdepth=0, hdepth=0,
                    fdef=fdef,
                    operator=root._operator, mgraph=MGraph(), idchain=[],
                    passin=passin)
@@ -146,132 +218,84 @@ class Ctx(NamedTuple):
     def alterfdef(self: Ctx, fdef: FDef) -> Ctx:
         return Ctx(root=self.root, owner=self.owner, parent=self.parent, holder=self.holder,
                    val=self.val,
-                   original=self.original, ctxcfg=self.ctxcfg, keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr, keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh, fdef=fdef,
+                   original=self.original, ctxcfg=self.ctxcfg, kp=self.kp,
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
+                   fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph, idchain=self.idchain)
 
     def nval(self: Ctx, newval: Any) -> Ctx:
         return Ctx(root=self.root, owner=self.owner, parent=self.parent,
                    holder=self.holder, val=newval, original=self.original,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=self.keypatho, fkeypatho=self.fkeypatho,
-                   keypathr=self.keypathr, fkeypathr=self.fkeypathr,
-                   keypathp=self.keypathp, fkeypathp=self.fkeypathp,
-                   keypathh=self.keypathh, fkeypathh=self.fkeypathh,
+                   ctxcfg=self.ctxcfg, kp=self.kp,
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
                    fdef=self.fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=self.idchain, passin=self.passin)
 
     def nextv(self: Ctx, val: Any, key: str | int, fdef: FDef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
         return Ctx(root=self.root, owner=self.owner, parent=self.parent,
                    holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
+                   ctxcfg=self.ctxcfg, kp=CtxKey(self.kp, key, self.owner),
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
                    fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=self.idchain, passin=self.passin)
 
     def nexto(self: Ctx, val: Any, key: str | int, fdef: FDef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
+        kp = CtxKey(self.kp, key, self.owner)
         return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg, keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[], fkeypathp=[],
-                   keypathh=[key], fkeypathh=[ekey], fdef=fdef,
+                   val=val, original=None, ctxcfg=self.ctxcfg, kp=kp,
+                   odepth=kp.depth, pdepth=kp.depth, hdepth=kp.depth - 1,
+                   fdef=fdef,
                    operator=self.operator,
                    mgraph=self.mgraph, idchain=self.idchain,
                    passin=self.passin)
 
     def nextvc(self: Ctx, val: Any, key: str | int, fdef: FDef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
         return Ctx(root=self.root, owner=self.owner, parent=self.parent,
                    holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
+                   ctxcfg=self.ctxcfg, kp=CtxKey(self.kp, key, self.owner),
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
                    fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=[*self.idchain, c], passin=self.passin)
 
     def nextoc(self: Ctx, val: Any, key: str | int, fdef: FDef, c: str) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
+        kp = CtxKey(self.kp, key, self.owner)
         return Ctx(root=self.root, owner=val, parent=val, holder=self.owner,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[],
-                   fkeypatho=[],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[],
-                   fkeypathp=[],
-                   keypathh=[key],
-                   fkeypathh=[ekey],
+                   val=val, original=None, ctxcfg=self.ctxcfg, kp=kp,
+                   odepth=kp.depth, pdepth=kp.depth, hdepth=kp.depth - 1,
                    fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=[*self.idchain, c], passin=self.passin)
 
     def nextvo(self: Ctx, val: Any, key: str | int, fdef: FDef, o: JObject) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
         return Ctx(root=self.root, owner=o, parent=self.parent,
                    holder=self.holder, val=val, original=None,
-                   ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, ekey],
+                   ctxcfg=self.ctxcfg, kp=CtxKey(self.kp, key, self.owner),
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
                    fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=self.idchain, passin=self.passin)
 
     def colval(self: Ctx, val: Any, key: str | int, fdef: FDef, p: Any) -> Ctx:
+        kp = CtxKey(self.kp, key, None)
         return Ctx(root=self.root, owner=self.owner, parent=p,
                    holder=self.holder,
-                   val=val, original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, key],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, key],
-                   keypathp=[key],
-                   fkeypathp=[*self.fkeypathp, key],
-                   keypathh=[*self.keypathh, key],
-                   fkeypathh=[*self.fkeypathh, key],
+                   val=val, original=None, ctxcfg=self.ctxcfg, kp=kp,
+                   odepth=self.odepth, pdepth=kp.depth - 1,
+                   hdepth=self.hdepth,
                    fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=self.idchain, passin=self.passin)
 
     def default(self: Ctx, owner: JObject, key: str | int, fdef: FDef) -> Ctx:
-        ekey = self.owner.__class__.cdef.jconf.output_key_strategy(key)
         return Ctx(root=self.root, owner=owner, parent=owner,
                    holder=self.holder, val=None,
                    original=None, ctxcfg=self.ctxcfg,
-                   keypatho=[*self.keypatho, key],
-                   fkeypatho=[*self.fkeypatho, ekey],
-                   keypathr=[*self.keypathr, key],
-                   fkeypathr=[*self.fkeypathr, ekey],
-                   keypathp=[*self.keypathp, key],
-                   fkeypathp=[*self.fkeypathp, ekey],
-                   keypathh=[*self.keypathh, key], fdef=fdef,
-                   fkeypathh=[*self.fkeypathh, ekey],
+                   kp=CtxKey(self.kp, key, self.owner),
+                   odepth=self.odepth, pdepth=self.pdepth, hdepth=self.hdepth,
+                   fdef=fdef,
                    operator=self.operator, mgraph=self.mgraph,
                    idchain=self.idchain, passin=self.passin)
 
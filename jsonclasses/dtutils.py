@@ -0,0 +1,102 @@
+"""This module defines the parsers and formatters of the ISO 8601 date and
+datetime strings which jsonclasses accepts and outputs. Datetime strings are
+output with millisecond precision, like '2021-10-16T13:43:28.099Z'. UTC
+datetimes end with 'Z' and datetimes in other time zones end with their
+offsets. Timezone objects of offsets are cached.
+"""
+from __future__ import annotations
+from datetime import date, datetime, timedelta, timezone
+
+
+UTC = timezone.utc
+
+
+_tzs: dict[timedelta, timezone] = {timedelta(0): UTC}
+
+
+def tzof(offset: timedelta) -> timezone:
+    """Get the cached timezone of an UTC offset.
+
+    Args:
+        offset (timedelta): The UTC offset.
+
+    Returns:
+        timezone: The timezone with the offset.
+    """
+    tz = _tzs.get(offset)
+    if tz is None:
+        tz = timezone(offset)
+        _tzs[offset] = tz
+    return tz
+
+
+def parse_datetime(s: str) -> datetime:
+    """Parse an ISO 8601 date or datetime string. A string which ends with
+    'Z' or doesn't have an offset is in UTC. A string with an offset keeps
+    its offset.
+
+    Args:
+        s (str): The string to parse.
+
+    Returns:
+        datetime: The timezone aware datetime.
+
+    Raises:
+        ValueError: If the string is not in ISO 8601 format.
+    """
+    if s.endswith('Z'):
+        dt = datetime.fromisoformat(s[:-1])
+        if dt.tzinfo is not None:
+            raise ValueError(f'Invalid isoformat string: {s!r}')
+        return dt.replace(tzinfo=UTC)
+    dt = datetime.fromisoformat(s)
+    offset = dt.utcoffset()
+    if offset is None:
+        return dt.replace(tzinfo=UTC)
+    tz = tzof(offset)
+    return dt if dt.tzinfo is tz else dt.replace(tzinfo=tz)
+
+
+def parse_date(s: str) -> date:
+    """Parse the date of an ISO 8601 date or datetime string.
+
+    Args:
+        s (str): The string to parse.
+
+    Returns:
+        date: The date.
+
+    Raises:
+        ValueError: If the string doesn't start with an ISO 8601 date.
+    """
+    return date.fromisoformat(s[:10])
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format a datetime into an ISO 8601 string with millisecond precision.
+    Naive datetimes are treated as UTC.
+
+    Args:
+        dt (datetime): The datetime to format.
+
+    Returns:
+        str: The ISO 8601 string.
+    """
+    s = dt.isoformat(timespec='milliseconds')
+    if len(s) == 23:
+        return s + 'Z'
+    if s.endswith('+00:00'):
+        return s[:23] + 'Z'
+    return s
+
+
+def format_date(d: date) -> str:
+    """Format a date into an ISO 8601 datetime string at midnight UTC.
+
+    Args:
+        d (date): The date to format.
+
+    Returns:
+        str: The ISO 8601 string.
+    """
+    return d.isoformat() + 'T00:00:00.000Z'
@@ -1,8 +1,9 @@
 """
 This module contains `JSONEncoder`, the encoder class for Python `json` module
-that encodes JSON Classes objects.
+that encodes JSON Classes objects. It also contains encoding functions which
+stream large amounts of JSON Classes objects field by field.
 """
-from typing import Any
+from typing import Any, Iterable, Iterator, Optional, TextIO
 from json.encoder import JSONEncoder as PythonDefaultJSONEncoder
 
 
@@ -19,3 +20,114 @@ class JSONEncoder(PythonDefaultJSONEncoder):
     def default(self, o: Any):
         return o.tojson() if hasattr(o.__class__, '__is_jsonclass__') \
             else super().default(o)
+
+
+def _iterencode(encoder: JSONEncoder, o: Any, ignore_writeonly: bool,
+                reverse_relationship: bool,
+                output_null: Optional[bool]) -> Iterator[str]:
+    if not hasattr(o.__class__, '__is_jsonclass__'):
+        yield from encoder.iterencode(o)
+        return
+    from .ctx import Ctx, CtxCfg
+    o._can_read_check()
+    ctxcfg = CtxCfg(ignore_writeonly=ignore_writeonly,
+                    reverse_relationship=reverse_relationship,
+                    output_null=output_null)
+    ctx = Ctx.rootctx(o, ctxcfg)
+    yield from _iterencode_items(encoder, o.__class__.cdef.root_modifier
+                                 .iter_tojson(ctx), False)
+
+
+def _iterencode_value(encoder: JSONEncoder, value: Any, modifier: Any,
+                      ctx: Any) -> Iterator[str]:
+    if modifier is None:
+        yield from encoder.iterencode(value)
+        return
+    stream = modifier.stream_tojson
+    items = stream.iter_tojson(ctx) if stream is not None else None
+    if items is None:
+        yield from encoder.iterencode(modifier.tojson(ctx))
+        return
+    from .fdef import FType
+    yield from _iterencode_items(encoder, items,
+                                 ctx.fdef.ftype == FType.LIST)
+
+
+def _iterencode_items(encoder: JSONEncoder, items: Iterator[tuple],
+                      is_list: bool) -> Iterator[str]:
+    yield '[' if is_list else '{'
+    sep = ''
+    for key, value, modifier, ctx in items:
+        if is_list:
+            yield sep
+        else:
+            yield sep + encoder.encode(str(key)) + ': '
+        sep = ', '
+        yield from _iterencode_value(encoder, value, modifier, ctx)
+    yield ']' if is_list else '}'
+
+
+def iter_tojson(objs: Iterable[Any],
+                ignore_writeonly: bool = False,
+                reverse_relationship: bool = False,
+                output_null: Optional[bool] = None) -> Iterator[str]:
+    """Encode objects into a JSON array and yield the JSON text chunk by
+    chunk. Fields are streamed straight from the compiled field walk of each
+    class, and lists, dicts and objects which are held by fields are streamed
+    item by item without building their JSON values, thus memory stays
+    bounded no matter how many objects `objs` yields or how long the held
+    lists are.
+
+    Args:
+        objs (Iterable[Any]): The objects to encode.
+        ignore_writeonly (bool): Whether ignore writeonly marks on fields.
+        reverse_relationship (bool): Whether including reverse relationship \
+            in json outputs.
+        output_null (bool): Whether output null instead of leaving unexisting \
+            fields for null values.
+
+    Returns:
+        Iterator[str]: The JSON text chunks.
+    """
+    encoder = JSONEncoder()
+    yield '['
+    first = True
+    for o in objs:
+        if not first:
+            yield ', '
+        first = False
+        yield from _iterencode(encoder, o, ignore_writeonly,
+                               reverse_relationship, output_null)
+    yield ']'
+
+
+def dump_ndjson(objs: Iterable[Any],
+                fp: TextIO,
+                ignore_writeonly: bool = False,
+                reverse_relationship: bool = False,
+                output_null: Optional[bool] = None) -> int:
+    """Write objects into a file-like object as newline delimited JSON, one
+    object a line. Objects are streamed into the file like `iter_tojson`
+    streams them.
+
+    Args:
+        objs (Iterable[Any]): The objects to write.
+        fp (TextIO): The file-like object to write to.
+        ignore_writeonly (bool): Whether ignore writeonly marks on fields.
+        reverse_relationship (bool): Whether including reverse relationship \
+            in json outputs.
+        output_null (bool): Whether output null instead of leaving unexisting \
+            fields for null values.
+
+    Returns:
+        int: The number of written objects.
+    """
+    encoder = JSONEncoder()
+    count = 0
+    for o in objs:
+        for chunk in _iterencode(encoder, o, ignore_writeonly,
+                                 reverse_relationship, output_null):
+            fp.write(chunk)
+        fp.write('\n')
+        count += 1
+    return count
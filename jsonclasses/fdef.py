@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import cast, Any, Callable, Optional, TYPE_CHECKING
 from enum import Enum, Flag
+from operator import attrgetter
 from .rtypes import rnamedtypes, rtypes
 from .isjsonclass import isjsonclass
 from .jobject import JObject
@@ -145,6 +146,8 @@ class FDef:
         self._enum_input: Optional[EnumInput] = None
         self._enum_output: Optional[EnumOutput] = None
         self._raw_union_types: Optional[list[Types]] = None
+        self._union_discriminator: Optional[str] = None
+        self._union_dispatch: Optional[Any] = None
         self._raw_item_types: Optional[Any] = None
         self._raw_inst_types: Optional[str | type[JObject]] = None
         self._resolved_union_types: Optional[list[Types]] = None
@@ -169,6 +172,9 @@ class FDef:
         self._operator_assign_transformer: Optional[Callable] = None
         self._queryability: Optional[Queryability] = None
         self._copy_behavior: Optional[CopyBehavior] = None
+        self._packed: bool = False
+        self._salted: bool = False
+        self._checkpw_against: Optional[Types] = None
         self._auth_identity: bool = False
         self._auth_by: bool = False
         self._auth_by_checker: Optional[Types] = None
@@ -325,6 +331,30 @@ class FDef:
         self._resolve_if_needed()
         return self._raw_union_types
 
+    @property
+    def union_types(self: FDef) -> Optional[list[Types]]:
+        """The types of this union field with type names resolved.
+        """
+        self._resolve_if_needed()
+        if self._raw_union_types is None:
+            return None
+        if self._resolved_union_types is not None:
+            return self._resolved_union_types
+        resolved: list[Types] = []
+        for types in self._raw_union_types:
+            types = rnamedtypes(types, self.cdef.jconf.cgraph, self.cdef.name)
+            resolved.append(types._owned(self.cdef))
+        self._resolved_union_types = resolved
+        return resolved
+
+    @property
+    def union_discriminator(self: FDef) -> Optional[str]:
+        """The key of which value names the instance class of an object
+        input of this union field.
+        """
+        self._resolve_if_needed()
+        return self._union_discriminator
+
     # subtypes
 
     @property
@@ -344,8 +374,8 @@ class FDef:
             return cast(Types, None)
         if self._resolved_item_types is not None:
             return self._resolved_item_types
-        self._resolved_item_types = rtypes(self.raw_item_types)
-        self._resolved_item_types.fdef._cdef = self.cdef
+        self._resolved_item_types = rtypes(self.raw_item_types)._owned(
+            self.cdef)
         self._resolved_item_types = rnamedtypes(
             self._resolved_item_types,
             self.cdef.jconf.cgraph,
@@ -519,6 +549,28 @@ class FDef:
         self._resolve_if_needed()
         return self._copy_behavior or CopyBehavior.COPY
 
+    @property
+    def packed(self: FDef) -> bool:
+        """Whether this list field stores its items in a packed list.
+        """
+        self._resolve_if_needed()
+        return self._packed
+
+    @property
+    def salted(self: FDef) -> bool:
+        """Whether values of this field are hashed with salt.
+        """
+        self._resolve_if_needed()
+        return self._salted
+
+    @property
+    def checkpw_against(self: FDef) -> Optional[Types]:
+        """The types which resolves the password that values of this field
+        are checked against, or None if values are not checked.
+        """
+        self._resolve_if_needed()
+        return self._checkpw_against
+
     @property
     def auth_identity(self: FDef) -> bool:
         """Whether this field is authorization identity.
@@ -572,6 +624,37 @@ class FDef:
             return self.item_types.fdef.has_linked
         return False
 
+    def derive(self: FDef) -> FDef:
+        """Create a field definition which starts with the settings of this
+        field definition. Nested types are shared instead of copied, thus
+        deriving costs only the settings which change. The index name lists
+        are copied since modifiers append to them.
+        """
+        fdef = FDef.__new__(FDef)
+        fdef.__dict__.update(self.__dict__)
+        fdef._cindex_names = [*self._cindex_names]
+        fdef._cunique_names = [*self._cunique_names]
+        return fdef
+
+    def finalize(self: FDef) -> None:
+        """Resolve the nested types, the instance class and the enum class of
+        this field definition ahead of time. Then this field definition uses
+        accessors which don't check resolution.
+        """
+        if isinstance(self, FinalFDef):
+            return
+        self._resolve_if_needed()
+        if self._raw_item_types is not None:
+            self.item_types.fdef.finalize()
+        if self._raw_union_types is not None:
+            for types in self.union_types:
+                types.fdef.finalize()
+        if self._raw_inst_types is not None:
+            self._inst_cls = self.inst_cls
+        if self._raw_enum_class is not None:
+            self._enum_class = self.enum_class
+        self.__class__ = FinalFDef
+
     def _resolve_if_needed(self: FDef) -> None:
         if self._unresolved:
             # resolve
@@ -584,3 +667,38 @@ class FDef:
 
     def __str__(self):
         return '<FDef: ' + str(vars(self)) + '>'
+
+
+class FinalFDef(FDef):
+    """A field definition which is resolved ahead of time. Its accessors read
+    the resolved settings directly. Deriving from it creates a plain field
+    definition.
+    """
+
+    def _resolve_if_needed(self: FinalFDef) -> None:
+        pass
+
+    item_types = property(attrgetter('_resolved_item_types'),
+                          doc=FDef.item_types.__doc__)
+    union_types = property(attrgetter('_resolved_union_types'),
+                           doc=FDef.union_types.__doc__)
+    inst_cls = property(attrgetter('_inst_cls'), doc=FDef.inst_cls.__doc__)
+    enum_class = property(attrgetter('_enum_class'),
+                          doc=FDef.enum_class.__doc__)
+
+
+for _name in ('ftype', 'fsubtype', 'fstore', 'getter', 'setter', 'primary',
+              'index', 'cindex', 'cindex_names', 'unique', 'cunique',
+              'cunique_names', 'required', 'raw_enum_class', 'enum_input',
+              'enum_output', 'raw_union_types', 'union_discriminator',
+              'raw_item_types', 'raw_inst_types', 'force_set_on_save',
+              'foreign_key', 'use_join_table', 'join_table_cls',
+              'join_table_referrer_key', 'join_table_referee_key',
+              'delete_rule', 'read_rule', 'write_rule',
+              'collection_nullability', 'item_nullability', 'strictness',
+              'has_eager_modifier', 'has_reset_modifier',
+              'has_preserialize_modifier', 'requires_operator_assign',
+              'operator_assign_transformer', 'packed', 'salted',
+              'checkpw_against', 'auth_identity', 'auth_by'):
+    setattr(FinalFDef, _name, property(attrgetter('_' + _name),
+                                       doc=getattr(FDef, _name).__doc__))
@@ -0,0 +1,258 @@
+"""This module defines field descriptors. Field descriptors are installed on
+JSON classes when the classes are defined. Reading and writing attributes which
+don't have a descriptor take the default Python attribute access path.
+"""
+from __future__ import annotations
+from typing import Any, Callable, TYPE_CHECKING
+from inspect import getattr_static
+from dataclasses import MISSING
+from .fdef import FStore, FType
+from .ctx import Ctx, CtxCfg
+from .isjsonclass import isjsonobject
+from .outils import to_owned_dict, to_owned_list, to_packed_list
+from .plist import PackedList
+from .vclock import tick
+if TYPE_CHECKING:
+    from .jobject import JObject
+
+
+FSetter = Callable[['JObject', str, Any, Any], None]
+
+
+SCALAR_FTYPES = (FType.STR, FType.INT, FType.FLOAT, FType.BOOL, FType.DATE,
+                 FType.DATETIME, FType.ENUM)
+
+
+PACKED_ITEM_TYPES = {FType.INT: int, FType.FLOAT: float}
+
+
+class CalcFieldDescriptor:
+    """The data descriptor of a calculated field. Reading the field runs the
+    field's getter and writing to the field runs the field's setter.
+    """
+
+    __slots__ = ('name', 'default')
+
+    def __init__(self: CalcFieldDescriptor, name: str, default: Any) -> None:
+        self.name = name
+        self.default = default
+        """The class attribute that the descriptor replaces. This is returned
+        when the descriptor is accessed on the class.
+        """
+
+    def __get__(self: CalcFieldDescriptor, obj: JObject | None,
+                cls: type | None = None) -> Any:
+        if obj is None:
+            return self.default
+        fdef = obj.__class__.cdef.field_named(self.name).fdef
+        if fdef.fstore != FStore.CALCULATED:
+            # a subclass redefines the field as a stored field
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        getter = fdef.getter
+        if callable(getter):
+            return getter(obj)
+        ctx = Ctx.rootctx(obj, CtxCfg(), obj)
+        return getter.modifier.transform(ctx)
+
+    def __set__(self: CalcFieldDescriptor, obj: JObject, value: Any) -> None:
+        fdef = obj.__class__.cdef.field_named(self.name).fdef
+        if fdef.fstore != FStore.CALCULATED:
+            obj.__dict__[self.name] = value
+            return
+        setter = fdef.setter
+        if setter is None:
+            raise Exception('do not set to readonly calculation field')
+        if callable(setter):
+            setter(value, obj)
+        else:
+            ctx = Ctx.rootctxp(obj, self.name, None, value)
+            setter.modifier.transform(ctx)
+
+
+class FieldDescriptor:
+    """The descriptor of a stored field or a local key. It only defines
+    `__set__`, thus reading the field takes the default path and reads from
+    the instance dict. Writing to the field runs the field setter, which is
+    picked for each class on the first write. Setters take the object, the
+    field name, the new value and the mapping where the object stores its
+    values.
+    """
+
+    __slots__ = ('name', 'local_key', 'setters')
+
+    def __init__(self: FieldDescriptor, name: str, local_key: bool) -> None:
+        self.name = name
+        self.local_key = local_key
+        self.setters: dict[type, FSetter] = {}
+
+    def __set__(self: FieldDescriptor, obj: JObject, value: Any) -> None:
+        try:
+            setter = self.setters[obj.__class__]
+        except KeyError:
+            setter = self._setter(obj.__class__)
+            self.setters[obj.__class__] = setter
+        setter(obj, self.name, value, obj.__dict__)
+
+    def _setter(self: FieldDescriptor, cls: type[JObject]) -> FSetter:
+        cdef = cls.cdef
+        cdef._resolve_ref_types_if_needed()
+        if self.local_key:
+            return set_local_key
+        field = cdef.field_named(self.name)
+        fdef = field.fdef
+        if fdef.ftype in SCALAR_FTYPES and not fdef.is_ref:
+            reset = cdef.jconf.reset_all_fields or fdef.has_reset_modifier
+            return set_scalar_with_reset if reset else set_scalar
+        return set_field
+
+
+def _track(obj: JObject, name: str, cur: Any, reset: bool) -> None:
+    obj._version = tick()
+    if not obj._is_new:
+        obj._is_modified = True
+        obj._modified_fields.add(name)
+        if reset and name not in obj._previous_values:
+            obj._previous_values[name] = None if cur is MISSING else cur
+
+
+def set_scalar(obj: JObject, name: str, value: Any, d: Any) -> None:
+    """The setter of embedded scalar fields without reset."""
+    cur = d.get(name, MISSING)
+    if cur is value or (cur is not MISSING and value == cur):
+        return
+    _track(obj, name, cur, False)
+    d[name] = value
+
+
+def set_scalar_with_reset(obj: JObject, name: str, value: Any, d: Any) -> None:
+    """The setter of embedded scalar fields which record previous values."""
+    cur = d.get(name, MISSING)
+    if cur is value or (cur is not MISSING and value == cur):
+        return
+    _track(obj, name, cur, True)
+    d[name] = value
+
+
+def set_field(obj: JObject, name: str, value: Any, d: Any) -> None:
+    """The setter of collection, instance and reference fields. Collections
+    are made owned and references are linked and unlinked.
+    """
+    cdef = obj.__class__.cdef
+    field = cdef.field_named(name)
+    cur = d.get(name, MISSING)
+    if cur is value or (cur is not MISSING and value == cur):
+        return
+    # track modified and previous value
+    _track(obj, name, cur,
+           cdef.jconf.reset_all_fields or field.fdef.has_reset_modifier)
+    # make list and dict assignments owned and monitored
+    if field.fdef.packed and isinstance(value, (list, PackedList)):
+        cls = PACKED_ITEM_TYPES.get(field.fdef.item_types.fdef.ftype)
+        value = to_packed_list(obj, value, name, cls)
+    elif isinstance(value, list):
+        value = to_owned_list(obj, value, name)
+    if isinstance(value, dict):
+        value = to_owned_dict(obj, value, name)
+    if not field.fdef.is_ref:
+        d[name] = value
+        return
+    if cur is not MISSING:
+        obj.__unlink_field__(field, cur)
+    d[name] = value
+    if field.fdef.fstore == FStore.LOCAL_KEY:
+        rname = field.ref_name
+        if field.fdef.ftype == FType.INSTANCE:
+            if value is None:
+                d[rname] = None
+            if isjsonobject(value):
+                d[rname] = value._id
+        elif field.fdef.ftype == FType.LIST:
+            if value is None:
+                d[rname] = to_owned_list(obj, [], rname)
+            else:
+                keys = []
+                for item in value:
+                    if item is not None:
+                        keys.append(item._id)
+                d[rname] = to_owned_list(obj, keys, rname)
+    obj.__link_field__(field, value)
+
+
+def set_local_key(obj: JObject, name: str, value: Any, d: Any) -> None:
+    """The setter of local keys. Changing a local key resets the referenced
+    object or objects of its field.
+    """
+    cur = d.get(name, MISSING)
+    if cur is value or (cur is not MISSING and value == cur):
+        return
+    obj._version = tick()
+    field_name = obj._local_key_map[name]
+    field = obj.__class__.cdef.field_named(field_name)
+    if field.fdef.ftype == FType.INSTANCE:
+        # temporarily set to none if key is modified
+        # in the future, may query object from graph
+        d[name] = value
+        setattr(obj, field_name, None)
+    elif field.fdef.ftype == FType.LIST:
+        d[name] = to_owned_list(obj, value or [], name)
+        if (value is None) or (value is []):
+            setattr(obj, field_name, [])
+        else:
+            new_list = []
+            curvals = getattr(obj, field_name)
+            if curvals is None:
+                curvals = []
+            for item in value:
+                existitem = next((v for v in curvals if v._id == item), None)
+                if existitem is not None:
+                    new_list.append(existitem)
+            setattr(obj, field_name, new_list)
+    if not obj._is_new:
+        obj._is_modified = True
+        obj._modified_fields.add(field_name)
+    d[name] = value
+
+
+def mask_fdescrs(cls: type) -> None:
+    """Hide inherited field descriptors from the dataclass decorator, thus a
+    redefined field without a default value is not given a field descriptor
+    as its default value.
+
+    Args:
+        cls (type): The class to be decorated with the dataclass decorator.
+    """
+    for name in cls.__dict__.get('__annotations__', {}):
+        if name in cls.__dict__:
+            continue
+        if isinstance(getattr_static(cls, name, None), FieldDescriptor):
+            setattr(cls, name, MISSING)
+
+
+def install_fdescrs(cls: type[JObject]) -> None:
+    """Install field descriptors onto a JSON class.
+
+    Args:
+        cls (type[JObject]): The JSON class with class definition assigned.
+    """
+    for field in cls.cdef.fields:
+        if field.types.fdef._fstore == FStore.CALCULATED:
+            default = getattr(cls, field.name, None)
+            descr = CalcFieldDescriptor(field.name, default)
+            setattr(cls, field.name, descr)
+        else:
+            setattr(cls, field.name, FieldDescriptor(field.name, False))
+
+
+def install_local_key_fdescrs(cls: type[JObject], names: list[str]) -> None:
+    """Install field descriptors of local keys onto a JSON class. Local key
+    names are known after reference types are resolved.
+
+    Args:
+        cls (type[JObject]): The JSON class.
+        names (list[str]): The local key names.
+    """
+    for name in names:
+        setattr(cls, name, FieldDescriptor(name, True))
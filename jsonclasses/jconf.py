@@ -43,7 +43,8 @@ class JConf:
                  can_create: CanCreate | list[CanCreate] | Types | None,
                  can_update: CanUpdate | list[CanUpdate] | Types | None,
                  can_delete: CanDelete | list[CanDelete] | Types | None,
-                 can_read: CanRead | list[CanRead] | Types | None) -> None:
+                 can_read: CanRead | list[CanRead] | Types | None,
+                 compact: bool | None = None) -> None:
         """
         Initialize a new configuration object.
 
@@ -80,6 +81,8 @@ class JConf:
                 deletion guard.
             can_read (Optional[Union[CanRead, list[CanRead]]]): The reading
                 guard.
+            compact (Optional[bool]): Whether store objects in slots and
+                allocate tracking containers on first use.
         """
         from .types import Types
         self._cls: type[JObject] | None = None
@@ -92,6 +95,7 @@ class JConf:
         self._abstract = abstract
         self._reset_all_fields = reset_all_fields
         self._output_null = output_null
+        self._compact = compact
         if callable(on_create) or isinstance(on_create, Types):
             self._on_create = [on_create]
         elif isinstance(on_create, list):
@@ -171,6 +175,8 @@ class JConf:
             return False
         if self.can_read != other_config.can_read:
             return False
+        if self.compact != other_config.compact:
+            return False
         return True
 
     @property
@@ -252,6 +258,15 @@ class JConf:
             return self.cgraph.default_config.output_null
         return self._output_null
 
+    @property
+    def compact(self: JConf) -> bool:
+        """Whether store objects in slots and allocate tracking containers on
+        first use.
+        """
+        if self._compact is None:
+            return self.cgraph.default_config.compact
+        return self._compact
+
     @property
     def on_create(self: JConf) -> list[OnCreate | Types]:
         """The object creation callback.
@@ -5,6 +5,7 @@ from __future__ import annotations
 from jsonclasses.jobject import JObject
 from jsonclasses.fdef import FStore, FType
 from typing import Any, Optional, TYPE_CHECKING
+from operator import attrgetter
 if TYPE_CHECKING:
     from .types import Types
     from .fdef import FDef
@@ -31,6 +32,7 @@ class JField:
         self._foreign_fname = None
         self._resolved_foreign_class = False
         self._foreign_class = None
+        self._ref_name: Optional[str] = None
 
     @property
     def cdef(self: JField) -> CDef:
@@ -48,7 +50,7 @@ class JField:
     def json_name(self: JField) -> str:
         """The name of the field when converted into JSON dict.
         """
-        return self.cdef.jconf.output_key_strategy(self._name)
+        return self.cdef.ntable.encode(self._name)
 
     @property
     def default(self: JField) -> Any:
@@ -162,7 +164,24 @@ class JField:
 
     @property
     def ref_name(self) -> str:
-        return self.cdef.jconf.ref_name_strategy(self)
+        """The reference name of this reference field. It's figured out with
+        the reference name strategy on first use.
+        """
+        if self._ref_name is None:
+            self._ref_name = self.cdef.jconf.ref_name_strategy(self)
+        return self._ref_name
+
+    def finalize(self: JField) -> None:
+        """Resolve the field definition and the foreign field of this field
+        ahead of time. Then this field uses accessors which don't check
+        resolution.
+        """
+        if isinstance(self, FinalJField):
+            return
+        self.fdef.finalize()
+        self._foreign_class = self.foreign_class
+        self._foreign_field = self.foreign_field
+        self.__class__ = FinalJField
 
     def _resolve_foreign(self: JField) -> None:
         self._do_resolve_foreign()
@@ -193,3 +212,14 @@ class JField:
             if ffield:
                 self._foreign_field = ffield
                 self._foreign_fname = ffield.name
+
+
+class FinalJField(JField):
+    """A field which is resolved ahead of time. Its accessors read the
+    resolved foreign field directly.
+    """
+
+    foreign_cdef = property(attrgetter('_foreign_cdef'))
+    foreign_fname = property(attrgetter('_foreign_fname'))
+    foreign_field = property(attrgetter('_foreign_field'))
+    foreign_class = property(attrgetter('_foreign_class'))
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from .olist import OwnedList
     from .jfield import JField
     from .types import Types
+    from .mgraph import MGraph
 T = TypeVar('T', bound='JObject')
 
 
@@ -31,6 +32,14 @@ class JObject(Protocol):
         """
         ...
 
+    @classmethod
+    def from_many(cls: type[T], items: list[dict[str, Any]],
+                  validate: bool = False) -> list[T]:
+        """The from_many method initializes objects from a list of dicts in a
+        batch. Objects with the same primary key are shared across the batch.
+        """
+        ...
+
     def set(self: T, **kwargs: dict[str, Any]) -> T:
         """The set method takes keyword arguments to update the field values of
         the object. Invalid fields are filtered. Eager validation are
@@ -38,6 +47,12 @@ class JObject(Protocol):
         """
         ...
 
+    async def aset(self: T, **kwargs: dict[str, Any]) -> T:
+        """The awaitable variant of `set`. Passwords of salted fields are
+        hashed on a thread pool.
+        """
+        ...
+
     def update(self: T, **kwargs: dict[str, Any]) -> T:
         """The update method takes keyword arguments to update the field values
         of the object. Unlike `set`, the `update` method doesn't care about the
@@ -71,6 +86,12 @@ class JObject(Protocol):
         """
         ...
 
+    async def avalidate(self: T, all_fields: Optional[bool]) -> T:
+        """The awaitable variant of `validate`. Passwords of checkpw fields
+        are checked on a thread pool.
+        """
+        ...
+
     @property
     def is_valid(self: T) -> bool: ...
 
@@ -118,9 +139,18 @@ class JObject(Protocol):
 
     def include(self: T, field_name: str) -> T: ...
 
+    def _init(self: T,
+              kwargs: dict[str, Any],
+              mgraph: Optional[MGraph] = None) -> None: ...
+
+    def _init_blank(self: T) -> None: ...
+
+    def _init_graph(self: T) -> None: ...
+
     def _set(self: T,
              kwargs: dict[str, Any],
-             fill_blanks: Optional[bool]) -> None: ...
+             fill_blanks: Optional[bool],
+             mgraph: Optional[MGraph] = None) -> None: ...
 
     def _keypath_set(self: T, kwargs: dict[str, Any]) -> None: ...
 
@@ -199,10 +229,6 @@ class JObject(Protocol):
 
     def __original_setattr__(self: T, name: str, value: Any) -> None: ...
 
-    def __setattr__(self: T, name: str, value: Any) -> None: ...
-
-    def __getattribute__(self: T, name: str) -> None: ...
-
     def __odict_will_change__(self: T, odict: OwnedDict) -> None: ...
 
     def __odict_add__(self, odict: OwnedDict, key: str, val: Any) -> None: ...
@@ -14,6 +14,8 @@ from .jconf import (
 from .jfield import JField
 from .cdef import CDef
 from .jsonclassify import jsonclassify
+from .fdescr import mask_fdescrs, install_fdescrs
+from .compact import compact_class, compactify, install_slot_fdescrs
 from .jobject import JObject
 if TYPE_CHECKING:
     from .types import Types
@@ -46,6 +48,7 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compact: Optional[bool] = None,
 ) -> Callable[[T], T | type[JObject]]: ...
 
 
@@ -69,6 +72,7 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compact: Optional[bool] = None,
 ) -> T | type[JObject]: ...
 
 
@@ -91,6 +95,7 @@ def jsonclass(
     can_update: CanUpdate | list[CanUpdate] | Types | None = None,
     can_delete: CanDelete | list[CanDelete] | Types | None = None,
     can_read: CanRead | list[CanRead] | Types | None = None,
+    compact: Optional[bool] = None,
 ) -> Union[Callable[[T], T | type[JObject]], T | type[JObject]]:
     """The jsonclass object class decorator. To declare a jsonclass class, use
     this syntax:
@@ -122,11 +127,20 @@ def jsonclass(
             can_create=can_create,
             can_update=can_update,
             can_delete=can_delete,
-            can_read=can_read)
+            can_read=can_read,
+            compact=compact)
+        mask_fdescrs(cls)
         dcls: type = dataclass(init=False)(cls)
+        if jconf.compact:
+            dcls = compact_class(dcls)
         jcls = jsonclassify(dcls)
+        if jconf.compact:
+            compactify(jcls)
         cdef = CDef(jcls, jconf)
         jcls.cdef = cdef
+        install_fdescrs(jcls)
+        if jconf.compact:
+            install_slot_fdescrs(jcls)
         jconf.cgraph.put(cdef)
         return jcls
     else:
@@ -149,5 +163,6 @@ def jsonclass(
                 can_create=can_create,
                 can_update=can_update,
                 can_delete=can_delete,
-                can_read=can_read)
+                can_read=can_read,
+                compact=compact)
         return parametered_jsonclass
@@ -1,15 +1,20 @@
 """This module defines the `jsonclassify` function."""
 from __future__ import annotations
 from typing import Any, Callable, Optional, Union, cast
-from inspect import signature, getmro
+from .arity import arity
+from dataclasses import MISSING
 from .jobject import JObject
 from .ctx import Ctx, CtxCfg
 from .fdef import FDef, FStore, FType
 from .types import Types
-from .modifiers.instanceof_modifier import InstanceOfModifier
 from .jfield import JField
 from .isjsonclass import isjsonobject
 from .ograph import OGraph
+from .mgraph import MGraph
+from .vclock import tick, now
+from .pwhash import (
+    acheckpw_many, ahashpw_many, prechecked, prehashed
+)
 from .odict import OwnedDict
 from .olist import OwnedList
 from .outils import (
@@ -35,21 +40,186 @@ def __init__(self: JObject, **kwargs: dict[str, Any]) -> None:
     """
     if self.__class__.cdef.jconf.abstract:
         raise AbstractJSONClassException(self.__class__)
+    self._init(kwargs)
+
+
+def from_many(cls: type[JObject],
+              items: list[dict[str, Any]],
+              validate: bool = False) -> list[JObject]:
+    """Initialize jsonclass objects from a list of dicts in a batch. This
+    method is suitable for accepting query results and webhook batches. All
+    items share a single mark graph, thus objects with the same primary key
+    are initialized once across the batch. An item with the primary key of a
+    previous item updates and returns the previous object. Passwords of
+    salted fields are hashed concurrently before objects are initialized.
+
+    Args:
+        items (list[dict[str, Any]]): The dicts to initialize objects from.
+        validate (bool): Whether validate the initialized objects. Errors of \
+            all items are collected into a single validation exception whose \
+            keypaths start with the item indexes.
+
+    Returns:
+        list[JObject]: The initialized objects in the order of items.
+    """
+    if cls.cdef.jconf.abstract:
+        raise AbstractJSONClassException(cls)
+    with prehashed(_salted_values(cls, items)):
+        return _from_many(cls, items, validate)
+
+
+def _from_many(cls: type[JObject],
+               items: list[dict[str, Any]],
+               validate: bool) -> list[JObject]:
+    cdef = cls.cdef
+    cdef._resolve_ref_names_if_needed()
+    mgraph = MGraph()
+    pfield = cdef.primary_field
+    # the context config, the root field definition and the blank values
+    # are shared by the whole batch
+    ctxcfg = CtxCfg(fill_dest_blanks=True, all_fields=False)
+    fdef = cdef.root_fdef
+    fill = cdef.root_modifier.fill
+    strict = cdef.root_modifier.strictness(fdef, cls)
+    blanks = _blank_values(cls)
+    plain_keys: dict[tuple[str, ...], bool] = {}
+    retval: list[JObject] = []
+    for item in items:
+        keys = tuple(item)
+        plain = plain_keys.get(keys)
+        if plain is None:
+            plain = len(compound_key_args(item)) == 0
+            plain_keys[keys] = plain
+        pvalue = None
+        if pfield is not None:
+            pvalue = item.get(pfield.name)
+            if pvalue is None:
+                pvalue = item.get(pfield.json_name)
+            if pvalue is not None:
+                exist_item = mgraph.getp(cls, pvalue)
+                if exist_item is not None:
+                    exist_item._set(single_key_args(item), mgraph=mgraph)
+                    exist_item._keypath_set(compound_key_args(item))
+                    retval.append(exist_item)
+                    continue
+        obj = cls.__new__(cls)
+        if blanks is None:
+            obj._init_blank()
+        else:
+            _init_blank_values(obj, blanks)
+        # this is `Ctx.rootctx` with positional fields, which is cheaper
+        val = item if plain else single_key_args(item)
+        ctx = Ctx(obj, obj, obj, None, val, obj, ctxcfg, None, 0, 0, 0, fdef,
+                  None, mgraph, [])
+        if pvalue is not None:
+            mgraph.putp(pvalue, obj)
+        fill(ctx, obj, False, strict)
+        if not plain:
+            obj._keypath_set(compound_key_args(item))
+        obj._init_graph()
+        retval.append(obj)
+    if validate:
+        messages: dict[str, str] = {}
+        validated: set[int] = set()
+        for index, obj in enumerate(retval):
+            if id(obj) in validated:
+                continue
+            validated.add(id(obj))
+            try:
+                obj.validate()
+            except ValidationException as e:
+                for keypath, message in e.keypath_messages.items():
+                    messages[concat_keypath(index, keypath)] = message
+        if len(messages) > 0:
+            raise ValidationException(messages, retval)
+    return retval
+
+
+def _init(self: JObject,
+          kwargs: dict[str, Any],
+          mgraph: Optional[MGraph] = None) -> None:
+    """Initialize a jsonclass object internally."""
+    self._init_blank()
+    self._set(single_key_args(kwargs), fill_blanks=True, mgraph=mgraph)
+    self._keypath_set(compound_key_args(kwargs))
+    self._init_graph()
+
+
+def _init_blank(self: JObject) -> None:
+    """Set the initial status and blank field values of a new object."""
     self._set_initial_status()
+    self.__class__.cdef._resolve_ref_names_if_needed()
     for field in self.__class__.cdef.fields:
         if field.fdef.fstore != FStore.CALCULATED:
             setattr(self, field.name, None)
         if field.fdef.fstore == FStore.LOCAL_KEY:
-            transformer = self.__class__.cdef.jconf.ref_name_strategy
-            local_key = transformer(field)
+            local_key = field.ref_name
             if field.fdef.ftype == FType.LIST:
-                setattr(self, local_key, to_owned_list(self, [], local_key))
+                olist = to_owned_list(self, [], local_key)
+                self.__original_setattr__(local_key, olist)
             else:
-                setattr(self, local_key, None)
+                self.__original_setattr__(local_key, None)
             self._local_keys.add(local_key)
             self._local_key_map[local_key] = field.name
-    self._set(single_key_args(kwargs), fill_blanks=True)
-    self._keypath_set(compound_key_args(kwargs))
+
+
+BlankValues = tuple[dict[str, Any], list[str], dict[str, str]]
+
+
+def _blank_values(cls: type[JObject]) -> Optional[BlankValues]:
+    """Figure out the initial status and the blank values of new objects of
+    a class which stores its values in instance dicts. Setting blank values
+    on a new object only records them, thus objects in a batch are blanked
+    by updating their instance dicts. The blank values, the local keys of
+    list references and the local key map are returned. None is returned
+    for compact classes, of which objects are blanked field by field.
+    """
+    if hasattr(cls, '__slot_members__'):
+        return None
+    cdef = cls.cdef
+    blanks: dict[str, Any] = {'_is_new': True, '_is_modified': False,
+                              '_is_partial': False, '_is_deleted': False,
+                              '_operator': None}
+    list_keys: list[str] = []
+    local_key_map: dict[str, str] = {}
+    for field in cdef.fields:
+        if field.fdef.fstore == FStore.CALCULATED:
+            continue
+        blanks[field.name] = None
+        if field.fdef.fstore == FStore.LOCAL_KEY:
+            local_key = field.ref_name
+            local_key_map[local_key] = field.name
+            if field.fdef.ftype == FType.LIST:
+                list_keys.append(local_key)
+            else:
+                blanks[local_key] = None
+    return blanks, list_keys, local_key_map
+
+
+def _init_blank_values(self: JObject, values: BlankValues) -> None:
+    """Set the initial status and the blank values of a new object with the
+    values from `_blank_values`. This matches `_init_blank`."""
+    blanks, list_keys, local_key_map = values
+    d = self.__dict__
+    d.update(blanks)
+    d['_modified_fields'] = set()
+    d['_previous_values'] = {}
+    d['_local_keys'] = set(local_key_map)
+    d['_local_key_map'] = local_key_map.copy()
+    d['_unlinked_objects'] = {}
+    d['_link_keys'] = {}
+    d['_unlink_keys'] = {}
+    for local_key in list_keys:
+        d[local_key] = to_owned_list(self, [], local_key)
+    self._version = tick()
+
+
+def _init_graph(self: JObject) -> None:
+    """Put an initialized object into its object graph."""
+    if getattr(self, '_ograph', None) is None:
+        # the graph is created with this object on first access
+        self._ograph = None
+        return
     try:
         self._graph.put(self)
     except UnlinkableJSONClassException:
@@ -69,12 +239,41 @@ def jsonobject_set(self: JObject, **kwargs: dict[str, Any]) -> JObject:
     return self
 
 
+async def aset(self: JObject, **kwargs: dict[str, Any]) -> JObject:
+    """Set object values in a batch like `set` does. Passwords of salted
+    fields are hashed on the bcrypt thread pool without blocking the event
+    loop.
+    """
+    passwords = _salted_values(self.__class__, [kwargs])
+    hashes = await ahashpw_many(passwords)
+    with prehashed(passwords, hashes):
+        return self.set(**kwargs)
+
+
+def _salted_values(cls: type[JObject],
+                   items: list[dict[str, Any]]) -> list[str]:
+    """Collect the input passwords of salted fields."""
+    fields = [f for f in cls.cdef.fields if f.fdef.salted]
+    if len(fields) == 0:
+        return []
+    values: list[str] = []
+    for item in items:
+        for field in fields:
+            value = item.get(field.name)
+            if value is None:
+                value = item.get(field.json_name)
+            if type(value) is str:
+                values.append(value)
+    return values
+
+
 def _set(self: JObject,
-         kwargs: dict[str, Any], fill_blanks: bool = False) -> None:
+         kwargs: dict[str, Any], fill_blanks: bool = False,
+         mgraph: Optional[MGraph] = None) -> None:
     """Set values of a jsonclass object internally."""
     ctxcfg = CtxCfg(fill_dest_blanks=fill_blanks, all_fields=False)
-    ctx = Ctx.rootctx(self, ctxcfg, kwargs)
-    InstanceOfModifier(self.__class__).transform(ctx)
+    ctx = Ctx.rootctx(self, ctxcfg, kwargs, mgraph)
+    self.__class__.cdef.root_modifier.transform(ctx)
 
 
 def _keypath_set(self: JObject, kwargs: dict[str, Any]) -> None:
@@ -163,7 +362,7 @@ def tojson(self: JObject,
                     reverse_relationship=reverse_relationship,
                     output_null=output_null)
     ctx = Ctx.rootctx(self, ctxcfg)
-    return InstanceOfModifier(self.__class__).tojson(ctx)
+    return self.__class__.cdef.root_modifier.tojson(ctx)
 
 
 def pick(self: JObject, picks: list[str]) -> None:
@@ -201,20 +400,65 @@ def validate(self: JObject, all_fields: Optional[bool] = None) -> JObject:
     Returns:
         None: upon successful validation, returns nothing.
     """
+    time = now()
+    if self._valid_at >= time and self.__class__.cdef.closed_validation:
+        # nothing has changed since the last successful validation
+        return self
     ctxcfg = CtxCfg(all_fields=all_fields)
     ctx = Ctx.rootctx(self, ctxcfg)
-    InstanceOfModifier(self.__class__).validate(ctx)
+    self.__class__.cdef.root_modifier.validate(ctx)
+    # changes made while validating are newer than the stamp
+    for obj in ctx.mgraph.marked():
+        obj._valid_at = time
     return self
 
 
+async def avalidate(self: JObject,
+                    all_fields: Optional[bool] = None) -> JObject:
+    """Validate the jsonclass object like `validate` does. Passwords of the
+    checkpw fields of the object are checked on the bcrypt thread pool
+    without blocking the event loop, then the object is validated on the
+    calling thread.
+    """
+    if self._valid_at >= now() and self.__class__.cdef.closed_validation:
+        return self
+    pairs = _checkpw_pairs(self)
+    results = await acheckpw_many(pairs)
+    with prechecked(pairs, results):
+        return self.validate(all_fields)
+
+
+def _checkpw_pairs(self: JObject) -> list[tuple[str, str]]:
+    """Collect the passwords and the hashes of checkpw fields."""
+    pairs: list[tuple[str, str]] = []
+    ctx: Optional[Ctx] = None
+    for field in self.__class__.cdef.fields:
+        against = field.fdef.checkpw_against
+        if against is None:
+            continue
+        hashed = getattr(self, field.name)
+        if type(hashed) is not str:
+            continue
+        if ctx is None:
+            ctx = Ctx.rootctx(self, CtxCfg())
+        fctx = ctx.nextvo(hashed, field.name, field.fdef, self)
+        password = against.modifier.transform(fctx)
+        if type(password) is str:
+            pairs.append((password, hashed))
+    return pairs
+
+
 @property
 def is_valid(self: JObject) -> bool:
     """Test whether the jsonclass object is valid or not. This method
-    triggers object validation.
+    triggers object validation if anything has changed since the last
+    successful validation, or if the object is validated by user callables.
 
     Returns:
         bool: the validity of the object.
     """
+    if self._valid_at >= now() and self.__class__.cdef.closed_validation:
+        return True
     try:
         self.validate(all_fields=False)
     except ValidationException:
@@ -233,6 +477,7 @@ def opby(self: JObject, operator: Any) -> JObject:
         JObject: The JObject itself is returned.
     """
     setattr(self, '_operator', operator)
+    self._version = tick()
     if operator is None:
         return self
     if self.is_new:
@@ -241,7 +486,7 @@ def opby(self: JObject, operator: Any) -> JObject:
             fidname = self.__class__.cdef.jconf.ref_name_strategy(field)
             if field.fdef.operator_assign_transformer is not None:
                 transformer = field.fdef.operator_assign_transformer
-                params_len = len(signature(transformer).parameters)
+                params_len = arity(transformer)
                 if params_len == 1:
                     setattr(self, fidname, transformer(operator)._id)
                 elif params_len == 2:
@@ -455,6 +700,7 @@ def _data_dict(self: JObject) -> dict[str, Any]:
 
 def _mark_new(self: JObject) -> None:
     """Mark the jsonclass object as a new object."""
+    self._version = tick()
     setattr(self, '_is_new', True)
     setattr(self, '_is_modified', False)
     setattr(self, '_modified_fields', set())
@@ -463,6 +709,7 @@ def _mark_new(self: JObject) -> None:
 
 def _mark_unmodified(self: JObject) -> None:
     """Mark this jsonclass object as an unmodified object."""
+    self._version = tick()
     setattr(self, '_is_new', False)
     setattr(self, '_is_modified', False)
     setattr(self, '_modified_fields', set())
@@ -480,18 +727,18 @@ def _set_initial_status(self: JObject) -> None:
     setattr(self, '_unlinked_objects', {})
     setattr(self, '_link_keys', {})
     setattr(self, '_unlink_keys', {})
-    setattr(self, '_graph', OGraph())
     setattr(self, '_operator', None)
 
 
 def _mark_not_new(self: JObject) -> None:
     """Mark the jsonclass object as not a new object."""
+    self._version = tick()
     setattr(self, '_is_new', False)
 
 
 def _link_local_keys(self: JObject, fname: str, key: str | int) -> None:
     field = self.__class__.cdef.field_named(fname)
-    ids_name = self.__class__.cdef.jconf.ref_name_strategy(field)
+    ids_name = field.ref_name
     if getattr(self, ids_name) is None:
         setattr(self, ids_name, [])
     getattr(self, ids_name).append(key)
@@ -499,7 +746,7 @@ def _link_local_keys(self: JObject, fname: str, key: str | int) -> None:
 
 def _unlink_local_keys(self: JObject, fname: str, key: str | int) -> None:
     field = self.__class__.cdef.field_named(fname)
-    ids_name = self.__class__.cdef.jconf.ref_name_strategy(field)
+    ids_name = field.ref_name
     if getattr(self, ids_name) is None:
         return
     getattr(self, ids_name).remove(key)
@@ -547,7 +794,7 @@ def _set_on_save(self: JObject) -> None:
     is a graph operation. Objects chained with the saving object will also
     get setonsave called and saved.
     """
-    modifier = InstanceOfModifier(self.__class__)
+    modifier = self.__class__.cdef.root_modifier
     ctx = Ctx.rootctx(self, CtxCfg())
     modifier.serialize(ctx)
 
@@ -617,7 +864,7 @@ def _can_read_check(self: JObject) -> None:
 
 def _run_on_create_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_create:
-        params_len = len(signature(callback).parameters)
+        params_len = arity(callback)
         if params_len == 1:
             callback(self)
         else:
@@ -626,7 +873,7 @@ def _run_on_create_callbacks(self: JObject) -> None:
 
 def _run_on_update_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_update:
-        params_len = len(signature(callback).parameters)
+        params_len = arity(callback)
         if params_len == 1:
             callback(self)
         else:
@@ -635,7 +882,7 @@ def _run_on_update_callbacks(self: JObject) -> None:
 
 def _run_on_delete_callbacks(self: JObject) -> None:
     for callback in self.__class__.cdef.jconf.on_delete:
-        params_len = len(signature(callback).parameters)
+        params_len = arity(callback)
         if params_len == 1:
             callback(self)
         else:
@@ -663,128 +910,14 @@ def _previous_id(self: JObject) -> str | int | None:
     return self._id
 
 
-def __is_private_attr__(name: str) -> bool:
-    """Returns true if the attribute name indicates private attribute."""
-    return name.startswith('_')
-
-
-def __setattr__(self: JObject, name: str, value: Any) -> None:
-    # use original setattr for private fields
-    if __is_private_attr__(name):
-        self.__original_setattr__(name, value)
-        return
-    # use special method for local keys
-    if name in self._local_keys:
-        if value == getattr(self, name):
-            return
-        field_name = self._local_key_map[name]
-        field = self.__class__.cdef.field_named(field_name)
-        if field.fdef.ftype == FType.INSTANCE:
-            if value is None:
-                self.__original_setattr__(name, value)
-                setattr(self, field_name, None)
-            else:
-                # temporarily set to none if key is modified
-                # in the future, may query object from graph
-                self.__original_setattr__(name, value)
-                setattr(self, field_name, None)
-        elif field.fdef.ftype == FType.LIST:
-            olist = to_owned_list(self, value or [], name)
-            self.__original_setattr__(name, olist)
-            if (value is None) or (value is []):
-                setattr(self, field_name, [])
-            else:
-                new_list = []
-                curvals = getattr(self, field_name)
-                if curvals is None:
-                    curvals = []
-                for item in value:
-                    existitem = next((v for v in curvals if v._id == item), None)
-                    if existitem is not None:
-                        new_list.append(existitem)
-                setattr(self, field_name, new_list)
-        if not self.is_new:
-            setattr(self, '_is_modified', True)
-            self._modified_fields.add(field_name)
-    # use original setattr for non JSON class fields
-    try:
-        field = self.__class__.cdef.field_named(name)
-    except ValueError:
-        self.__original_setattr__(name, value)
-        return
-    # this is a JSON class field attribute
-    if field.fdef.fstore == FStore.CALCULATED:
-        if field.fdef.setter is None:
-            raise Exception('do not set to readonly calculation field')
-        else:
-            if callable(field.fdef.setter):
-                field.fdef.setter(value, self)
-            else:
-                ctx = Ctx.rootctxp(self, name, None, value)
-                field.fdef.setter.modifier.transform(ctx)
-            return
-    if hasattr(self, name) and value == getattr(self, name):
-        return
-    # track modified and previous value
-    if not self.is_new:
-        setattr(self, '_is_modified', True)
-        self._modified_fields.add(name)
-        if self.__class__.cdef.jconf.reset_all_fields or \
-                field.fdef.has_reset_modifier:
-            if name not in self.previous_values:
-                self.previous_values[name] = getattr(self, name)
-    # make list and dict assignments owned and monitored
-    if isinstance(value, list):
-        value = to_owned_list(self, value, name)
-    if isinstance(value, dict):
-        value = to_owned_dict(self, value, name)
-    if field.fdef.is_ref:
-        if hasattr(self, name):
-            self.__unlink_field__(field, getattr(self, name))
-        self.__original_setattr__(name, value)
-        if field.fdef.fstore == FStore.LOCAL_KEY:
-            rkes = self.__class__.cdef.jconf.ref_name_strategy
-            rname = rkes(field)
-            if field.fdef.ftype == FType.INSTANCE:
-                if value is None:
-                    self.__original_setattr__(rname, None)
-                if isjsonobject(value):
-                    self.__original_setattr__(rname, value._id)
-            elif field.fdef.ftype == FType.LIST:
-                if value is None:
-                    olist = to_owned_list(self, [], rname)
-                    self.__original_setattr__(rname, olist)
-                else:
-                    keys = []
-                    for item in value:
-                        if item is not None:
-                            keys.append(item._id)
-                    olist = to_owned_list(self, keys, rname)
-                    self.__original_setattr__(rname, olist)
-        self.__link_field__(field, value)
-    else:
-        self.__original_setattr__(name, value)
-
-
-def __getattribute__(self: JObject, name: str, default: Any = None) -> Any:
-    """This getattr takes calculated fields into account.
-    """
-    if name.startswith('_'):
-        cls = getmro(type(self))[-2]
-        return super(cls, self).__getattribute__(name)
-    cdef = self.__class__.cdef
-    if name in cdef.calc_field_names:
-        getter = cdef.field_named(name).fdef.getter
-        if callable(getter):
-            return getter(self)
-        else:
-            ctx = Ctx.rootctx(self, CtxCfg(), self)
-            return getter.modifier.transform(ctx)
-    cls = getmro(type(self))[-2]
-    return super(cls, self).__getattribute__(name)
+def __original_setattr__(self: JObject, name: str, value: Any) -> None:
+    """Set an attribute value without running field setters."""
+    self._version = tick()
+    self.__dict__[name] = value
 
 
 def __odict_will_change__(self: JObject, odict: OwnedDict) -> None:
+    self._version = tick()
     # record previous value
     name = initial_keypath(odict.keypath)
     field = self.__class__.cdef.field_named(name)
@@ -822,6 +955,7 @@ def __odict_del__(self, odict: OwnedDict, val: Any) -> None:
 
 
 def __olist_will_change__(self, olist: OwnedList) -> None:
+    self._version = tick()
     # record previous value
     name = initial_keypath(olist.keypath)
     try:
@@ -983,15 +1117,41 @@ def __link_field__(self: JObject, field: JField, value: Any) -> None:
         self.__link_graph__(item)
 
 
-def __link_graph__(self: JObject, other: JObject) -> None:
+@property
+def _graph(self: JObject) -> OGraph:
+    """The object graph of this object. It's created on first access. Once
+    initialized, an object is put into its graph if it has a primary key.
     """
+    graph = getattr(self, '_ograph', MISSING)
+    if graph is MISSING or graph is None:
+        root = OGraph(self) if graph is None else OGraph()
+    else:
+        root = graph._root()
+        if root is graph:
+            return root
+    self._ograph = root
+    return root
+
+
+@_graph.setter
+def _graph(self: JObject, graph: OGraph) -> None:
+    self._ograph = graph
+
+
+def __link_graph__(self: JObject, other: JObject) -> None:
+    """Merge the object graph of other object into the object graph of this
+    object.
     """
     try:
         if not self._graph.has(self):
             self._graph.put(self)
     except UnlinkableJSONClassException:
         pass
-    self._graph = self._graph.merged_graph(other._graph)
+    graph = other._graph
+    if not len(graph):
+        # other object is not on a graph yet
+        return
+    self._graph = self._graph.merged_graph(graph)
 
 
 def jsonclassify(class_: type) -> type[JObject]:
@@ -1010,12 +1170,15 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_.__is_jsonclass__ = True
     # public methods
     class_.__init__ = __init__
+    class_.from_many = classmethod(from_many)
     class_.set = jsonobject_set
+    class_.aset = aset
     class_.update = update
     class_.tojson = tojson
     class_.pick = pick
     class_.omit = omit
     class_.validate = validate
+    class_.avalidate = avalidate
     class_.is_valid = is_valid
     class_.opby = opby
     class_.is_new = is_new
@@ -1033,6 +1196,9 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_.complete = complete
     class_.include = include
     # protected methods
+    class_._init = _init
+    class_._init_blank = _init_blank
+    class_._init_graph = _init_graph
     class_._set = _set
     class_._keypath_set = _keypath_set
     class_._set_to_container = _set_to_container
@@ -1063,10 +1229,13 @@ def jsonclassify(class_: type) -> type[JObject]:
     class_._run_on_delete_callbacks = _run_on_delete_callbacks
     class_._id = _id
     class_._previous_id = _previous_id
+    class_._graph = _graph
+    if '_version' not in class_.__dict__:
+        # compact classes store versions in slots
+        class_._version = 0
+        class_._valid_at = -1
     # private methods
-    class_.__original_setattr__ = class_.__setattr__
-    class_.__setattr__ = __setattr__
-    class_.__getattribute__ = __getattribute__
+    class_.__original_setattr__ = __original_setattr__
     class_.__odict_will_change__ = __odict_will_change__
     class_.__odict_add__ = __odict_add__
     class_.__odict_del__ = __odict_del__
@@ -85,6 +85,14 @@ class MGraph:
              memid: int) -> Optional[JObject]:
         return self.class_table(cls).getm(memid)
 
+    def marked(self) -> Iterator[JObject]:
+        """Iterate the marked objects. Unlike iterating the graph, objects
+        are not deduplicated, thus an object may be iterated more than once.
+        """
+        for ct in self._class_tables.values():
+            yield from ct._primary_key_table.values()
+            yield from ct._memory_id_table.values()
+
     def __iter__(self) -> Iterator:
         lst = []
         for ct in self._class_tables.values():
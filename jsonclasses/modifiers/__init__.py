@@ -1,234 +1,261 @@
-"""This module contains all modifier markers."""
-# flake8: noqa: F401
-from .modifier import Modifier
-from .invalid_modifier import InvalidModifier
-
-from .primary_modifier import PrimaryModifier
-
-# access markers
-from .writeonly_modifier import WriteonlyModifier
-from .writeonce_modifier import WriteonceModifier
-from .writenonnull_modifier import WriteNonnullModifier
-from .readonly_modifier import ReadonlyModifier
-from .readwrite_modifier import ReadwriteModifier
-from .temp_modifier import TempModifier
-from .getter_modifier import GetterModifier
-from .setter_modifier import SetterModifier
-from .nocopy_modifier import NoCopyModifier
-
-# database index command markers
-from .index_modifier import IndexModifier
-from .unqueryable_modifier import UnqueryableModifier
-from .queryable_modifier import QueryableModifier
-
-# orm relationship command markers
-
-from .embedded_modifier import EmbeddedModifier
-from .linkto_modifier import LinkToModifier
-from .linkedby_modifier import LinkedByModifier
-from .linkedthru_modifier import LinkedThruModifier
-from .linkedin_modifier import LinkedInModifier
-from .referrer_modifier import ReferrerModifier
-from .referee_modifier import RefereeModifier
-from .deny_modifier import DenyModifier
-from .cascade_modifier import CascadeModifier
-from .nullify_modifier import NullifyModifier
-
-# eager validation markers
-from .eager_modifier import EagerModifier
-
-# preserialize validation markers
-from .preserialize_modifier import PreserializeModifier
-
-# str modifiers
-from .str_modifier import StrModifier
-from .match_modifier import MatchModifier
-from .truncate_modifier import TruncateModifier
-from .trim_modifier import TrimModifier
-from .url_modifier import UrlModifier
-from .email_modifier import EmailModifier
-from .hexcolor_modifier import HexColorModifier
-from .securepw_modifier import SecurepwModifier
-from .digit_modifier import DigitModifier
-from .alpha_modifier import AlphaModifier
-from .numeric_modifier import NumericModifier
-from .alnum_modifier import AlnumModifier
-from .totitle_modifier import ToTitleModifier
-from .tocap_modifier import ToCapModifier
-from .tolower_modifier import ToLowerModifier
-from .toupper_modifier import ToUpperModifier
-from .replace_modifier import ReplaceModifier
-from .replacer_modifier import ReplacerModifier
-from .split_modifier import SplitModifier
-from .join_modifier import JoinModifier
-from .salt_modifier import SaltModifier
-from .tostr_modifier import ToStrModifier
-from .padstart_modifier import PadStartModifier
-from .padend_modifier import PadEndModifier
-from .mongoid_modifier import MongoIdModifier
-
-# number modifiers
-from .int_modifier import IntModifier
-from .float_modifier import FloatModifier
-from .min_modifier import MinModifier
-from .max_modifier import MaxModifier
-from .lt_modifier import LtModifier
-from .gt_modifier import GtModifier
-from .nonnegative_modifier import NonnegativeModifier
-from .nonpositive_modifier import NonpositiveModifier
-from .range_modifier import RangeModifier
-from .positive_modifier import PositiveModifier
-from .negative_modifier import NegativeModifier
-from .round_modifier import RoundModifier
-from .ceil_modifier import CeilModifier
-from .floor_modifier import FloorModifier
-from .odd_modifier import OddModifier
-from .even_modifier import EvenModifier
-from .abs_modifier import AbsModifier
-from .tofloat_modifier import ToFloatModifier
-from .toint_modifier import ToIntModifier
-from .add_modifier import AddModifier
-from .sub_modifier import SubModifier
-from .mul_modifier import MulModifier
-from .div_modifier import DivModifier
-from .mod_modifier import ModModifier
-from .pow_modifier import PowModifier
-from .sqrt_modifier import SqrtModifier
-from .map_modifier import MapModifier
-from .filter_modifier import FilterModifier
-from .upperbond_modifier import UpperbondModifier
-from .lowerbond_modifier import LowerbondModifier
-
-# bool modifiers
-from .bool_modifier import BoolModifier
-from .tobool_modifier import ToBoolModifier
-from .inverse_modifier import InverseModifier
-
-# datetime modifiers
-from .date_modifier import DateModifier
-from .datetime_modifier import DatetimeModifier
-from .before_modifier import BeforeModifier
-from .after_modifier import AfterModifier
-from .tobosec_modifier import ToBoSecModifier
-from .tobomin_modifier import ToBoMinModifier
-from .tobohour_modifier import ToBoHourModifier
-from .tonextsec_modifier import ToNextSecModifier
-from .tonextmin_modifier import ToNextMinModifier
-from .tonexthour_modifier import ToNextHourModifier
-from .tonextyear_modifier import ToNextYearModifier
-from .tonextmon_modifier import ToNextMonModifier
-from .tonextday_modifier import ToNextDayModifier
-from .toboyear_modifier import ToBoYearModifier
-from .tobomon_modifier import ToBoMonModifier
-from .toboday_modifier import ToBoDayModifier
-from .fmtd_modifier import FormatDatetimeModifier
-
-# enum modifiers
-from .enum_modifier import EnumModifier
-from .inputvalue_modifier import InputValueModifier
-from .inputname_modifier import InputNameModifier
-from .inputlname_modifier import InputLnameModifier
-from .inputall_modifier import InputAllModifier
-from .outputvalue_modifier import OutputValueModifier
-from .outputname_modifier import OutputNameModifier
-from .outputlname_modifier import OutputLnameModifier
-
-# iterable modifiers
-from .oneof_modifier import OneOfModifier
-from .minlength_modifier import MinlengthModifier
-from .maxlength_modifier import MaxlengthModifier
-from .length_modifier import LengthModifier
-from .reverse_modifier import ReverseModifier
-from .hasprefix_modifier import HasPrefixModifier
-from .hassuffix_modifier import HasSuffixModifier
-from .isprefixof_modifier import IsPrefixOfModifier
-from .issuffixof_modifier import IsSuffixOfModifier
-from .wrapintolist_modifier import WrapIntoListModifier
-from .tolist_modifier import ToListModifier
-from .insertat_modifier import InsertAtModifier
-from .append_modifier import AppendModifier
-from .prepend_modifier import PrependModifier
-from .len_modifier import LenModifier
-
-# collection modifiers
-from .listof_modifier import ListOfModifier
-from .dictof_modifier import DictOfModifier
-
-# object modifiers
-from .instanceof_modifier import InstanceOfModifier
-from .strict_modifier import StrictModifier
-
-# mixed type modifier
-from .union_modifier import UnionModifier
-from .any_modifier import AnyModifier
-
-# nullability modifiers
-from .required_modifier import RequiredModifier
-from .nullable_modifier import NullableModifier
-from .present_modifier import PresentModifier
-from .presentwith_modifier import PresentWithModifier
-from .presentwithout_modifier import PresentWithoutModifier
-from .nonnull_modifier import NonnullModifier
-
-# custom modifier
-from .validate_modifier import ValidateModifier
-
-# comparing modifier and callback
-from .reset_modifier import ResetModifier
-from .compare_modifier import CompareModifier
-
-# default transformer
-from .default_modifier import DefaultModifier
-
-# transform
-from .transform_modifier import TransformModifier
-
-# formatter
-from .fmt_modifier import FmtModifier
-
-# operator
-from .asop_modifier import AsopModifier
-from .asopd_modifier import AsopdModifier
-from .canc_modifier import CanCModifier
-from .canu_modifier import CanUModifier
-from .canr_modifier import CanRModifier
-
-# chained modifier
-from .chained_modifier import ChainedModifier
-
-# setonsave setter, onsave callback
-from .setonsave_modifier import SetOnSaveModifier
-from .fsetonsave_modifier import FSetOnSaveModifier
-from .onsave_modifier import OnSaveModifier
-from .onupdate_modifier import OnUpdateModifier
-from .onwrite_modifier import OnWriteModifier
-
-# jsonclasses internal
-from .unresolved_modifier import UnresolvedModifier
-
-# authorization
-from .authidentity_modifier import AuthIdentityModifier
-from .authby_modifier import AuthByModifier
-
-# calc pipeline
-from .passin_modifier import PassinModifier
-from .checkpw_modifier import CheckpwModifier
-from .random_digits_modifier import RandomDigitsModifier
-from .random_alnums_modifier import RandomAlnumsModifier
-from .random_alnumpuncs_modifier import RandomAlnumpuncsModifier
-from .random_float_modifier import RandomFloatModifier
-from .random_int_modifier import RandomIntModifier
-from .cross_fetch_modifier import CrossFetchModifier
-from .fval_modifier import FValModifier
-from .fobj_modifier import FObjModifier
-from .eq_modifier import EqModifier
-from .neq_modifier import NeqModifier
-from .this_modifier import ThisModifier
-from .at_modifier import AtModifier
-from .assign_modifier import AssignModifier
-from .uploader_modifier import UploaderModifier
-from .isthis_modifier import IsThisModifier
-from .oneisvalid_modifier import OneIsValidModifier
-from .isobjof_modifier import IsObjOfModifier
-from .isobj_modifier import IsObjModifier
-from .getop_modifier import GetOpModifier
+"""This module contains all modifier markers. Modifier modules are loaded
+on first use, thus importing jsonclasses doesn't load modifiers which are
+never used.
+"""
+from __future__ import annotations
+from typing import Any
+from importlib import import_module
+
+
+_MODULES: dict[str, str] = {
+    'Modifier': 'modifier',
+    'InvalidModifier': 'invalid_modifier',
+
+    'PrimaryModifier': 'primary_modifier',
+
+    # access markers
+    'WriteonlyModifier': 'writeonly_modifier',
+    'WriteonceModifier': 'writeonce_modifier',
+    'WriteNonnullModifier': 'writenonnull_modifier',
+    'ReadonlyModifier': 'readonly_modifier',
+    'ReadwriteModifier': 'readwrite_modifier',
+    'TempModifier': 'temp_modifier',
+    'GetterModifier': 'getter_modifier',
+    'SetterModifier': 'setter_modifier',
+    'NoCopyModifier': 'nocopy_modifier',
+    'PackedModifier': 'packed_modifier',
+
+    # database index command markers
+    'IndexModifier': 'index_modifier',
+    'UnqueryableModifier': 'unqueryable_modifier',
+    'QueryableModifier': 'queryable_modifier',
+
+    # orm relationship command markers
+
+    'EmbeddedModifier': 'embedded_modifier',
+    'LinkToModifier': 'linkto_modifier',
+    'LinkedByModifier': 'linkedby_modifier',
+    'LinkedThruModifier': 'linkedthru_modifier',
+    'LinkedInModifier': 'linkedin_modifier',
+    'ReferrerModifier': 'referrer_modifier',
+    'RefereeModifier': 'referee_modifier',
+    'DenyModifier': 'deny_modifier',
+    'CascadeModifier': 'cascade_modifier',
+    'NullifyModifier': 'nullify_modifier',
+
+    # eager validation markers
+    'EagerModifier': 'eager_modifier',
+
+    # preserialize validation markers
+    'PreserializeModifier': 'preserialize_modifier',
+
+    # str modifiers
+    'StrModifier': 'str_modifier',
+    'MatchModifier': 'match_modifier',
+    'TruncateModifier': 'truncate_modifier',
+    'TrimModifier': 'trim_modifier',
+    'UrlModifier': 'url_modifier',
+    'EmailModifier': 'email_modifier',
+    'HexColorModifier': 'hexcolor_modifier',
+    'SecurepwModifier': 'securepw_modifier',
+    'DigitModifier': 'digit_modifier',
+    'AlphaModifier': 'alpha_modifier',
+    'NumericModifier': 'numeric_modifier',
+    'AlnumModifier': 'alnum_modifier',
+    'ToTitleModifier': 'totitle_modifier',
+    'ToCapModifier': 'tocap_modifier',
+    'ToLowerModifier': 'tolower_modifier',
+    'ToUpperModifier': 'toupper_modifier',
+    'ReplaceModifier': 'replace_modifier',
+    'ReplacerModifier': 'replacer_modifier',
+    'SplitModifier': 'split_modifier',
+    'JoinModifier': 'join_modifier',
+    'SaltModifier': 'salt_modifier',
+    'ToStrModifier': 'tostr_modifier',
+    'PadStartModifier': 'padstart_modifier',
+    'PadEndModifier': 'padend_modifier',
+    'MongoIdModifier': 'mongoid_modifier',
+
+    # number modifiers
+    'IntModifier': 'int_modifier',
+    'FloatModifier': 'float_modifier',
+    'MinModifier': 'min_modifier',
+    'MaxModifier': 'max_modifier',
+    'LtModifier': 'lt_modifier',
+    'GtModifier': 'gt_modifier',
+    'NonnegativeModifier': 'nonnegative_modifier',
+    'NonpositiveModifier': 'nonpositive_modifier',
+    'RangeModifier': 'range_modifier',
+    'PositiveModifier': 'positive_modifier',
+    'NegativeModifier': 'negative_modifier',
+    'RoundModifier': 'round_modifier',
+    'CeilModifier': 'ceil_modifier',
+    'FloorModifier': 'floor_modifier',
+    'OddModifier': 'odd_modifier',
+    'EvenModifier': 'even_modifier',
+    'AbsModifier': 'abs_modifier',
+    'ToFloatModifier': 'tofloat_modifier',
+    'ToIntModifier': 'toint_modifier',
+    'AddModifier': 'add_modifier',
+    'SubModifier': 'sub_modifier',
+    'MulModifier': 'mul_modifier',
+    'DivModifier': 'div_modifier',
+    'ModModifier': 'mod_modifier',
+    'PowModifier': 'pow_modifier',
+    'SqrtModifier': 'sqrt_modifier',
+    'MapModifier': 'map_modifier',
+    'FilterModifier': 'filter_modifier',
+    'UpperbondModifier': 'upperbond_modifier',
+    'LowerbondModifier': 'lowerbond_modifier',
+
+    # bool modifiers
+    'BoolModifier': 'bool_modifier',
+    'ToBoolModifier': 'tobool_modifier',
+    'InverseModifier': 'inverse_modifier',
+
+    # datetime modifiers
+    'DateModifier': 'date_modifier',
+    'DatetimeModifier': 'datetime_modifier',
+    'BeforeModifier': 'before_modifier',
+    'AfterModifier': 'after_modifier',
+    'ToBoSecModifier': 'tobosec_modifier',
+    'ToBoMinModifier': 'tobomin_modifier',
+    'ToBoHourModifier': 'tobohour_modifier',
+    'ToNextSecModifier': 'tonextsec_modifier',
+    'ToNextMinModifier': 'tonextmin_modifier',
+    'ToNextHourModifier': 'tonexthour_modifier',
+    'ToNextYearModifier': 'tonextyear_modifier',
+    'ToNextMonModifier': 'tonextmon_modifier',
+    'ToNextDayModifier': 'tonextday_modifier',
+    'ToBoYearModifier': 'toboyear_modifier',
+    'ToBoMonModifier': 'tobomon_modifier',
+    'ToBoDayModifier': 'toboday_modifier',
+    'FormatDatetimeModifier': 'fmtd_modifier',
+
+    # enum modifiers
+    'EnumModifier': 'enum_modifier',
+    'InputValueModifier': 'inputvalue_modifier',
+    'InputNameModifier': 'inputname_modifier',
+    'InputLnameModifier': 'inputlname_modifier',
+    'InputAllModifier': 'inputall_modifier',
+    'OutputValueModifier': 'outputvalue_modifier',
+    'OutputNameModifier': 'outputname_modifier',
+    'OutputLnameModifier': 'outputlname_modifier',
+
+    # iterable modifiers
+    'OneOfModifier': 'oneof_modifier',
+    'MinlengthModifier': 'minlength_modifier',
+    'MaxlengthModifier': 'maxlength_modifier',
+    'LengthModifier': 'length_modifier',
+    'ReverseModifier': 'reverse_modifier',
+    'HasPrefixModifier': 'hasprefix_modifier',
+    'HasSuffixModifier': 'hassuffix_modifier',
+    'IsPrefixOfModifier': 'isprefixof_modifier',
+    'IsSuffixOfModifier': 'issuffixof_modifier',
+    'WrapIntoListModifier': 'wrapintolist_modifier',
+    'ToListModifier': 'tolist_modifier',
+    'InsertAtModifier': 'insertat_modifier',
+    'AppendModifier': 'append_modifier',
+    'PrependModifier': 'prepend_modifier',
+    'LenModifier': 'len_modifier',
+
+    # collection modifiers
+    'ListOfModifier': 'listof_modifier',
+    'DictOfModifier': 'dictof_modifier',
+
+    # object modifiers
+    'InstanceOfModifier': 'instanceof_modifier',
+    'StrictModifier': 'strict_modifier',
+
+    # mixed type modifier
+    'UnionModifier': 'union_modifier',
+    'AnyModifier': 'any_modifier',
+
+    # nullability modifiers
+    'RequiredModifier': 'required_modifier',
+    'NullableModifier': 'nullable_modifier',
+    'PresentModifier': 'present_modifier',
+    'PresentWithModifier': 'presentwith_modifier',
+    'PresentWithoutModifier': 'presentwithout_modifier',
+    'NonnullModifier': 'nonnull_modifier',
+
+    # custom modifier
+    'ValidateModifier': 'validate_modifier',
+
+    # comparing modifier and callback
+    'ResetModifier': 'reset_modifier',
+    'CompareModifier': 'compare_modifier',
+
+    # default transformer
+    'DefaultModifier': 'default_modifier',
+
+    # transform
+    'TransformModifier': 'transform_modifier',
+
+    # formatter
+    'FmtModifier': 'fmt_modifier',
+
+    # operator
+    'AsopModifier': 'asop_modifier',
+    'AsopdModifier': 'asopd_modifier',
+    'CanCModifier': 'canc_modifier',
+    'CanUModifier': 'canu_modifier',
+    'CanRModifier': 'canr_modifier',
+
+    # chained modifier
+    'ChainedModifier': 'chained_modifier',
+
+    # setonsave setter, onsave callback
+    'SetOnSaveModifier': 'setonsave_modifier',
+    'FSetOnSaveModifier': 'fsetonsave_modifier',
+    'OnSaveModifier': 'onsave_modifier',
+    'OnUpdateModifier': 'onupdate_modifier',
+    'OnWriteModifier': 'onwrite_modifier',
+
+    # jsonclasses internal
+    'UnresolvedModifier': 'unresolved_modifier',
+
+    # authorization
+    'AuthIdentityModifier': 'authidentity_modifier',
+    'AuthByModifier': 'authby_modifier',
+
+    # calc pipeline
+    'PassinModifier': 'passin_modifier',
+    'CheckpwModifier': 'checkpw_modifier',
+    'RandomDigitsModifier': 'random_digits_modifier',
+    'RandomAlnumsModifier': 'random_alnums_modifier',
+    'RandomAlnumpuncsModifier': 'random_alnumpuncs_modifier',
+    'RandomFloatModifier': 'random_float_modifier',
+    'RandomIntModifier': 'random_int_modifier',
+    'CrossFetchModifier': 'cross_fetch_modifier',
+    'FValModifier': 'fval_modifier',
+    'FObjModifier': 'fobj_modifier',
+    'EqModifier': 'eq_modifier',
+    'NeqModifier': 'neq_modifier',
+    'ThisModifier': 'this_modifier',
+    'AtModifier': 'at_modifier',
+    'AssignModifier': 'assign_modifier',
+    'UploaderModifier': 'uploader_modifier',
+    'IsThisModifier': 'isthis_modifier',
+    'OneIsValidModifier': 'oneisvalid_modifier',
+    'IsObjOfModifier': 'isobjof_modifier',
+    'IsObjModifier': 'isobj_modifier',
+    'GetOpModifier': 'getop_modifier',
+}
+"""The names of the modules of modifier classes."""
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_MODULES]
+
+
+__all__ = [*_MODULES]
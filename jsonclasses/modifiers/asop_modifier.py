@@ -1,7 +1,7 @@
 """module for assigning operator modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from ..fdef import FDef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -16,7 +16,7 @@ class AsopModifier(Modifier):
     def __init__(self, transformer: Callable) -> None:
         if not callable(transformer):
             raise ValueError('asop transformer is not callable')
-        params_len = len(signature(transformer).parameters)
+        params_len = arity(transformer)
         if params_len > 3 or params_len < 1:
             raise ValueError('not a valid asop transformer')
         self.transformer = transformer
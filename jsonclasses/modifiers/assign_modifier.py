@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Any, Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from ..fdef import FStore, FDef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -15,7 +15,7 @@ class AssignModifier(Modifier):
         self.name = name
         self.val = val
         if callable(val):
-            params_len = len(signature(val).parameters)
+            params_len = arity(val)
             if params_len != 0:
                 raise ValueError('not a valid assigner')
 
@@ -1,7 +1,7 @@
 """module for canu modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 from ..fdef import FDef
 from ..excs import ValidationException
@@ -21,7 +21,7 @@ class CanCUModifier(Modifier):
         if ctx.operator is None:
             ctx.raise_vexc('operator not present')
         if callable(self.checker):
-            params_len = len(signature(self.op_callable).parameters)
+            params_len = arity(self.op_callable)
             if params_len == 1:
                 result = self.op_callable(ctx.operator)
             elif params_len == 2:
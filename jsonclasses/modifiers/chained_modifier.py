@@ -1,22 +1,103 @@
 """module for chained modifier."""
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
-from typing import Any, Optional, cast, TYPE_CHECKING
-from functools import reduce
+from typing import Any, Callable, Optional, cast, TYPE_CHECKING
 from ..excs import ValidationException
 from .modifier import Modifier
 from .eager_modifier import EagerModifier
 from .preserialize_modifier import PreserializeModifier
+from .fused_modifier import FusedModifier
+from .type_modifier import TypeModifier
+from .required_modifier import RequiredModifier
+from .collection_type_modifier import CollectionTypeModifier
+from .instanceof_modifier import InstanceOfModifier
+from ..vector import (
+    Bound, VectorStep, VectorTransformer, VectorValidator,
+    vector_transformer, vector_validator
+)
 from ..isjsonclass import isjsonobject
 if TYPE_CHECKING:
     from ..ctx import Ctx
 
 
 class ChainedModifier(Modifier):
-    """Chained modifier has a series of modifiers chained."""
+    """Chained modifier has a series of modifiers chained. A chain never
+    changes after it's built, thus the stages of the chain are figured out
+    once when the chain is built. Modifiers which don't override a pipeline
+    method are left out of that pipeline's stage. Adjacent pure modifiers of
+    a stage are fused into one step.
+    """
 
     def __init__(self, modifiers: Optional[list[Modifier]] = None) -> None:
         self.vs = modifiers or []
+        self._levidx = self._last_vidx(EagerModifier)
+        self._fpvidx = self._first_vidx(PreserializeModifier)
+        self._tvs: tuple[Modifier, ...] = tuple(
+            self.vs[:self._levidx] if self._levidx is not None else [])
+        """The modifiers which should be perform eager validation on.
+
+        This is from the beginning to the last eager modifier before the first
+        preserialize modifier.
+        """
+        self._pvs: tuple[Modifier, ...] = tuple(
+            self.vs[self._fpvidx:] if self._fpvidx is not None else [])
+        self._nvs: tuple[Modifier, ...] = tuple(
+            self.vs[self._levidx:self._fpvidx])
+        """Modifiers between last eager modifier and first preserialize
+        modifier. These modifiers should be performed in normal validation
+        process.
+        """
+        self._ttvs = _fuse([v for v in self._tvs
+                            if _overrides(v, 'transform')
+                            or _overrides(v, 'validate')], True, True)
+        self._ntvs = _fuse([v for v in self._nvs
+                            if _overrides(v, 'transform')], True, False)
+        self._nvvs = _fuse([v for v in self._nvs
+                            if _overrides(v, 'validate')], False, True)
+        self._jvs = tuple(v for v in self.vs if _overrides(v, 'tojson'))
+        self._svs = tuple(v for v in (*self._tvs, *self._nvs)
+                          if _overrides(v, 'serialize'))
+        self.bulk_transformer = _bulk_transformer(self._ttvs, self._ntvs)
+        """The pure transformers and eager pure validators of the chain
+        composed into one function, or None if the chain doesn't transform
+        values purely. The function raises ValueError if a value is invalid.
+        Collections transform their items in bulk with it.
+        """
+        self.bulk_tojson = _bulk_tojson(self._jvs)
+        """The pure JSON converters of the chain composed into one function,
+        or None if the chain doesn't convert values to JSON purely.
+        """
+        self.stream_tojson: Optional[Modifier] = None
+        """The modifier which streams the JSON output of the chain, or None if
+        the output isn't streamed. Outputs of objects and collections are
+        streamed if no other modifier of the chain converts them.
+        """
+        if len(self._jvs) == 1 and isinstance(
+                self._jvs[0], (CollectionTypeModifier, InstanceOfModifier)):
+            self.stream_tojson = self._jvs[0]
+        self.vector_validator = _vector_validator(_unfuse(self._nvvs))
+        """The validator of lists of numbers which are validated by this
+        chain, or None if the chain doesn't validate numbers in bulk.
+        """
+        self.vector_transformer = _vector_transformer(self._ttvs,
+                                                      self._ntvs)
+        """The transformer of lists of floats which are transformed by this
+        chain, or None if the chain doesn't transform floats in bulk.
+        """
+        self.pure_validation = all(_validates_purely(v)
+                                   for v in self._nvvs)
+        """Whether the chain validates embedded values without reading the
+        context. Such a value is valid as long as it doesn't change.
+        """
+        self.closed_validation = all(
+            _validates_purely(v)
+            or isinstance(v, (CollectionTypeModifier, InstanceOfModifier))
+            for v in self._nvvs)
+        """Whether the chain is validated by built-in validators which read
+        nothing but the value, its items and the objects of the graph. Such
+        a value is valid as long as no object changes. User callables may
+        read anything, thus chains with them are never closed.
+        """
 
     def append(self, *args: Modifier) -> ChainedModifier:
         """Append modifiers to this chained modifier chain."""
@@ -35,42 +116,10 @@ class ChainedModifier(Modifier):
         v = next((v for v in self.vs[::-1] if isinstance(v, cls)), None)
         return self.vs.index(v) if v is not None else None
 
-    @property
-    def _levidx(self) -> Optional[int]:
-        return self._last_vidx(EagerModifier)
-
-    @property
-    def _fpvidx(self) -> Optional[int]:
-        return self._first_vidx(PreserializeModifier)
-
-    @property
-    def _tvs(self) -> list[Modifier]:
-        """The modifiers which should be perform eager validation on.
-
-        This is from the beginning to the last eager modifier before the first
-        preserialize modifier.
-        """
-        # TODO: accounting into e and p
-        return self.vs[:self._levidx] if self._levidx is not None else []
-
-    @property
-    def _pvs(self) -> list[Modifier]:
-        """
-        """
-        return self.vs[self._fpvidx:] if self._fpvidx is not None else []
-
-    @property
-    def _nvs(self) -> list[Modifier]:
-        """Modifiers between last eager modifier and first preserialize
-        modifier. These modifiers should be performed in normal validation
-        process.
-        """
-        return self.vs[self._levidx:self._fpvidx]
-
     def _vt(self, v: Modifier, ctx: Ctx) -> Any:
         """Validate as transform."""
         retval = v.transform(ctx)
-        v.validate(ctx.nval(retval))
+        v.validate(ctx if retval is ctx.val else ctx.nval(retval))
         return retval
 
     def _sv(self, v: Modifier, ctx: Ctx) -> Any:
@@ -82,8 +131,10 @@ class ChainedModifier(Modifier):
         return val
 
     def validate(self, ctx: Ctx) -> None:
+        if not self._nvvs:
+            return
         ctor = VMsgCollector()
-        for modifier in self._nvs:
+        for modifier in self._nvvs:
             try:
                 modifier.validate(ctx)
             except ValidationException as exception:
@@ -94,17 +145,180 @@ class ChainedModifier(Modifier):
             ctx.raise_mvexc(ctor.messages)
 
     def transform(self, ctx: Ctx) -> Any:
+        # the context is derived again only after a modifier changes the value
         val = ctx.val
-        val = reduce(lambda val, v: self._vt(v, ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.transform(ctx.nval(val)), self._nvs, val)
+        vctx = ctx
+        for v in self._ttvs:
+            if vctx.val is not val:
+                vctx = ctx.nval(val)
+            if isinstance(v, FusedModifier):
+                val = v.transform(vctx)
+            else:
+                val = self._vt(v, vctx)
+        for v in self._ntvs:
+            if vctx.val is not val:
+                vctx = ctx.nval(val)
+            val = v.transform(vctx)
         return val
 
     def tojson(self, ctx: Ctx) -> Any:
-        return reduce(lambda val, v: v.tojson(ctx.nval(val)), self.vs, ctx.val)
+        val = ctx.val
+        for v in self._jvs:
+            val = v.tojson(ctx.nval(val))
+        return val
 
     def serialize(self, ctx: Ctx) -> Any:
         val = ctx.val
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._tvs, val)
-        val = reduce(lambda val, v: v.serialize(ctx.nval(val)), self._nvs, val)
-        val = reduce(lambda val, v: self._sv(v, ctx.nval(val)), self._pvs, val)
+        for v in self._svs:
+            val = v.serialize(ctx.nval(val))
+        for v in self._pvs:
+            val = self._sv(v, ctx.nval(val))
         return val
+
+
+def _overrides(modifier: Modifier, name: str) -> bool:
+    return getattr(type(modifier), name) is not getattr(Modifier, name)
+
+
+def _unfuse(vs: tuple[Modifier, ...]) -> list[Modifier]:
+    retval: list[Modifier] = []
+    for v in vs:
+        if isinstance(v, FusedModifier):
+            retval.extend(v.vs)
+        else:
+            retval.append(v)
+    return retval
+
+
+def _vector_validator(vs: list[Modifier]) -> Optional[VectorValidator]:
+    cls: Optional[type] = None
+    bounds: list[Bound] = []
+    for v in vs:
+        vbounds = v.vector_bounds()
+        if vbounds is None:
+            return None
+        bounds.extend(vbounds)
+        if isinstance(v, TypeModifier):
+            cls = v.cls
+    if cls is None:
+        return None
+    return vector_validator(cls, bounds)
+
+
+def _vector_transformer(
+        ttvs: tuple[Modifier, ...],
+        ntvs: tuple[Modifier, ...]) -> Optional[VectorTransformer]:
+    steps: list[VectorStep] = []
+    for v, eager in [*((v, True) for v in _unfuse(ttvs)),
+                     *((v, False) for v in _unfuse(ntvs))]:
+        fn, bounds = None, ()
+        if _overrides(v, 'transform'):
+            fn = v.vector_transformer()
+            if fn is None:
+                return None
+        if eager and _overrides(v, 'validate'):
+            if isinstance(v, TypeModifier) and v.cls is not float:
+                return None
+            bounds = v.vector_bounds()
+            if bounds is None:
+                return None
+        steps.append((fn, bounds))
+    return vector_transformer(steps)
+
+
+def _bulk_transformer(
+        ttvs: tuple[Modifier, ...],
+        ntvs: tuple[Modifier, ...]) -> Optional[Callable[[Any], Any]]:
+    steps: list[tuple[Any, Any]] = []
+    for v, eager in [*((v, True) for v in ttvs), *((v, False) for v in ntvs)]:
+        if isinstance(v, FusedModifier):
+            steps.extend(v.steps)
+            continue
+        step = _pure_step(v, True, eager)
+        if step is None:
+            return None
+        steps.append(step)
+    if len(steps) == 1 and steps[0][1] is None:
+        return steps[0][0]
+
+    def transformer(val: Any) -> Any:
+        for transformer, validator in steps:
+            if transformer is not None:
+                val = transformer(val)
+            if validator is not None and validator(val) is not None:
+                raise ValueError('invalid value')
+        return val
+    return transformer
+
+
+def _bulk_tojson(jvs: tuple[Modifier, ...]) -> Optional[Callable[[Any], Any]]:
+    fns: list[Callable[[Any], Any]] = []
+    for v in jvs:
+        fn = v.pure_tojson()
+        if fn is None:
+            return None
+        fns.append(fn)
+    if len(fns) == 1:
+        return fns[0]
+
+    def tojson(val: Any) -> Any:
+        for fn in fns:
+            val = fn(val)
+        return val
+    return tojson
+
+
+def _fuse(vs: tuple[Modifier, ...] | list[Modifier],
+          transform: bool, validate: bool) -> tuple[Modifier, ...]:
+    """Fuse adjacent modifiers which transform and validate values purely.
+
+    Args:
+        vs (list[Modifier]): The modifiers of a stage.
+        transform (bool): Whether this stage transforms values.
+        validate (bool): Whether this stage validates values.
+
+    Returns:
+        tuple[Modifier, ...]: The modifiers with pure groups fused.
+    """
+    retval: list[Modifier] = []
+    group: list[Modifier] = []
+    steps: list[tuple[Any, Any]] = []
+    for v in [*vs, None]:
+        step = _pure_step(v, transform, validate) if v is not None else None
+        if step is not None:
+            group.append(v)
+            steps.append(step)
+            continue
+        if len(group) > 1:
+            retval.append(FusedModifier(group, steps))
+        else:
+            retval.extend(group)
+        group, steps = [], []
+        if v is not None:
+            retval.append(v)
+    return tuple(retval)
+
+
+def _validates_purely(v: Modifier) -> bool:
+    if isinstance(v, FusedModifier):
+        return True
+    # an embedded value is required without reading the context
+    if isinstance(v, RequiredModifier):
+        return True
+    return _pure_step(v, False, True) is not None
+
+
+def _pure_step(v: Modifier, transform: bool,
+               validate: bool) -> Optional[tuple[Any, Any]]:
+    transformer, validator = None, None
+    if transform and _overrides(v, 'transform'):
+        transformer = v.pure_transformer()
+        if transformer is None:
+            return None
+    if validate and _overrides(v, 'validate'):
+        validator = v.pure_validator()
+        if validator is None:
+            return None
+    if transformer is None and validator is None:
+        return None
+    return (transformer, validator)
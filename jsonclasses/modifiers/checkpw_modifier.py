@@ -1,6 +1,8 @@
 """module for checkpw modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
+from ..fdef import FDef
+from ..pwhash import checkpw
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -16,12 +18,14 @@ class CheckpwModifier(Modifier):
     def packages(self) -> dict[str, (str, str)] | None:
         return {'bcrypt': ('bcrypt', '>=3.2.0,<4.0.0')}
 
+    def define(self, fdef: FDef) -> None:
+        fdef._checkpw_against = self.against
+
     def validate(self, ctx: Ctx) -> None:
-        from bcrypt import checkpw
         against_val = self.against.modifier.transform(ctx)
         if type(against_val) is not str:
             ctx.raise_vexc('value is incorrect')
         if type(ctx.val) is not str:
             ctx.raise_vexc('value is incorrect')
-        if not checkpw(against_val.encode(), ctx.val.encode()):
+        if not checkpw(against_val, ctx.val):
             ctx.raise_vexc('value is incorrect')
@@ -2,7 +2,8 @@
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
 from typing import (
-    Any, Collection, Iterable, TypeVar, Union, TYPE_CHECKING
+    Any, Collection, Iterable, Iterator, Optional, TypeVar, Union,
+    TYPE_CHECKING
 )
 from ..fdef import FDef, Nullability
 from ..jconf import JConf
@@ -36,6 +37,13 @@ class CollectionTypeModifier(TypeModifier):
     def append_value(self, i: Union[str, int], v: Any, col: Collection):
         raise NotImplementedError('please implement append_value')
 
+    def bulk_items(self, value: Collection) -> Optional[list]:
+        """Get the items of a collection as a list which is indexed by the
+        keys of the items. Collections which cannot be handled in bulk return
+        None.
+        """
+        return None
+
     def to_object_key(self, key: T, conf: JConf) -> T:
         return key
 
@@ -57,7 +65,17 @@ class CollectionTypeModifier(TypeModifier):
             ctx.ctxcfg.all_fields,
             ctx.cdefowner.jconf.validate_all_fields] if b is not None)
         vmsgctor = VMsgCollector()
-        for i, v in self.enumerator(ctx.val):
+        items = None if ctx.fdef.is_ref else self.bulk_items(ctx.val)
+        vector = itypes.modifier.vector_validator
+        indices = None
+        if items is not None and vector is not None:
+            indices = vector(items)
+        if indices is None:
+            pairs = self.enumerator(ctx.val)
+        else:
+            # only the items which may be invalid are validated
+            pairs = ((i, items[i]) for i in indices)
+        for i, v in pairs:
             try:
                 ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
                 itypes.modifier.validate(ictx)
@@ -78,6 +96,11 @@ class CollectionTypeModifier(TypeModifier):
         if not isinstance(ctx.val, self.cls):
             return ctx.val
         itypes = ctx.fdef.item_types
+        items = None if ctx.fdef.is_ref else self.bulk_items(ctx.val)
+        if items is not None:
+            retval = self._bulk_transform(items, itypes.modifier)
+            if retval is not None:
+                return retval
         retval = self.empty_collection()
         for i, v in self.enumerator(ctx.val):
             if self.should_special_handle(i, v, ctx):
@@ -89,12 +112,32 @@ class CollectionTypeModifier(TypeModifier):
                     self.to_object_key(i, ctx.owner.cdef.jconf), tsfmd, retval)
         return retval
 
+    def _bulk_transform(self, items: list, modifier: Any) -> Optional[list]:
+        vector = modifier.vector_transformer
+        if vector is not None:
+            retval = vector(items)
+            if retval is not None:
+                return retval
+        bulk = modifier.bulk_transformer
+        if bulk is None:
+            return None
+        try:
+            return [bulk(v) for v in items]
+        except ValueError:
+            # transform item by item to report the invalid item
+            return None
+
     def tojson(self, ctx: Ctx) -> Any:
         if ctx.val is None:
             return None
         if not isinstance(ctx.val, self.cls):
             return ctx.val
         itypes = ctx.fdef.item_types
+        bulk = itypes.modifier.bulk_tojson
+        if bulk is not None:
+            items = self.bulk_items(ctx.val)
+            if items is not None:
+                return [bulk(v) for v in items]
         retval = self.empty_collection()
         for i, v in self.enumerator(ctx.val):
             ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
@@ -103,6 +146,32 @@ class CollectionTypeModifier(TypeModifier):
                     self.to_json_key(i, ctx.owner.cdef.jconf), tsfmd, retval)
         return retval
 
+    def iter_tojson(self, ctx: Ctx) -> Optional[Iterator[tuple]]:
+        """Stream the items of the collection like `tojson` outputs them.
+
+        Returns:
+            Optional[Iterator[tuple]]: The JSON key, the value, the chain and \
+                the context of each item, or None if the value isn't a \
+                collection of this type.
+        """
+        if ctx.val is None or not isinstance(ctx.val, self.cls):
+            return None
+        return self._iter_tojson(ctx)
+
+    def _iter_tojson(self, ctx: Ctx) -> Iterator[tuple]:
+        itypes = ctx.fdef.item_types
+        bulk = itypes.modifier.bulk_tojson
+        if bulk is not None:
+            items = self.bulk_items(ctx.val)
+            if items is not None:
+                for i, v in enumerate(items):
+                    yield i, bulk(v), None, None
+                return
+        jconf = ctx.owner.cdef.jconf
+        for i, v in self.enumerator(ctx.val):
+            ictx = ctx.colval(v, i, itypes.fdef, ctx.val)
+            yield self.to_json_key(i, jconf), v, itypes.modifier, ictx
+
     def serialize(self, ctx: Ctx) -> Any:
         if ctx.val is None:
             return None
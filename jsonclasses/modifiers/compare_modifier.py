@@ -1,7 +1,7 @@
 """module for compare modifier."""
 from __future__ import annotations
 from typing import Callable, cast, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -14,10 +14,11 @@ class CompareModifier(Modifier):
     def __init__(self, compare_callable: Callable) -> None:
         if not callable(compare_callable):
             raise ValueError('compare argument is not callable')
-        params_len = len(signature(compare_callable).parameters)
+        params_len = arity(compare_callable)
         if params_len < 2 or params_len > 3:
             raise ValueError('not a valid compare callable')
         self.compare_callable = compare_callable
+        self.params_len = params_len
 
     def validate(self, ctx: Ctx) -> None:
         from ..jobject import JObject
@@ -26,7 +27,7 @@ class CompareModifier(Modifier):
         if name not in parent.previous_values:
             return
         prev_value = parent.previous_values[cast(str, name)]
-        params_len = len(signature(self.compare_callable).parameters)
+        params_len = self.params_len
         if params_len == 2:
             result = self.compare_callable(prev_value, ctx.val)
         elif params_len == 3:
@@ -1,8 +1,9 @@
 """module for date modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from datetime import date, datetime
 from ..fdef import FType
+from ..dtutils import parse_date, format_date
 from .type_modifier import TypeModifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -17,22 +18,29 @@ class DateModifier(TypeModifier):
         self.ftype = FType.DATE
 
     def transform(self, ctx: Ctx) -> Any:
-        if ctx.val is None:
-            return None
-        elif isinstance(ctx.val, str):
-            try:
-                return date.fromisoformat(ctx.val[:10])
-            except ValueError:
-                ctx.raise_vexc('wrong date format')
-        elif type(ctx.val) == datetime:
-            return date(ctx.val.year,
-                        ctx.val.month,
-                        ctx.val.day)
-        else:
-            return ctx.val
+        try:
+            return _transform(ctx.val)
+        except ValueError:
+            ctx.raise_vexc('wrong date format')
 
     def tojson(self, ctx: Ctx) -> Any:
-        return None if ctx.val is None else self._jsondate(ctx.val)
+        return None if ctx.val is None else format_date(ctx.val)
 
-    def _jsondate(self, d: date) -> str:
-        return d.isoformat() + 'T00:00:00.000Z'
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        return _transform
+
+    def pure_tojson(self) -> Optional[Callable[[Any], Any]]:
+        return _tojson
+
+
+def _transform(val: Any) -> Any:
+    if isinstance(val, str):
+        return parse_date(val)
+    elif type(val) is datetime:
+        return date(val.year, val.month, val.day)
+    else:
+        return val
+
+
+def _tojson(val: Any) -> Any:
+    return None if val is None else format_date(val)
@@ -1,8 +1,9 @@
 """module for datetime modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
-from datetime import date, datetime, timezone
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from datetime import date, datetime
 from ..fdef import FType
+from ..dtutils import UTC, parse_datetime, format_datetime
 from .type_modifier import TypeModifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -17,21 +18,29 @@ class DatetimeModifier(TypeModifier):
         self.ftype = FType.DATETIME
 
     def transform(self, ctx: Ctx) -> Any:
-        if ctx.val is None:
-            return None
-        elif isinstance(ctx.val, str):
-            try:
-                retval = datetime.fromisoformat(ctx.val.replace('Z', ''))
-                return retval.replace(tzinfo=timezone.utc)
-            except ValueError:
-                ctx.raise_vexc('wrong datetime format')
-        elif type(ctx.val) is date:
-            retval = datetime(ctx.val.year,
-                              ctx.val.month,
-                              ctx.val.day, 0, 0, 0)
-            return retval.replace(tzinfo=timezone.utc)
-        else:
-            return ctx.val
+        try:
+            return _transform(ctx.val)
+        except ValueError:
+            ctx.raise_vexc('wrong datetime format')
 
     def tojson(self, ctx: Ctx) -> Any:
-        return None if ctx.val is None else ctx.val.isoformat()[:23] + 'Z'
+        return None if ctx.val is None else format_datetime(ctx.val)
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        return _transform
+
+    def pure_tojson(self) -> Optional[Callable[[Any], Any]]:
+        return _tojson
+
+
+def _transform(val: Any) -> Any:
+    if isinstance(val, str):
+        return parse_datetime(val)
+    elif type(val) is date:
+        return datetime(val.year, val.month, val.day, tzinfo=UTC)
+    else:
+        return val
+
+
+def _tojson(val: Any) -> Any:
+    return None if val is None else format_datetime(val)
@@ -1,6 +1,6 @@
 """module for default modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING, Callable
+from typing import Any, Optional, TYPE_CHECKING, Callable
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -20,3 +20,15 @@ class DefaultModifier(Modifier):
             return self.default()
         else:
             return self.resolve_param(self.default, ctx)
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        default = self.default
+        if callable(default):
+            def transformer(val: Any) -> Any:
+                return default() if val is None else val
+            return transformer
+        if not self.is_const_param(default):
+            return None
+        def transformer(val: Any) -> Any:
+            return default if val is None else val
+        return transformer
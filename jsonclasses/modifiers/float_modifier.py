@@ -1,6 +1,6 @@
 """module for float modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from .type_modifier import TypeModifier
 from ..fdef import FType
 if TYPE_CHECKING:
@@ -21,3 +21,13 @@ class FloatModifier(TypeModifier):
         if type(ctx.val) is int:
             return float(ctx.val)
         return ctx.val
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        def transformer(val: Any) -> Any:
+            if type(val) is int:
+                return float(val)
+            return val
+        return transformer
+
+    def vector_transformer(self) -> Optional[Callable[[Any], Any]]:
+        return lambda arr: arr
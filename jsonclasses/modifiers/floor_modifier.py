@@ -1,6 +1,6 @@
 """module for floor modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from math import floor
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -12,3 +12,9 @@ class FloorModifier(Modifier):
     def transform(self, ctx: Ctx) -> Any:
         is_number = type(ctx.val) is int or type(ctx.val) is float
         return floor(ctx.val) if is_number else ctx.val
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        def transformer(val: Any) -> Any:
+            is_number = type(val) is int or type(val) is float
+            return floor(val) if is_number else val
+        return transformer
@@ -1,7 +1,7 @@
 """module for fmt modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..types import Types
@@ -13,11 +13,13 @@ class FmtModifier(Modifier):
 
     def __init__(self, formatter: Callable | Types) -> None:
         super().__init__()
+        params_len = 0
         if callable(formatter):
-            params_len = len(signature(formatter).parameters)
+            params_len = arity(formatter)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid formatter callable')
         self.formatter = formatter
+        self.params_len = params_len
 
     def tojson(self, ctx: Ctx) -> Any:
         from ..types import Types
@@ -25,7 +27,7 @@ class FmtModifier(Modifier):
             return self.formatter.modifier.transform(ctx)
         if ctx.val is None:
             return None
-        params_len = len(signature(self.formatter).parameters)
+        params_len = self.params_len
         if params_len == 1:
             return self.formatter(ctx.val)
         elif params_len == 2:
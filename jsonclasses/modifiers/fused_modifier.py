@@ -0,0 +1,57 @@
+"""module for fused modifier."""
+from __future__ import annotations
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from .modifier import Modifier
+if TYPE_CHECKING:
+    from ..ctx import Ctx
+
+
+PureTransformer = Callable[[Any], Any]
+PureValidator = Callable[[Any], Optional[str]]
+
+
+class FusedModifier(Modifier):
+    """Fused modifier runs adjacent pure modifiers of a chain as one step. It
+    applies the pure transformers and the pure validators of the modifiers to
+    the value directly. Each step has a pure transformer, a pure validator or
+    both of them.
+    """
+
+    def __init__(self,
+                 modifiers: list[Modifier],
+                 steps: list[tuple[Optional[PureTransformer],
+                                   Optional[PureValidator]]]) -> None:
+        self.vs = modifiers
+        self.steps = tuple(steps)
+        self.validators = tuple(v for _, v in steps if v is not None)
+
+    def validate(self, ctx: Ctx) -> None:
+        val = ctx.val
+        msg = None
+        all_fields = ctx.ctxcfg.all_fields
+        for validator in self.validators:
+            vmsg = validator(val)
+            if vmsg is not None:
+                msg = vmsg
+                if not all_fields:
+                    break
+        if msg is not None:
+            ctx.raise_vexc(msg)
+
+    def transform(self, ctx: Ctx) -> Any:
+        """Transform the value with each step. Validators of steps validate
+        the value as it's transformed, like eager validation does.
+        """
+        val = ctx.val
+        for i, (transformer, validator) in enumerate(self.steps):
+            if transformer is not None:
+                try:
+                    val = transformer(val)
+                except ValueError:
+                    # let the modifier report the invalid value
+                    val = self.vs[i].transform(ctx.nval(val))
+            if validator is not None:
+                msg = validator(val)
+                if msg is not None:
+                    ctx.raise_vexc(msg)
+        return val
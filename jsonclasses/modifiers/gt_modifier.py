@@ -1,6 +1,7 @@
 """module for gt modifier."""
 from __future__ import annotations
-from typing import Callable, Union, TYPE_CHECKING
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
+from ..vector import isnumber
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -18,3 +19,8 @@ class GtModifier(Modifier):
         if is_number and ctx.val <= self.resolve_param(self.gt_value, ctx):
             ctx.raise_vexc('value is not greater than '
                            f'{self.gt_value}')
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if not isnumber(self.gt_value):
+            return None
+        return (('gt', self.gt_value),)
@@ -1,17 +1,20 @@
 """module for hexcolor modifier."""
 from __future__ import annotations
 from typing import Any, cast, TYPE_CHECKING
-from re import compile, match
 from .modifier import Modifier
+from ..rcache import RPattern
 if TYPE_CHECKING:
     from ..ctx import Ctx
 
 
-hex_color_regex = compile('[0-9a-fA-F]{6}')
+hex_color_pattern = '[0-9a-fA-F]{6}'
 
 class HexColorModifier(Modifier):
     """Email modifier raises if value is not valid email."""
 
+    def __init__(self) -> None:
+        self.regex = RPattern(hex_color_pattern)
+
     def transform(self, ctx: Ctx) -> Any:
         if type(ctx.val) is str:
             strval = cast(str, ctx.val)
@@ -20,5 +23,5 @@ class HexColorModifier(Modifier):
         return ctx.val
 
     def validate(self, ctx: Ctx) -> None:
-        if isinstance(ctx.val, str) and match(hex_color_regex, ctx.val) is None:
+        if isinstance(ctx.val, str) and self.regex.compiled.match(ctx.val) is None:
             ctx.raise_vexc('value is not hex color string')
\ No newline at end of file
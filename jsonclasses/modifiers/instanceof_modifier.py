@@ -1,11 +1,8 @@
 """module for instanceof modifier."""
 from __future__ import annotations
 from jsonclasses.vmsgcollector import VMsgCollector
-from jsonclasses.jfield import JField
-from typing import Any, Sequence, Union, cast, TYPE_CHECKING
-from ..fdef import (
-    FDef, FStore, FType, Nullability, WriteRule, ReadRule, Strictness
-)
+from typing import Any, Iterator, Optional, Union, cast, TYPE_CHECKING
+from ..fdef import FDef, FStore, FType, Strictness
 from ..excs import ValidationException
 from .modifier import Modifier
 from ..keypath import concat_keypath, initial_keypaths
@@ -45,13 +42,21 @@ class InstanceOfModifier(Modifier):
             modified_fields = list(initial_keypaths((ctx.val.modified_fields)))
         ctor = VMsgCollector()
         val = cast(JObject, ctx.val)
-        for field in val.__class__.cdef.fields:
+        cdef = val.__class__.cdef
+        # an object which hasn't changed since its last successful validation
+        # doesn't validate the fields which are valid as long as they don't
+        # change
+        skips = cdef.leaf_field_names \
+            if not val.is_new and val._valid_at >= val._version else ()
+        for field in cdef.fields:
             fname = field.name
             ffdef = field.fdef
-            fval = getattr(ctx.val, fname)
+            if fname in skips:
+                continue
             if field.fdef.fstore == FStore.EMBEDDED:
                 if only_validate_modified and fname not in modified_fields:
                     continue
+            fval = getattr(ctx.val, fname)
             try:
                 if field.fdef.ftype == FType.INSTANCE:
                     fval_ctx = ctx.nexto(fval, fname, ffdef)
@@ -73,26 +78,8 @@ class InstanceOfModifier(Modifier):
                 kp = concat_keypath(ctx.skeypathr, k)
                 ctx.raise_mvexc({kp: 'key is not allowed'})
 
-    def _fill_default_value(self, field: JField, dest: JObject, ctx: Ctx):
-        if field.default is not None:
-            setattr(dest, field.name, field.default)
-        else:
-            dctx = ctx.default(ctx.original, field.name, field.fdef)
-            tsfmd = field.types.modifier.transform(dctx)
-            setattr(dest, field.name, tsfmd)
-
-    def _has_field_value(self, field: JField, keys: Sequence[str]) -> bool:
-        return field.json_name in keys or field.name in keys
-
-    def _get_field_value(self, field: JField, ctx: Ctx) -> Any:
-        field_value = ctx.val.get(field.json_name)
-        if field_value is None:
-            field_value = ctx.val.get(field.name)
-        return field_value
-
     # pylint: disable=arguments-differ, too-many-locals, too-many-branches
     def transform(self, ctx: Ctx) -> Any:
-        from ..types import Types
         from ..jobject import JObject
         # handle non normal value
         if ctx.val is None:
@@ -124,117 +111,60 @@ class InstanceOfModifier(Modifier):
             dest = cls()
             ctx.mgraph.put(dest)
 
-        # strictness check
-        strictness = cast(bool, cls.cdef.jconf.strict_input)
-        if ctx.fdef is not None:
-            if ctx.fdef.strictness == Strictness.STRICT:
-                strictness = True
-            elif ctx.fdef.strictness == Strictness.UNSTRICT:
-                strictness = False
+        self.fill(ctx, dest, soft_apply_mode, self.strictness(ctx.fdef, cls))
+        return dest
+
+    def strictness(self, fdef: Optional[FDef], cls: type[JObject]) -> bool:
+        """Figure out whether input keys are checked.
+
+        Args:
+            fdef (Optional[FDef]): The field definition of the object.
+            cls (type[JObject]): The class of the object.
+
+        Returns:
+            bool: Whether keys which are not available names raise.
+        """
+        if fdef is not None:
+            if fdef.strictness == Strictness.STRICT:
+                return True
+            elif fdef.strictness == Strictness.UNSTRICT:
+                return False
+        return cast(bool, cls.cdef.jconf.strict_input)
+
+    def fill(self, ctx: Ctx, dest: JObject, soft_apply_mode: bool,
+             strictness: bool) -> None:
+        """Check the keys of the input dict and assign its values to the
+        fields of the destination object.
+
+        Args:
+            ctx (Ctx): The transforming context whose value is the input dict.
+            dest (JObject): The object to assign values to.
+            soft_apply_mode (bool): Whether blank fields are left unfilled.
+            strictness (bool): Whether keys are checked.
+        """
         if strictness:
             self._strictness_check(ctx, dest)
-        # fill values
-        dict_keys = list(ctx.val.keys())
-        nonnull_ref_lists: list[str] = []
-        for field in dest.__class__.cdef.fields:
-            if not self._has_field_value(field, dict_keys):
-                if field.fdef.is_ref:
-                    fdef = field.fdef
-                    if fdef.ftype == FType.LIST:
-                        if fdef.collection_nullability == Nullability.NONNULL:
-                            nonnull_ref_lists.append(field.name)
-                    if fdef.fstore == FStore.LOCAL_KEY:
-                        tsfm = dest.__class__.cdef.jconf.ref_name_strategy
-                        refname = tsfm(field)
-                        if ctx.val.get(refname) is not None:
-                            setattr(dest, refname, ctx.val.get(refname))
-                        crefname = dest.__class__.cdef.jconf.output_key_strategy(refname)
-                        if ctx.val.get(crefname) is not None:
-                            setattr(dest, refname, ctx.val.get(crefname))
-                    pass
-                elif ctx.ctxcfg.fill_dest_blanks and not soft_apply_mode:
-                    if field.fdef.fstore != FStore.CALCULATED:
-                        self._fill_default_value(field, dest, ctx)
-                continue
-            field_value = self._get_field_value(field, ctx)
-            allow_write_field = True
-            if field.fdef.write_rule == WriteRule.NO_WRITE:
-                allow_write_field = False
-            if field.fdef.write_rule == WriteRule.WRITE_ONCE:
-                cfv = getattr(dest, field.name)
-                if (cfv is not None) and (not isinstance(cfv, Types)):
-                    allow_write_field = False
-            if field.fdef.write_rule == WriteRule.WRITE_NONNULL:
-                if field_value is None:
-                    allow_write_field = False
-            if not allow_write_field:
-                if ctx.ctxcfg.fill_dest_blanks:
-                    if field.fdef.fstore != FStore.CALCULATED:
-                        self._fill_default_value(field, dest, ctx)
-                continue
-            fctx = ctx.nextvo(field_value, field.name, field.fdef, dest)
-            tsfmd = field.types.modifier.transform(fctx)
-            if field.fdef.fstore != FStore.CALCULATED:
-                setattr(dest, field.name, tsfmd)
-        for cname in nonnull_ref_lists:
-            if getattr(dest, cname) is None:
-                setattr(dest, cname, [])
-        return dest
+        dest.__class__.cdef.compiled_transform(ctx, dest, soft_apply_mode)
 
     def tojson(self, ctx: Ctx) -> Any:
         from ..jobject import JObject
         if ctx.val is None:
             return None
         val = cast(JObject, ctx.val)
-        retval = {}
-        clschain = ctx.idchain
-        cls_name = val.__class__.cdef.name
-        rr = ctx.ctxcfg.reverse_relationship
-        output_null = ctx.ctxcfg.output_null
-        if output_null is None:
-            output_null = val.cdef.jconf.output_null
-        no_key_refs = cls_name in clschain
-        for field in val.__class__.cdef.fields:
-            fval = getattr(val, field.name)
-            fd = field.types.fdef
-            jf_name = field.json_name
-            ignore_writeonly = ctx.ctxcfg.ignore_writeonly
-            isrf = False
-            if not rr:
-                if field.foreign_field:
-                    isrf = field.foreign_field.fdef == ctx.fdef
-                    if not isrf:
-                        if len(ctx.keypathr) > 1:
-                            key = ctx.keypathr[-2]
-                            isrf = field.foreign_field.name == key
-            if fd.fstore == FStore.LOCAL_KEY:
-                if val.is_partial:
-                    if field.name not in val._partial_picks:
-                        continue
-                rk = val.__class__.cdef.jconf.ref_name_strategy(field)
-                jrk = val.__class__.cdef.jconf.output_key_strategy(rk)
-                valatk = getattr(val, rk)
-                if output_null or (valatk is not None):
-                    retval[jrk] = valatk
-            if fd.fstore == FStore.LOCAL_KEY and (isrf or no_key_refs):
-                continue
-            if fd.fstore == FStore.FOREIGN_KEY and (isrf or no_key_refs):
-                continue
-            if fd.read_rule == ReadRule.NO_READ and not ignore_writeonly:
-                continue
-            if fd.fstore == FStore.TEMP:
-                continue
-            if val.is_partial:
-                if field.name not in val._partial_picks:
-                    continue
-            if field.fdef.ftype == FType.INSTANCE:
-                ictx = ctx.nextoc(fval, field.name, field.fdef, cls_name)
-            else:
-                ictx = ctx.nextvc(fval, field.name, field.fdef, cls_name)
-            field_value = field.types.modifier.tojson(ictx)
-            if output_null or (field_value is not None):
-                retval[jf_name] = field_value
-        return retval
+        return val.__class__.cdef.compiled_tojson(ctx, val)
+
+    def iter_tojson(self, ctx: Ctx) -> Optional[Iterator[tuple]]:
+        """Stream the fields of the object like `tojson` outputs them.
+
+        Returns:
+            Optional[Iterator[tuple]]: The JSON key, the value, the chain and \
+                the context of each field, or None if the value is None.
+        """
+        from ..jobject import JObject
+        if ctx.val is None:
+            return None
+        val = cast(JObject, ctx.val)
+        return val.__class__.cdef.compiled_iter_tojson(ctx, val)
 
     def serialize(self, ctx: Ctx) -> Any:
         from ..jobject import JObject
@@ -1,7 +1,10 @@
 """module for listof modifier."""
 from __future__ import annotations
-from typing import Any, Collection, Iterable, TYPE_CHECKING
+from typing import (
+    Any, Collection, Iterable, Iterator, Optional, TYPE_CHECKING
+)
 from ..fdef import FDef, FStore, FType, Nullability
+from ..plist import PackedList
 from .collection_type_modifier import CollectionTypeModifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -21,6 +24,21 @@ class ListOfModifier(CollectionTypeModifier):
             if fdef._collection_nullability is Nullability.UNDEFINED:
                 fdef._collection_nullability = Nullability.NONNULL
 
+    def validate(self, ctx: Ctx) -> None:
+        super().validate(_unpacked(ctx))
+
+    def transform(self, ctx: Ctx) -> Any:
+        return super().transform(_unpacked(ctx))
+
+    def tojson(self, ctx: Ctx) -> Any:
+        return super().tojson(_unpacked(ctx))
+
+    def iter_tojson(self, ctx: Ctx) -> Optional[Iterator[tuple]]:
+        return super().iter_tojson(_unpacked(ctx))
+
+    def serialize(self, ctx: Ctx) -> Any:
+        return super().serialize(_unpacked(ctx))
+
     def enumerator(self, value: list) -> Iterable:
         return enumerate(value)
 
@@ -30,6 +48,9 @@ class ListOfModifier(CollectionTypeModifier):
     def append_value(self, i: int, v: Any, col: list):
         col.append(v)
 
+    def bulk_items(self, value: list) -> list:
+        return value
+
     def should_special_handle(self, key: Any, v: Any, ctx: Ctx) -> bool:
         is_lkey = ctx.fdef.fstore == FStore.LOCAL_KEY
         is_fkey = ctx.fdef.fstore == FStore.FOREIGN_KEY
@@ -51,3 +72,9 @@ class ListOfModifier(CollectionTypeModifier):
                 ctx.owner._add_link_key(fname, v['_add'])
             elif '_del' in v:
                 ctx.owner._add_unlink_key(fname, v['_del'])
+
+
+def _unpacked(ctx: Ctx) -> Ctx:
+    if isinstance(ctx.val, PackedList):
+        return ctx.nval(ctx.val.tolist())
+    return ctx
@@ -1,6 +1,7 @@
 """module for lt modifier."""
 from __future__ import annotations
-from typing import Callable, Union, TYPE_CHECKING
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
+from ..vector import isnumber
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -17,3 +18,8 @@ class LtModifier(Modifier):
         is_number = type(ctx.val) is int or type(ctx.val) is float
         if is_number and ctx.val >= self.resolve_param(self.lt_value, ctx):
             ctx.raise_vexc(f'value is not less than {self.resolve_param(self.lt_value, ctx)}')
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if not isnumber(self.lt_value):
+            return None
+        return (('lt', self.lt_value),)
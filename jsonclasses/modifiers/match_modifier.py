@@ -1,9 +1,10 @@
 """module for match modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable
-from re import search
+from typing import Callable, Any, Optional, TYPE_CHECKING
+from re import Pattern
 from ..excs import ValidationException
 from .modifier import Modifier
+from ..rcache import RPattern, rcompile, rsource
 if TYPE_CHECKING:
     from ..ctx import Ctx
     from ..types import Types
@@ -12,10 +13,27 @@ if TYPE_CHECKING:
 class MatchModifier(Modifier):
     """Match modifier validates value against pattern."""
 
-    def __init__(self, pattern: str | Callable | Types) -> None:
+    def __init__(self, pattern: str | Pattern | Callable | Types) -> None:
         self.pattern = pattern
+        self.regex = None
+        if self.is_const_param(pattern):
+            self.regex = RPattern(pattern)
 
     def validate(self, ctx: Ctx) -> None:
-        pattern = self.resolve_param(self.pattern, ctx)
-        if isinstance(ctx.val, str) and search(pattern, ctx.val) is None:
-            ctx.raise_vexc(f'value does not match \'{pattern}\'')
+        if self.regex is not None:
+            regex = self.regex.compiled
+        else:
+            regex = rcompile(self.resolve_param(self.pattern, ctx))
+        if isinstance(ctx.val, str) and regex.search(ctx.val) is None:
+            ctx.raise_vexc(f'value does not match \'{rsource(regex)}\'')
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if not self.is_const_param(self.pattern):
+            return None
+        regex = self.regex
+        msg = f'value does not match \'{regex.source}\''
+        def validator(val: Any) -> Optional[str]:
+            if isinstance(val, str) and regex.compiled.search(val) is None:
+                return msg
+            return None
+        return validator
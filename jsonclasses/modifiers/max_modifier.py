@@ -1,6 +1,7 @@
 """module for max modifier."""
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Any, Optional, TYPE_CHECKING
+from ..vector import isnumber
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -17,3 +18,18 @@ class MaxModifier(Modifier):
         is_number = type(ctx.val) is int or type(ctx.val) is float
         if is_number and ctx.val > self.resolve_param(self.max_value, ctx):
             ctx.raise_vexc(f'value is not less than or equal {self.resolve_param(self.max_value, ctx)}')
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if not self.is_const_param(self.max_value):
+            return None
+        max_value = self.max_value
+        msg = f'value is not less than or equal {max_value}'
+        def validator(val: Any) -> Optional[str]:
+            is_number = type(val) is int or type(val) is float
+            return msg if is_number and val > max_value else None
+        return validator
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if not isnumber(self.max_value):
+            return None
+        return (('le', self.max_value),)
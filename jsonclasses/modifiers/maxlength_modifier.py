@@ -1,6 +1,6 @@
 """module for maxlength modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable
+from typing import Callable, Any, Optional, TYPE_CHECKING
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -19,3 +19,15 @@ class MaxlengthModifier(Modifier):
                 ctx.raise_vexc('length of value is not less than or equal '
                             f'{self.maxlength}')
         return ctx.val
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if not self.is_const_param(self.maxlength):
+            return None
+        maxlength = self.maxlength
+        msg = f'length of value is not less than or equal {maxlength}'
+        def validator(val: Any) -> Optional[str]:
+            if isinstance(val, list) or type(val) is str:
+                if len(val) > maxlength:
+                    return msg
+            return None
+        return validator
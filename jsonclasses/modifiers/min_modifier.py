@@ -1,6 +1,7 @@
 """module for min modifier."""
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Any, Optional, TYPE_CHECKING
+from ..vector import isnumber
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -18,3 +19,18 @@ class MinModifier(Modifier):
         if is_number and ctx.val < self.resolve_param(self.min_value, ctx):
             ctx.raise_vexc('value is not greater than or equal '
                            f'{self.resolve_param(self.min_value, ctx)}')
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if not self.is_const_param(self.min_value):
+            return None
+        min_value = self.min_value
+        msg = f'value is not greater than or equal {min_value}'
+        def validator(val: Any) -> Optional[str]:
+            is_number = type(val) is int or type(val) is float
+            return msg if is_number and val < min_value else None
+        return validator
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if not isnumber(self.min_value):
+            return None
+        return (('ge', self.min_value),)
@@ -1,6 +1,6 @@
 """module for minlength modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable
+from typing import Callable, Any, Optional, TYPE_CHECKING
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -19,3 +19,15 @@ class MinlengthModifier(Modifier):
                 ctx.raise_vexc('length of value is not greater than or equal '
                             f'{self.minlength}')
         return ctx.val
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if not self.is_const_param(self.minlength):
+            return None
+        minlength = self.minlength
+        msg = f'length of value is not greater than or equal {minlength}'
+        def validator(val: Any) -> Optional[str]:
+            if isinstance(val, list) or type(val) is str:
+                if len(val) < minlength:
+                    return msg
+            return None
+        return validator
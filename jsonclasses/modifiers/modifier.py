@@ -1,7 +1,7 @@
 """module for modifier modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
-from inspect import signature
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from ..arity import arity
 from ..fdef import FDef
 from ..pkgutils import check_and_install_packages
 if TYPE_CHECKING:
@@ -23,7 +23,7 @@ class Modifier:
             newctx = ctx.nval(None)
             return param.modifier.transform(newctx)
         elif callable(param):
-            params_len = len(signature(param).parameters)
+            params_len = arity(param)
             if params_len == 0:
                 return param()
             elif params_len == 1:
@@ -35,6 +35,51 @@ class Modifier:
         else:
             return param
 
+    def is_const_param(self, param: Any) -> bool:
+        """Check whether a parameter resolves to itself without a context."""
+        from ..types import Types
+        return not isinstance(param, Types) and not callable(param)
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        """A modifier which transforms values without the context returns a
+        function which takes a value and returns the transformed value.
+        Chained modifiers fuse adjacent pure transformers into one step. A
+        pure transformer may raise ValueError on an invalid value, then the
+        modifier's transform is run to report the error.
+        """
+        return None
+
+    def pure_tojson(self) -> Optional[Callable[[Any], Any]]:
+        """A modifier which converts values to JSON without the context
+        returns a function which takes a value and returns the JSON value.
+        Collections convert their items in bulk with pure JSON converters.
+        """
+        return None
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        """A modifier which validates numbers against constant bounds returns
+        the bounds as pairs of an operator name and a bound. Operator names
+        are 'ge', 'gt', 'le' and 'lt'. Lists of numbers are validated in
+        bulk if every validator of the items has bounds.
+        """
+        return None
+
+    def vector_transformer(self) -> Optional[Callable[[Any], Any]]:
+        """A modifier which transforms floats with array arithmetic returns a
+        function which takes a float64 array and returns the transformed
+        array. Lists of floats are transformed in bulk if every transformer
+        of the items has an array function.
+        """
+        return None
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        """A modifier which validates values without the context returns a
+        function which takes a value and returns the error message, or None
+        if the value is valid. Chained modifiers fuse adjacent pure validators
+        into one step.
+        """
+        return None
+
     def define(self, fdef: FDef) -> None:
         """A hook and chance for modifier to update field description."""
 
@@ -1,6 +1,7 @@
 """module for mul modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING, Callable
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from ..vector import isexactfloat
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -14,3 +15,18 @@ class MulModifier(Modifier):
 
     def transform(self, ctx: Ctx) -> Any:
         return self.resolve_param(self.by, ctx) * ctx.val if type(ctx.val) is int or type(ctx.val) is float else ctx.val
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        if not self.is_const_param(self.by):
+            return None
+        by = self.by
+        def transformer(val: Any) -> Any:
+            is_number = type(val) is int or type(val) is float
+            return by * val if is_number else val
+        return transformer
+
+    def vector_transformer(self) -> Optional[Callable[[Any], Any]]:
+        by = self.by
+        if not isexactfloat(by):
+            return None
+        return lambda arr: arr * by
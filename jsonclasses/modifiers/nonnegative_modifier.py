@@ -1,6 +1,6 @@
 """module for nonnegative modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -15,3 +15,6 @@ class NonnegativeModifier(Modifier):
         is_number = type(ctx.val) is int or type(ctx.val) is float
         if is_number and ctx.val < 0:
             ctx.raise_vexc('value is not nonnegative')
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        return (('ge', 0),)
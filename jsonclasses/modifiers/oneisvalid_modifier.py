@@ -1,7 +1,7 @@
 """module for or modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from ..excs import ValidationException
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -16,7 +16,7 @@ class OneIsValidModifier(Modifier):
     def __init__(self, subroutines: list[Callable | Types]) -> None:
         for item in subroutines:
             if callable(item):
-                params_len = len(signature(item).parameters)
+                params_len = arity(item)
                 if params_len > 2 or params_len < 1:
                     raise ValueError('not a valid or subroutine callable')
         self.subroutines = subroutines
@@ -32,7 +32,7 @@ class OneIsValidModifier(Modifier):
                 except ValidationException:
                     continue
             else:
-                params_len = len(signature(item).parameters)
+                params_len = arity(item)
                 if params_len == 1:
                     result = callable(ctx.val)
                 elif params_len == 2:
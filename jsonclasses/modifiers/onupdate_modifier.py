@@ -1,7 +1,7 @@
 """module for onupdate modifier."""
 from __future__ import annotations
 from typing import Callable, Any, cast, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -15,7 +15,7 @@ class OnUpdateModifier(Modifier):
     def __init__(self, callback: Callable) -> None:
         if not callable(callback):
             raise ValueError('onupdate argument is not callable')
-        params_len = len(signature(callback).parameters)
+        params_len = arity(callback)
         if params_len > 3:
             raise ValueError('not a valid onupdate callable')
         self.callback = callback
@@ -27,7 +27,7 @@ class OnUpdateModifier(Modifier):
         if name not in parent.previous_values:
             return ctx.val
         prev_value = parent.previous_values[name]
-        params_len = len(signature(self.callback).parameters)
+        params_len = arity(self.callback)
         if params_len == 0:
             self.callback()
         elif params_len == 1:
@@ -1,7 +1,7 @@
 """module for onsave modifier."""
 from __future__ import annotations
 from typing import Callable, Any, cast, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -15,7 +15,7 @@ class OnWriteModifier(Modifier):
     def __init__(self, callback: Callable) -> None:
         if not callable(callback):
             raise ValueError('onwrite callback is not callable')
-        params_len = len(signature(callback).parameters)
+        params_len = arity(callback)
         if params_len > 2:
             raise ValueError('not a valid onwrite callback')
         self.callback = callback
@@ -26,7 +26,7 @@ class OnWriteModifier(Modifier):
         parent = cast(JObject, ctx.parent)
         if not parent.is_new and name not in parent.modified_fields:
             return ctx.val
-        params_len = len(signature(self.callback).parameters)
+        params_len = arity(self.callback)
         if params_len == 0:
             self.callback()
         elif params_len == 1:
@@ -0,0 +1,10 @@
+"""module for packed modifier."""
+from ..fdef import FDef
+from .modifier import Modifier
+
+
+class PackedModifier(Modifier):
+    """Packed modifier marks a list field of ints or floats is packed."""
+
+    def define(self, fdef: FDef) -> None:
+        fdef._packed = True
@@ -1,6 +1,7 @@
 """module for range modifier."""
 from __future__ import annotations
-from typing import Callable, Union, TYPE_CHECKING
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
+from ..vector import isnumber
 from .modifier import Modifier
 from .min_modifier import MinModifier
 from .max_modifier import MaxModifier
@@ -21,3 +22,8 @@ class RangeModifier(Modifier):
             return
         MinModifier(self.resolve_param(self.min, ctx)).validate(ctx)
         MaxModifier(self.resolve_param(self.max, ctx)).validate(ctx)
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if not isnumber(self.min) or not isnumber(self.max):
+            return None
+        return (('ge', self.min), ('le', self.max))
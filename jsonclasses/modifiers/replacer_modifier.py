@@ -1,8 +1,9 @@
 """module for replacer modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable
-from re import sub
+from re import Pattern
 from .modifier import Modifier
+from ..rcache import RPattern, rcompile
 if TYPE_CHECKING:
     from ..ctx import Ctx
     from ..types import Types
@@ -10,11 +11,19 @@ if TYPE_CHECKING:
 class ReplacerModifier(Modifier):
     """Sub modifier substitudes value against a regular expression."""
 
-    def __init__(self, reg: str | Callable | Types, rep: str | Callable | Types) -> None:
+    def __init__(self, reg: str | Pattern | Callable | Types, rep: str | Callable | Types) -> None:
         self.reg = reg
         self.rep = rep
+        self.regex = None
+        if self.is_const_param(reg):
+            self.regex = RPattern(reg)
 
     def transform(self, ctx: Ctx) -> Any:
-        reg = self.resolve_param(self.reg, ctx)
+        if type(ctx.val) is not str:
+            return ctx.val
+        if self.regex is not None:
+            regex = self.regex.compiled
+        else:
+            regex = rcompile(self.resolve_param(self.reg, ctx))
         rep = self.resolve_param(self.rep, ctx)
-        return sub(reg, rep, ctx.val) if type(ctx.val) is str else ctx.val
+        return regex.sub(rep, ctx.val)
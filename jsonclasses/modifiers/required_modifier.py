@@ -1,6 +1,6 @@
 """module for required modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from ..fdef import FDef
 from .modifier import Modifier
 from ..fdef import FStore
@@ -41,3 +41,7 @@ class RequiredModifier(Modifier):
             return
         if ctx.val is None:
             ctx.raise_vexc('value required')
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        # items of a bulk validated list are all numbers
+        return ()
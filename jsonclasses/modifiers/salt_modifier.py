@@ -1,6 +1,8 @@
 """module for salt modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
+from ..fdef import FDef
+from ..pwhash import hashpw
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -14,8 +16,10 @@ class SaltModifier(Modifier):
     def packages(self) -> dict[str, (str, str)] | None:
         return {'bcrypt': ('bcrypt', '>=3.2.0,<4.0.0')}
 
+    def define(self, fdef: FDef) -> None:
+        fdef._salted = True
+
     def transform(self, ctx: Ctx) -> Any:
-        from bcrypt import hashpw, gensalt
         if type(ctx.val) is str:
-            return hashpw(ctx.val.encode(), gensalt()).decode('utf-8')
+            return hashpw(ctx.val)
         return ctx.val
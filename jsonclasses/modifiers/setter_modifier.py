@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
-from inspect import signature
+from ..arity import arity
 from ..fdef import FStore, FDef
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -17,7 +17,7 @@ class SetterModifier(Modifier):
         if not isinstance(calc, Types):
             if not callable(calc):
                 raise ValueError('setter is not callable')
-            params_len = len(signature(calc).parameters)
+            params_len = arity(calc)
             if params_len != 2:
                 raise ValueError('not a valid setter')
 
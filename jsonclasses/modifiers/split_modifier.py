@@ -1,6 +1,7 @@
 """module for split modifier."""
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable
+from re import Pattern
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -10,8 +11,13 @@ if TYPE_CHECKING:
 class SplitModifier(Modifier):
     """Split modifier split value."""
 
-    def __init__(self, sep: str | Callable | Types) -> None:
+    def __init__(self, sep: str | Pattern | Callable | Types) -> None:
         self.sep = sep
 
     def transform(self, ctx: Ctx) -> Any:
-        return ctx.val.split(self.resolve_param(self.sep, ctx)) if type(ctx.val) is str else ctx.val
+        if type(ctx.val) is not str:
+            return ctx.val
+        sep = self.resolve_param(self.sep, ctx)
+        if sep is None or isinstance(sep, str):
+            return ctx.val.split(sep)
+        return sep.split(ctx.val)
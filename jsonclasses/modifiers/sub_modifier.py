@@ -1,6 +1,7 @@
 """module for sub modifier."""
 from __future__ import annotations
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from ..vector import isexactfloat
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -14,3 +15,18 @@ class SubModifier(Modifier):
 
     def transform(self, ctx: Ctx) -> Any:
         return ctx.val - self.resolve_param(self.by, ctx) if type(ctx.val) is int or type(ctx.val) is float else ctx.val
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        if not self.is_const_param(self.by):
+            return None
+        by = self.by
+        def transformer(val: Any) -> Any:
+            is_number = type(val) is int or type(val) is float
+            return val - by if is_number else val
+        return transformer
+
+    def vector_transformer(self) -> Optional[Callable[[Any], Any]]:
+        by = self.by
+        if not isexactfloat(by):
+            return None
+        return lambda arr: arr - by
@@ -1,6 +1,6 @@
 """module for tolower modifier."""
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -11,3 +11,6 @@ class ToLowerModifier(Modifier):
 
     def transform(self, ctx: Ctx) -> Any:
         return ctx.val.lower() if isinstance(ctx.val, str) else ctx.val
+
+    def pure_transformer(self) -> Optional[Callable[[Any], Any]]:
+        return lambda val: val.lower() if isinstance(val, str) else val
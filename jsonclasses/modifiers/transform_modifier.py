@@ -1,7 +1,7 @@
 """module for transform modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 if TYPE_CHECKING:
     from ..ctx import Ctx
@@ -13,15 +13,17 @@ class TransformModifier(Modifier):
 
     def __init__(self, transformer: Callable | Types) -> None:
         from ..types import Types
+        self.params_len = 0
         if isinstance(transformer, Types):
             self.transformer = transformer
         else:
             if not callable(transformer):
                 raise ValueError('transformer is not callable')
-            params_len = len(signature(transformer).parameters)
+            params_len = arity(transformer)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
             self.transformer = transformer
+            self.params_len = params_len
 
     def transform(self, ctx: Ctx) -> Any:
         from ..types import Types
@@ -29,7 +31,7 @@ class TransformModifier(Modifier):
             return self.transformer.modifier.transform(ctx)
         if ctx.val is None:
             return None
-        params_len = len(signature(self.transformer).parameters)
+        params_len = self.params_len
         if params_len == 1:
             return self.transformer(ctx.val)
         elif params_len == 2:
@@ -1,6 +1,6 @@
 """module for modifier modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from ..fdef import FDef, FType
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -28,3 +28,25 @@ class TypeModifier(Modifier):
             if isinstance(ctx.val, self.cls):
                 return
         ctx.raise_vexc(f'value is not {self.cls.__name__}')
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        if type(self).validate is not TypeModifier.validate:
+            return None
+        cls = self.cls
+        msg = f'value is not {cls.__name__}'
+        if self.exact_type:
+            def validator(val: Any) -> Optional[str]:
+                if val is None or type(val) is cls:
+                    return None
+                return msg
+        else:
+            def validator(val: Any) -> Optional[str]:
+                if val is None or isinstance(val, cls):
+                    return None
+                return msg
+        return validator
+
+    def vector_bounds(self) -> Optional[tuple[tuple[str, Any], ...]]:
+        if type(self).validate is not TypeModifier.validate:
+            return None
+        return () if self.cls is int or self.cls is float else None
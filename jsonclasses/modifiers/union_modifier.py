@@ -1,43 +1,139 @@
 """module for union modifier."""
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
+from datetime import date, datetime
 from ..excs import ValidationException
 from .modifier import Modifier
 from ..rtypes import rtypes
 from ..fdef import FDef, FType
 if TYPE_CHECKING:
     from ..ctx import Ctx
+    from ..types import Types
+
+
+INPUT_TYPES: dict[FType, tuple[type, ...]] = {
+    FType.STR: (str,),
+    FType.INT: (int,),
+    FType.FLOAT: (int, float),
+    FType.BOOL: (bool,),
+    FType.DATE: (str, date),
+    FType.DATETIME: (str, date),
+    FType.LIST: (list,),
+    FType.DICT: (dict,),
+}
+"""The input value types which each field type transforms."""
+
+
+VALUE_TYPES: dict[FType, tuple[type, ...]] = {
+    FType.STR: (str,),
+    FType.INT: (int,),
+    FType.FLOAT: (float,),
+    FType.BOOL: (bool,),
+    FType.DATE: (date,),
+    FType.DATETIME: (datetime,),
+    FType.LIST: (list,),
+    FType.DICT: (dict,),
+}
+"""The value types which each field type holds."""
+
+
+class UnionDispatch:
+    """The union dispatch finds the union types which may accept a value by
+    the runtime type of the value. A union type without known value types is
+    a candidate of any value. Candidates of each runtime type are figured out
+    once and keep the order of the union types.
+    """
+
+    def __init__(self: UnionDispatch,
+                 union_types: list[Types],
+                 discriminator: Optional[str]) -> None:
+        self.union_types = union_types
+        self.discriminator = discriminator
+        self.inputs: list[Optional[tuple[type, ...]]] = []
+        self.values: list[Optional[tuple[type, ...]]] = []
+        self.tags: dict[str, Types] = {}
+        for types in union_types:
+            ftype = types.fdef.ftype
+            if ftype == FType.INSTANCE:
+                cls = types.fdef.inst_cls
+                self.inputs.append((dict, cls))
+                self.values.append((cls,))
+                self.tags[cls.__name__] = types
+            else:
+                self.inputs.append(INPUT_TYPES.get(ftype))
+                self.values.append(VALUE_TYPES.get(ftype))
+        self.input_table: dict[type, tuple[Types, ...]] = {}
+        self.value_table: dict[type, tuple[Types, ...]] = {}
+
+    def input_candidates(self: UnionDispatch, val: Any) -> tuple[Types, ...]:
+        """The union types which may transform an input value."""
+        if self.discriminator is not None and type(val) is dict:
+            types = self.tags.get(val.get(self.discriminator))
+            if types is not None:
+                return (types,)
+        return self._lookup(self.input_table, self.inputs, type(val))
+
+    def value_candidates(self: UnionDispatch, val: Any) -> tuple[Types, ...]:
+        """The union types which may hold a value."""
+        return self._lookup(self.value_table, self.values, type(val))
+
+    def _lookup(self: UnionDispatch,
+                table: dict[type, tuple[Types, ...]],
+                accepts: list[Optional[tuple[type, ...]]],
+                cls: type) -> tuple[Types, ...]:
+        candidates = table.get(cls)
+        if candidates is None:
+            mro = cls.__mro__
+            candidates = tuple(types for types, accepted
+                               in zip(self.union_types, accepts)
+                               if accepted is None
+                               or any(t in mro for t in accepted))
+            table[cls] = candidates
+        return candidates
 
 
 class UnionModifier(Modifier):
     """Union type modifier validates value against a list of available types.
+    Values are dispatched to the available types by their runtime types. For
+    unions of JSON classes, a discriminator key of object inputs can name the
+    class to transform into.
     """
 
-    def __init__(self, type_list: list[Any]) -> None:
+    def __init__(self, type_list: list[Any],
+                 discriminator: Optional[str] = None) -> None:
         self.type_list = type_list
+        self.discriminator = discriminator
 
     def define(self, fdef: FDef) -> None:
         fdef._ftype = FType.UNION
         fdef._raw_union_types = [rtypes(t) for t in self.type_list]
+        fdef._union_discriminator = self.discriminator
+
+    def _dispatch(self, ctx: Ctx) -> UnionDispatch:
+        fdef = ctx.fdef
+        dispatch = fdef._union_dispatch
+        if dispatch is None:
+            if fdef._cdef is None:
+                fdef._cdef = ctx.owner.__class__.cdef
+            dispatch = UnionDispatch(fdef.union_types,
+                                     fdef.union_discriminator)
+            fdef._union_dispatch = dispatch
+        return dispatch
 
     def transform(self, ctx: Ctx) -> Any:
         if ctx.val is None:
             return None
-        for types in ctx.fdef.raw_union_types:
-            if types.fdef._cdef is None:
-                types.fdef._cdef = ctx.owner.__class__.cdef
+        for types in self._dispatch(ctx).input_candidates(ctx.val):
             try:
                 return types.modifier.transform(ctx.alterfdef(types.fdef))
-            except:
+            except Exception:
                 continue
         return ctx.val
 
     def validate(self, ctx: Ctx) -> None:
         if ctx.val is None:
             return
-        for types in ctx.fdef.raw_union_types:
-            if types.fdef._cdef is None:
-                types.fdef._cdef = ctx.owner.__class__.cdef
+        for types in self._dispatch(ctx).value_candidates(ctx.val):
             try:
                 types.modifier.validate(ctx.alterfdef(types.fdef))
                 return
@@ -45,30 +141,30 @@ class UnionModifier(Modifier):
                 continue
         ctx.raise_vexc('value is not of any provided type')
 
-    def serialize(self, ctx: Ctx) -> Any:
-        if ctx.val is None:
-            return None
-        for types in ctx.fdef.raw_union_types:
-            if types.fdef._cdef is None:
-                types.fdef._cdef = ctx.owner.__class__.cdef
+    def _matched(self, ctx: Ctx) -> Optional[Types]:
+        candidates = self._dispatch(ctx).value_candidates(ctx.val)
+        if len(candidates) == 1:
+            return candidates[0]
+        for types in candidates:
             try:
-                newctx = ctx.alterfdef(types.fdef)
-                types.modifier.validate(newctx)
-                return types.modifier.serialize(newctx)
+                types.modifier.validate(ctx.alterfdef(types.fdef))
+                return types
             except ValidationException:
                 continue
         return None
 
+    def serialize(self, ctx: Ctx) -> Any:
+        if ctx.val is None:
+            return None
+        types = self._matched(ctx)
+        if types is None:
+            return None
+        return types.modifier.serialize(ctx.alterfdef(types.fdef))
+
     def tojson(self, ctx: Ctx) -> Any:
         if ctx.val is None:
             return None
-        for types in ctx.fdef.raw_union_types:
-            if types.fdef._cdef is None:
-                types.fdef._cdef = ctx.owner.__class__.cdef
-            try:
-                newctx = ctx.alterfdef(types.fdef)
-                types.modifier.validate(newctx)
-                return types.modifier.tojson(newctx)
-            except ValidationException:
-                continue
-        return None
+        types = self._matched(ctx)
+        if types is None:
+            return None
+        return types.modifier.tojson(ctx.alterfdef(types.fdef))
@@ -1,7 +1,7 @@
 """module for uploader modifier."""
 from __future__ import annotations
 from typing import Callable, Any, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from .modifier import Modifier
 from ..fdef import FDef, FSubtype
 from ..uploaders import request_uploader, S3Uploader, AliOSSUploader
@@ -14,10 +14,12 @@ class UploaderModifier(Modifier):
 
     def __init__(self, arg: str | Callable) -> None:
         self.arg = arg
+        self.params_len = 0
         if callable(arg):
-            params_len = len(signature(arg).parameters)
+            params_len = arity(arg)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid transformer')
+            self.params_len = params_len
         else:
             self.check_packages()
 
@@ -39,7 +41,7 @@ class UploaderModifier(Modifier):
         if ctx.val is None:
             return None
         if callable(self.arg):
-            params_len = len(signature(self.arg).parameters)
+            params_len = self.params_len
             if params_len == 1:
                 return self.arg(ctx.val)
             elif params_len == 2:
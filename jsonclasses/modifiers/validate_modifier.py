@@ -1,7 +1,7 @@
 """module for vmsg modifier."""
 from __future__ import annotations
 from typing import Callable, TYPE_CHECKING
-from inspect import signature
+from ..arity import arity
 from ..excs import ValidationException
 from .modifier import Modifier
 if TYPE_CHECKING:
@@ -13,11 +13,13 @@ class ValidateModifier(Modifier):
     """On invalid, output message as error message."""
 
     def __init__(self, validator: Callable | Types, msg: str | None = None) -> None:
+        params_len = 0
         if callable(validator):
-            params_len = len(signature(validator).parameters)
+            params_len = arity(validator)
             if params_len > 2 or params_len < 1:
                 raise ValueError('not a valid modifier')
         self.validator = validator
+        self.params_len = params_len
         self.msg = msg if msg is not None else 'invalid value'
         self.use_msg = msg is not None
 
@@ -32,7 +34,7 @@ class ValidateModifier(Modifier):
                 ctx.raise_vexc(self.msg)
         if ctx.val is None:
             return
-        params_len = len(signature(self.validator).parameters)
+        params_len = self.params_len
         if params_len == 1:
             result = self.validator(ctx.val)
         elif params_len == 2:
@@ -45,3 +47,4 @@ class ValidateModifier(Modifier):
             ctx.raise_vexc(self.msg)
         if isinstance(result, str):
             ctx.raise_vexc(self.msg if self.use_msg else result)
+
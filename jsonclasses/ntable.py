@@ -0,0 +1,79 @@
+"""This module defines `NTable`, the name table of a JSON class. Key
+strategies are regular expression driven string transforms. A name table runs
+the output key strategy once for each name that a JSON class knows about and
+keeps the results, thus encoding known names is a dict lookup.
+"""
+from __future__ import annotations
+from typing import Callable
+from functools import lru_cache
+
+
+DYNAMIC_KEYS_MAXSIZE = 1024
+"""How many dynamic keys a name table remembers."""
+
+
+class NTable:
+    """The name table of a JSON class. It translates Python names into JSON
+    keys with the output key strategy. Field names and reference names are
+    recorded when the class is defined. Other keys, like keys of dict values,
+    are translated with the strategy and remembered in a bounded least
+    recently used cache.
+    """
+
+    def __init__(self: NTable,
+                 output_key_strategy: Callable[[str], str],
+                 maxsize: int = DYNAMIC_KEYS_MAXSIZE) -> None:
+        """
+        Initialize a new name table.
+
+        Args:
+            output_key_strategy (Callable[[str], str]): How object keys are \
+                encoded.
+            maxsize (int): How many dynamic keys are remembered.
+        """
+        self._encoded: dict[str, str] = {}
+        self._dynamic_encode = lru_cache(maxsize=maxsize)(output_key_strategy)
+        self._output_key_strategy = output_key_strategy
+
+    def add(self: NTable, name: str) -> str:
+        """Record a name into the name table.
+
+        Args:
+            name (str): The Python name to record.
+
+        Returns:
+            str: The encoded JSON key of the name.
+        """
+        jname = self._encoded.get(name)
+        if jname is None:
+            jname = self._output_key_strategy(name)
+            self._encoded[name] = jname
+        return jname
+
+    def load(self: NTable, encoded: dict[str, str]) -> None:
+        """Record names which are encoded ahead of time. The output key
+        strategy is not run for them.
+
+        Args:
+            encoded (dict[str, str]): The encoded JSON keys of the names.
+        """
+        self._encoded.update(encoded)
+
+    @property
+    def encoded(self: NTable) -> dict[str, str]:
+        """The encoded JSON keys of the recorded names."""
+        return dict(self._encoded)
+
+    def encode(self: NTable, name: str) -> str:
+        """Translate a Python name into a JSON key.
+
+        Args:
+            name (str): The Python name to translate.
+
+        Returns:
+            str: The JSON key.
+        """
+        try:
+            return self._encoded[name]
+        except KeyError:
+            return self._dynamic_encode(name)
@@ -1,6 +1,6 @@
 """This module defineds the JSON Class object mapping graph."""
 from __future__ import annotations
-from typing import Iterator, NamedTuple, Union, TYPE_CHECKING
+from typing import Iterator, Optional, Union, TYPE_CHECKING
 from .isjsonclass import isjsonobject
 from .excs import (UnlinkableJSONClassException,
                          JSONClassGraphMergeConflictException)
@@ -13,12 +13,25 @@ class OGraph:
     main usages. First, it's used for tracking and referencing objects within
     the same objects from a query result. Second, it's used for marking objects
     as handled when performing validating and serializing.
+
+    Merged graphs form a disjoint set. Merging links the root of the smaller
+    graph to the root of the larger graph, and only the objects of the smaller
+    graph are visited. Every graph of a merged set answers queries with the
+    content of the set's root. Each graph keeps the keys put into it in order,
+    and the root chains these segments, thus iterating a merged graph yields
+    objects in the order of merging.
     """
 
     def __init__(self: OGraph,
                  objects: Union[list[JObject],
                                 JObject, None] = None) -> None:
+        self._parent: OGraph = self
+        self._size = 0
         self._maps: dict[str, dict[str, JObject]] = {}
+        self._keys: list[tuple[str, str]] = []
+        self._next: Optional[OGraph] = None
+        self._head: OGraph = self
+        self._tail: OGraph = self
         try:
             if isinstance(objects, list):
                 for object in objects:
@@ -29,17 +42,41 @@ class OGraph:
             return
 
     def __iter__(self) -> Iterator[JObject]:
+        root = self._root()
+        order: dict[str, dict[str, None]] = {}
+        segment: Optional[OGraph] = root._head
+        while segment is not None:
+            for class_name, primary_value in segment._keys:
+                keys = order.get(class_name)
+                if keys is None:
+                    keys = order[class_name] = {}
+                keys[primary_value] = None
+            segment = segment._next
         lst: list[JObject] = []
-        for table in self._maps.values():
-            for obj in table.values():
-                lst.append(obj)
+        for class_name, keys in order.items():
+            table = root._maps[class_name]
+            for primary_value in keys:
+                lst.append(table[primary_value])
         return lst.__iter__()
 
+    def __len__(self: OGraph) -> int:
+        return self._root()._size
+
+    def _root(self: OGraph) -> OGraph:
+        root = self
+        while root._parent is not root:
+            root = root._parent
+        graph = self
+        while graph._parent is not root:
+            graph._parent, graph = root, graph._parent
+        return root
+
     def _object_map(self: OGraph,
                     name: str) -> dict[str, JObject]:
-        if self._maps.get(name) is None:
-            self._maps[name] = {}
-        return self._maps[name]
+        root = self._root()
+        if root._maps.get(name) is None:
+            root._maps[name] = {}
+        return root._maps[name]
 
     def _check_get_str_id(self: OGraph, object: JObject) -> str:
         primary_value = object._id
@@ -58,6 +95,10 @@ class OGraph:
         primary_value = self._check_get_str_id(object)
         class_name = object.__class__.__name__
         object_map = self._object_map(class_name)
+        if primary_value not in object_map:
+            root = self._root()
+            root._size += 1
+            root._tail._keys.append((class_name, primary_value))
         object_map[primary_value] = object
 
     def has(self: OGraph, object: JObject) -> bool:
@@ -70,34 +111,56 @@ class OGraph:
         """
         primary_value = self._check_get_str_id(object)
         class_name = object.__class__.__name__
-        object_map = self._object_map(class_name)
+        object_map = self._root()._maps.get(class_name)
+        if object_map is None:
+            return None
         return object_map.get(primary_value)
 
     def copy(self: OGraph) -> OGraph:
         """Get a copy of this object graph.
         """
         new_graph = OGraph()
-        for key, map in self._maps.items():
-            new_graph._maps[key] = {}
-            for name, obj in map.items():
-                new_graph._maps[key][name] = obj
+        for object in self:
+            new_graph.put(object)
         return new_graph
 
-
     def merged_graph(self: OGraph, graph2: OGraph) -> OGraph:
-        """Get a new graph which is a combination of two graphs.
+        """Merge two graphs and get the root graph of the merged graphs.
+        Objects of this graph come before objects of `graph2` when iterating.
+        If an object of one graph and a different object of the other graph
+        represent the same object, nothing is merged and an exception is
+        raised.
         """
-        if self is graph2:
-            return self
-        graph = self.copy()
-        for object in graph2:
-            if not graph.has(object):
-                graph.put(object)
-            elif graph.get(object) is object:
-                graph.put(object)
-            else:
-                raise JSONClassGraphMergeConflictException(
-                    'multiple objects represent same object: ', object)
-        for object in graph:
-            object._graph = graph
-        return graph
+        first = self._root()
+        second = graph2._root()
+        if first is second:
+            return first
+        if first._size < second._size:
+            small, large = first, second
+        else:
+            small, large = second, first
+        for class_name, table in small._maps.items():
+            ltable = large._maps.get(class_name)
+            if ltable is None:
+                continue
+            for primary_value, object in table.items():
+                existing = ltable.get(primary_value)
+                if existing is not None and existing is not object:
+                    raise JSONClassGraphMergeConflictException(
+                        'multiple objects represent same object: ', object)
+        for class_name, table in small._maps.items():
+            ltable = large._maps.get(class_name)
+            if ltable is None:
+                large._maps[class_name] = table
+                large._size += len(table)
+                continue
+            for primary_value, object in table.items():
+                if primary_value not in ltable:
+                    ltable[primary_value] = object
+                    large._size += 1
+        first._tail._next = second._head
+        large._head, large._tail = first._head, second._tail
+        small._parent = large
+        small._maps = {}
+        small._size = 0
+        return large
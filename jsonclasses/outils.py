@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import TypeVar, Any
 from .odict import OwnedDict, DictOwner
 from .olist import OwnedList, ListOwner
+from .plist import PackedList, TYPECODES, packable
 from .keypath import concat_keypath
 
 KT = TypeVar('KT')
@@ -45,6 +46,25 @@ def to_owned_list(owner: ListOwner,
     return owned_list
 
 
+def to_packed_list(owner: ListOwner,
+                   lst: list[T] | PackedList,
+                   keypath: str,
+                   cls: type) -> PackedList | OwnedList[T]:
+    """Pack a list of numbers into an owned packed list. If the items are
+    not all of the item type, an owned list is returned, thus the items are
+    validated as they are.
+    """
+    if not packable(lst, cls):
+        return to_owned_list(owner, list(lst), keypath)
+    try:
+        packed_list = PackedList(TYPECODES[cls], lst)
+    except OverflowError:
+        return to_owned_list(owner, list(lst), keypath)
+    packed_list.keypath = keypath
+    packed_list.owner = owner
+    return packed_list
+
+
 def unowned_copy_dict(any_dict: dict[KT, VT]) -> dict[KT, VT]:
     retval = {}
     for k, v in any_dict.items():
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from importlib import import_module
-from subprocess import check_call
 from sys import executable
 
 
+_checked: set[str] = set()
+
+
 def check_package(module_name: str, info: tuple[str, str]) -> None:
     try:
         import_module(module_name)
@@ -12,6 +14,7 @@ def check_package(module_name: str, info: tuple[str, str]) -> None:
 
 
 def install_package(info: tuple[str, str]) -> None:
+    from subprocess import check_call
     param = f'{info[0]}{info[1]}'
     check_call([executable, "-m", "pip", "install", param])
     with open('requirements.txt', 'r') as file:
@@ -28,7 +31,10 @@ def install_package(info: tuple[str, str]) -> None:
 
 def check_and_install_packages(packages: dict[str, (str, str)] | None) -> None:
     for module_name, info in packages.items():
+        if module_name in _checked:
+            continue
         try:
             check_package(module_name, info)
         except:
             install_package(info)
+        _checked.add(module_name)
@@ -0,0 +1,201 @@
+"""The owner observable packed list. A packed list stores ints or floats in a
+typed contiguous buffer instead of boxed Python objects. It notifies its
+owner of changes with the same hooks as the owned list.
+"""
+from __future__ import annotations
+from typing import Any, Iterable, MutableSequence, Optional, Union
+from array import array
+from .olist import ListOwner
+
+
+TYPECODES: dict[type, str] = {int: 'q', float: 'd'}
+"""The typecodes of the buffers of packed lists of each item type."""
+
+
+class PackedList(MutableSequence):
+    """A mutable sequence of ints or floats which is backed by an array."""
+
+    __slots__ = ('_buffer', '_owner', '_keypath')
+
+    def __init__(self: PackedList, typecode: str,
+                 values: Iterable[Union[int, float]] = ()) -> None:
+        self._buffer = array(typecode, values)
+        self._owner: Optional[ListOwner] = None
+        self._keypath: Optional[str] = None
+
+    @property
+    def owner(self: PackedList) -> ListOwner:
+        return self._owner
+
+    @owner.setter
+    def owner(self: PackedList, val: ListOwner) -> None:
+        self._owner = val
+
+    @property
+    def keypath(self: PackedList) -> str:
+        return self._keypath
+
+    @keypath.setter
+    def keypath(self: PackedList, val: str) -> None:
+        self._keypath = val
+
+    @property
+    def typecode(self: PackedList) -> str:
+        """The typecode of the underlying array."""
+        return self._buffer.typecode
+
+    @property
+    def buffer(self: PackedList) -> array:
+        """The underlying array. Changing it doesn't notify the owner."""
+        return self._buffer
+
+    def memoryview(self: PackedList) -> memoryview:
+        """A zero copy memory view of the items."""
+        return memoryview(self._buffer)
+
+    def numpy(self: PackedList) -> Any:
+        """A zero copy NumPy array of the items. NumPy should be installed.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ModuleNotFoundError('module numpy is not found. please '
+                                      'install numpy') from None
+        return numpy.frombuffer(self._buffer, dtype=self._buffer.typecode)
+
+    def __array__(self: PackedList, dtype: Any = None,
+                  copy: Any = None) -> Any:
+        arr = self.numpy()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def tolist(self: PackedList) -> list[Union[int, float]]:
+        """Convert the items into a list."""
+        return self._buffer.tolist()
+
+    def __len__(self: PackedList) -> int:
+        return len(self._buffer)
+
+    def __iter__(self: PackedList):
+        return iter(self._buffer)
+
+    def __contains__(self: PackedList, value: Any) -> bool:
+        return value in self._buffer
+
+    def __getitem__(self: PackedList, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._buffer[index].tolist()
+        return self._buffer[index]
+
+    def __setitem__(self: PackedList, index: Union[int, slice],
+                    value: Any) -> None:
+        if isinstance(index, slice):
+            removed = self._buffer[index].tolist()
+            values = array(self._buffer.typecode, value)
+            start, _, step = index.indices(len(self._buffer))
+            self._will_change()
+            self._buffer[index] = values
+            for item in removed:
+                self._owner.__olist_del__(self, item)
+            for item in values:
+                self._owner.__olist_add__(self, start, item)
+                start += step
+            return
+        length = len(self._buffer)
+        idx = index + length if index < 0 else index
+        cur = self._buffer[index]
+        self._will_change()
+        self._buffer[index] = value
+        self._owner.__olist_del__(self, cur)
+        self._owner.__olist_add__(self, idx, value)
+
+    def __delitem__(self: PackedList, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            removed = self._buffer[index].tolist()
+        else:
+            removed = [self._buffer[index]]
+        self._will_change()
+        del self._buffer[index]
+        for item in removed:
+            self._owner.__olist_del__(self, item)
+
+    def insert(self: PackedList, index: int, value: Any) -> None:
+        curlen = len(self._buffer)
+        self._will_change()
+        self._buffer.insert(index, value)
+        if index < 0:
+            index = max(curlen + index, 0)
+        self._owner.__olist_add__(self, min(curlen, index), value)
+
+    def append(self: PackedList, value: Any) -> None:
+        self._will_change()
+        self._buffer.append(value)
+        self._owner.__olist_add__(self, len(self._buffer) - 1, value)
+
+    def extend(self: PackedList, values: Iterable[Any]) -> None:
+        values = array(self._buffer.typecode, values)
+        if len(values) == 0:
+            return
+        curlen = len(self._buffer)
+        self._will_change()
+        self._buffer.extend(values)
+        for v in values:
+            self._owner.__olist_add__(self, curlen, v)
+            curlen += 1
+
+    def __iadd__(self: PackedList, values: Iterable[Any]) -> PackedList:
+        self.extend(values)
+        return self
+
+    def remove(self: PackedList, value: Any) -> None:
+        idx = self._buffer.index(value)
+        del self[idx]
+
+    def pop(self: PackedList, index: int = -1) -> Any:
+        value = self._buffer[index]
+        del self[index]
+        return value
+
+    def clear(self: PackedList) -> None:
+        del self[:]
+
+    def sort(self: PackedList, **kwargs: Any) -> None:
+        self._will_change()
+        self._buffer[:] = array(self._buffer.typecode,
+                                sorted(self._buffer, **kwargs))
+        self._owner.__olist_sor__(self)
+
+    def reverse(self: PackedList) -> None:
+        self._will_change()
+        self._buffer.reverse()
+        self._owner.__olist_sor__(self)
+
+    def __eq__(self: PackedList, other: Any) -> bool:
+        if isinstance(other, PackedList):
+            return self._buffer == other._buffer
+        if isinstance(other, list):
+            return self._buffer.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self: PackedList) -> str:
+        return f'PackedList({self._buffer.tolist()!r})'
+
+    def _will_change(self: PackedList) -> None:
+        self._owner.__olist_will_change__(self)
+
+
+def packable(values: Iterable[Any], cls: type) -> bool:
+    """Check whether values can be packed into a packed list of a type. The
+    values should all be exactly of the type.
+
+    Args:
+        values (Iterable[Any]): The values to pack.
+        cls (type): The item type, int or float.
+
+    Returns:
+        bool: Whether the values can be packed.
+    """
+    if cls not in TYPECODES:
+        return False
+    return set(map(type, values)) <= {cls}
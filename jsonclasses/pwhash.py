@@ -0,0 +1,205 @@
+"""This module hashes and checks passwords with bcrypt. bcrypt releases the
+GIL while it works, thus passwords are hashed concurrently on a thread pool.
+Awaitable variants run bcrypt on the thread pool without blocking the event
+loop. They submit each bcrypt call from the event loop, never from a worker
+of the pool. Passwords which are hashed ahead of time in a batch are used by
+the salt modifier instead of hashing them again one by one, and results which
+are checked ahead of time are used by the checkpw modifier.
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from contextvars import ContextVar
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+
+_rounds: int = 12
+_max_workers: Optional[int] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_prehashed: ContextVar[Optional[dict[str, list[str]]]] = ContextVar(
+    'prehashed', default=None)
+_prechecked: ContextVar[Optional[dict[tuple[str, str], bool]]] = ContextVar(
+    'prechecked', default=None)
+
+
+def configure(rounds: Optional[int] = None,
+              max_workers: Optional[int] = None) -> None:
+    """Configure password hashing.
+
+    Args:
+        rounds (Optional[int]): The bcrypt cost factor of new hashes, 4 to 31.
+        max_workers (Optional[int]): The number of threads of the thread \
+            pool. The current pool is shut down after its pending work is \
+            done.
+    """
+    global _rounds, _max_workers, _executor
+    if rounds is not None:
+        if not 4 <= rounds <= 31:
+            raise ValueError('bcrypt rounds should be between 4 and 31')
+        _rounds = rounds
+    if max_workers is not None:
+        _max_workers = max_workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def rounds() -> int:
+    """The bcrypt cost factor of new hashes."""
+    return _rounds
+
+
+def executor() -> ThreadPoolExecutor:
+    """The thread pool which runs bcrypt."""
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(_max_workers,
+                                       thread_name_prefix='jsonclasses-bcrypt')
+    return _executor
+
+
+def hashpw(password: str) -> str:
+    """Hash a password. A password hashed ahead of time is used if there is
+    one.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The salted hash.
+    """
+    prehashed = _prehashed.get()
+    if prehashed is not None:
+        hashes = prehashed.get(password)
+        if hashes:
+            return hashes.pop()
+    return _hashpw(password, _rounds)
+
+
+def checkpw(password: str, hashed: str) -> bool:
+    """Check a password against a hash. A result checked ahead of time is
+    used if there is one.
+
+    Args:
+        password (str): The password to check.
+        hashed (str): The salted hash.
+
+    Returns:
+        bool: Whether the password matches the hash.
+    """
+    prechecked = _prechecked.get()
+    if prechecked is not None:
+        result = prechecked.get((password, hashed))
+        if result is not None:
+            return result
+    return _checkpw(password, hashed)
+
+
+def hashpw_many(passwords: Iterable[str]) -> list[str]:
+    """Hash passwords concurrently on the thread pool.
+
+    Args:
+        passwords (Iterable[str]): The passwords to hash.
+
+    Returns:
+        list[str]: The salted hashes in the order of passwords.
+    """
+    passwords = list(passwords)
+    if len(passwords) < 2:
+        return [_hashpw(p, _rounds) for p in passwords]
+    return list(executor().map(_hashpw, passwords,
+                               [_rounds] * len(passwords)))
+
+
+async def ahashpw(password: str) -> str:
+    """Hash a password on the thread pool."""
+    from asyncio import get_running_loop
+    return await get_running_loop().run_in_executor(
+        executor(), _hashpw, password, _rounds)
+
+
+async def ahashpw_many(passwords: Iterable[str]) -> list[str]:
+    """Hash passwords concurrently on the thread pool. Each password is
+    submitted from the event loop, thus no worker waits on the pool.
+
+    Args:
+        passwords (Iterable[str]): The passwords to hash.
+
+    Returns:
+        list[str]: The salted hashes in the order of passwords.
+    """
+    from asyncio import gather
+    return list(await gather(*(ahashpw(p) for p in passwords)))
+
+
+async def acheckpw(password: str, hashed: str) -> bool:
+    """Check a password against a hash on the thread pool."""
+    from asyncio import get_running_loop
+    return await get_running_loop().run_in_executor(
+        executor(), _checkpw, password, hashed)
+
+
+async def acheckpw_many(pairs: Iterable[tuple[str, str]]) -> list[bool]:
+    """Check passwords against hashes concurrently on the thread pool.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): The passwords and the hashes.
+
+    Returns:
+        list[bool]: Whether each password matches its hash.
+    """
+    from asyncio import gather
+    return list(await gather(*(acheckpw(p, h) for p, h in pairs)))
+
+
+@contextmanager
+def prehashed(passwords: Iterable[str],
+              hashes: Optional[list[str]] = None) -> Iterator[None]:
+    """Let hashpw return hashes of passwords which are hashed ahead of time.
+    Each hash is used once, thus equal passwords get different salts.
+
+    Args:
+        passwords (Iterable[str]): The passwords.
+        hashes (Optional[list[str]]): The hashes of passwords. If this is \
+            None, passwords are hashed concurrently on the thread pool.
+    """
+    passwords = list(passwords)
+    if hashes is None:
+        hashes = hashpw_many(passwords)
+    table: dict[str, list[str]] = {}
+    for password, hashed in zip(passwords, hashes):
+        table.setdefault(password, []).append(hashed)
+    token = _prehashed.set(table)
+    try:
+        yield
+    finally:
+        _prehashed.reset(token)
+
+
+@contextmanager
+def prechecked(pairs: Iterable[tuple[str, str]],
+               results: Iterable[bool]) -> Iterator[None]:
+    """Let checkpw return results of passwords which are checked ahead of
+    time.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): The passwords and the hashes.
+        results (Iterable[bool]): Whether each password matches its hash.
+    """
+    token = _prechecked.set(dict(zip(pairs, results)))
+    try:
+        yield
+    finally:
+        _prechecked.reset(token)
+
+
+def _checkpw(password: str, hashed: str) -> bool:
+    from bcrypt import checkpw
+    return checkpw(password.encode(), hashed.encode())
+
+
+def _hashpw(password: str, rounds: int) -> str:
+    from bcrypt import hashpw, gensalt
+    return hashpw(password.encode(), gensalt(rounds)).decode('utf-8')
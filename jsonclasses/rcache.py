@@ -0,0 +1,113 @@
+"""This module defines the regular expression pattern cache. Modifiers
+compile static patterns once when they're constructed. Patterns which are
+resolved from the context are compiled through a bounded least recently used
+cache owned by jsonclasses, thus a large schema doesn't thrash the process
+wide cache of the `re` module.
+
+The engine which compiles patterns can be switched to RE2 if the
+`google-re2` package is installed. Modifiers hold their static patterns as
+`RPattern`s, which are compiled again on next use after the engine is
+switched. Patterns which RE2 doesn't support are compiled with `re`.
+"""
+from __future__ import annotations
+from typing import Any
+from functools import lru_cache
+from importlib import import_module
+import re
+
+
+RCACHE_MAXSIZE = 512
+"""How many dynamically resolved patterns the pattern cache remembers."""
+
+
+_engine: Any = re
+_generation: int = 0
+
+
+def rengine() -> str:
+    """Get the name of the regular expression engine.
+
+    Returns:
+        str: Either 're' or 're2'.
+    """
+    return _engine.__name__
+
+
+def set_rengine(name: str) -> None:
+    """Switch the regular expression engine. Patterns which are already
+    compiled are compiled again with the new engine on next use.
+
+    Args:
+        name (str): Either 're' or 're2'.
+    """
+    global _engine, _generation
+    if name not in ('re', 're2'):
+        raise ValueError(f"unknown regular expression engine '{name}'")
+    if name == rengine():
+        return
+    try:
+        engine = import_module(name)
+    except ImportError:
+        raise ModuleNotFoundError(f'module {name} is not found. please '
+                                  'install google-re2') from None
+    _engine = engine
+    _generation += 1
+    _rcompile.cache_clear()
+
+
+@lru_cache(maxsize=RCACHE_MAXSIZE)
+def _rcompile(pattern: str) -> Any:
+    if _engine is not re:
+        try:
+            return _engine.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def rcompile(pattern: str | re.Pattern) -> Any:
+    """Compile a regular expression pattern with the engine. Compiled patterns
+    are returned as they are.
+
+    Args:
+        pattern (str | re.Pattern): The pattern to compile.
+
+    Returns:
+        Any: The compiled pattern.
+    """
+    if isinstance(pattern, str):
+        return _rcompile(pattern)
+    return pattern
+
+
+class RPattern:
+    """A static pattern which is compiled with the current engine. It's
+    compiled when constructed and compiled again after the engine is switched.
+    """
+
+    def __init__(self: RPattern, pattern: str | re.Pattern) -> None:
+        self.pattern = pattern
+        self.source = rsource(pattern)
+        self._generation = -1
+        self._compiled: Any = None
+        self.compiled
+
+    @property
+    def compiled(self: RPattern) -> Any:
+        """The pattern compiled with the current engine."""
+        if self._generation != _generation:
+            self._compiled = rcompile(self.pattern)
+            self._generation = _generation
+        return self._compiled
+
+
+def rsource(pattern: str | re.Pattern) -> str:
+    """Get the source string of a pattern.
+
+    Args:
+        pattern (str | re.Pattern): The pattern.
+
+    Returns:
+        str: The source string.
+    """
+    return pattern if isinstance(pattern, str) else pattern.pattern
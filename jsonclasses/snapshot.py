@@ -0,0 +1,206 @@
+"""This module defines schema snapshots. A snapshot keeps the resolved class
+graph and the compiled pipelines of class definitions on disk, thus a new
+process doesn't resolve and compile them again. For each class, the snapshot
+keeps its name table and its reference map, which are the encoded JSON keys
+of its names and the reference names of its reference fields together with
+their kinds. A snapshot is keyed by a hash of the sources of the model modules
+and of the pipeline compiler, and it's discarded when any of them changes.
+Types chains hold user callables, thus they are still built by each process.
+
+Code in a snapshot is executed when it's loaded, thus the snapshot file and
+its directory must not be writable by untrusted users.
+"""
+from __future__ import annotations
+from typing import Any, Iterable, Optional
+from types import CodeType
+from hashlib import sha256
+from importlib.util import find_spec
+from marshal import dumps, loads
+from os import fdopen, replace, unlink
+from pathlib import Path
+from sys import version
+from tempfile import mkstemp
+
+
+class Snapshot:
+    """A snapshot of resolved class definitions and compiled pipeline code.
+    """
+
+    def __init__(self: Snapshot, path: Path, key: str,
+                 codes: Optional[dict[str, CodeType]] = None,
+                 cdefs: Optional[dict[str, dict[str, Any]]] = None) -> None:
+        self.path = path
+        self.key = key
+        self.codes = codes if codes is not None else {}
+        self.cdefs = cdefs if cdefs is not None else {}
+        self.changed = False
+
+    def cdef(self: Snapshot, name: str) -> Optional[dict[str, Any]]:
+        """Get the resolved class definition of a class.
+
+        Args:
+            name (str): The snapshot name of the class.
+
+        Returns:
+            Optional[dict[str, Any]]: The name table and the reference map \
+                of the class if it's in the snapshot.
+        """
+        return self.cdefs.get(name)
+
+    def keep_cdef(self: Snapshot, name: str, cdef: dict[str, Any]) -> None:
+        """Keep the resolved class definition of a class.
+
+        Args:
+            name (str): The snapshot name of the class.
+            cdef (dict[str, Any]): The name table and the reference map of \
+                the class.
+        """
+        if self.cdefs.get(name) != cdef:
+            self.cdefs[name] = cdef
+            self.changed = True
+
+    def code(self: Snapshot, source: str, filename: str) -> CodeType:
+        """Get the compiled code of a source. The code is compiled and kept
+        if it's not in the snapshot.
+
+        Args:
+            source (str): The source to compile.
+            filename (str): The file name of the compiled code.
+
+        Returns:
+            CodeType: The compiled code.
+        """
+        digest = sha256(f'{filename}\n{source}'.encode()).hexdigest()
+        code = self.codes.get(digest)
+        if code is None:
+            code = compile(source, filename, 'exec')
+            self.codes[digest] = code
+            self.changed = True
+        return code
+
+    def save(self: Snapshot) -> None:
+        """Write the snapshot to its path if it's changed. The snapshot is
+        written to a unique temporary file which replaces the path, thus
+        processes saving at the same time don't corrupt it.
+        """
+        if not self.changed:
+            return
+        data = dumps({'key': self.key, 'codes': self.codes,
+                      'cdefs': self.cdefs})
+        fd, tmp = mkstemp(dir=self.path.parent,
+                          prefix=self.path.name, suffix='.tmp')
+        try:
+            with fdopen(fd, 'wb') as file:
+                file.write(data)
+            replace(tmp, self.path)
+        except BaseException:
+            unlink(tmp)
+            raise
+        self.changed = False
+
+
+_snapshot: Optional[Snapshot] = None
+
+
+def snapshot_key(modules: Iterable[str]) -> str:
+    """Compute the snapshot key of model modules. The modules are not
+    imported.
+
+    Args:
+        modules (Iterable[str]): The names of the model modules.
+
+    Returns:
+        str: The hash of the module sources, the compiler and Python.
+    """
+    digest = sha256(version.encode())
+    origins = [__file__, find_spec('jsonclasses.compiler').origin]
+    for name in sorted(modules):
+        spec = find_spec(name)
+        if spec is None or spec.origin is None:
+            raise ModuleNotFoundError(f'module {name} is not found')
+        origins.append(spec.origin)
+    for origin in origins:
+        digest.update(Path(origin).read_bytes())
+    return digest.hexdigest()
+
+
+def load_snapshot(path: str | Path, modules: Iterable[str]) -> Snapshot:
+    """Load the snapshot at path and use it to define classes and compile
+    pipelines. Load it before the model modules are imported. If the file
+    doesn't exist or it's saved for other sources, an empty snapshot is used.
+    Code in the snapshot is executed, thus the path must not be writable by
+    untrusted users.
+
+    Args:
+        path (str | Path): The path of the snapshot file.
+        modules (Iterable[str]): The names of the model modules and of the \
+            modules which configure their class graphs.
+
+    Returns:
+        Snapshot: The loaded snapshot.
+    """
+    global _snapshot
+    path = Path(path)
+    key = snapshot_key(modules)
+    codes = None
+    cdefs = None
+    try:
+        data = loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        data = None
+    if isinstance(data, dict) and data.get('key') == key:
+        codes = data['codes']
+        cdefs = data['cdefs']
+    _snapshot = Snapshot(path, key, codes, cdefs)
+    return _snapshot
+
+
+def save_snapshot() -> None:
+    """Save the loaded snapshot. Save it after the model classes are
+    finalized.
+    """
+    if _snapshot is not None:
+        _snapshot.save()
+
+
+def compile_source(source: str, filename: str) -> CodeType:
+    """Compile a generated source with the loaded snapshot if there is one.
+
+    Args:
+        source (str): The source to compile.
+        filename (str): The file name of the compiled code.
+
+    Returns:
+        CodeType: The compiled code.
+    """
+    if _snapshot is None:
+        return compile(source, filename, 'exec')
+    return _snapshot.code(source, filename)
+
+
+def snapshot_cdef(name: str) -> Optional[dict[str, Any]]:
+    """Get the resolved class definition of a class from the loaded snapshot.
+
+    Args:
+        name (str): The snapshot name of the class.
+
+    Returns:
+        Optional[dict[str, Any]]: The name table and the reference map of the \
+            class if a snapshot is loaded and the class is in it.
+    """
+    if _snapshot is None:
+        return None
+    return _snapshot.cdef(name)
+
+
+def keep_cdef(name: str, cdef: dict[str, Any]) -> None:
+    """Keep the resolved class definition of a class in the loaded snapshot
+    if there is one.
+
+    Args:
+        name (str): The snapshot name of the class.
+        cdef (dict[str, Any]): The name table and the reference map of the \
+            class.
+    """
+    if _snapshot is not None:
+        _snapshot.keep_cdef(name, cdef)
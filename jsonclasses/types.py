@@ -1,71 +1,17 @@
 """This modules contains the JSONClasses types modifier."""
 from __future__ import annotations
 from ast import Call
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, TYPE_CHECKING
+from re import Pattern
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
-from copy import deepcopy
 from .jobject import JObject
 from .fdef import FDef
-from .modifiers import (BoolModifier, ChainedModifier, FValModifier, FObjModifier,
-                        CompareModifier, DateModifier, DatetimeModifier,
-                        DefaultModifier, DictOfModifier, EagerModifier,
-                        EmbeddedModifier, EnumModifier, EqModifier, NeqModifier,
-                        FloatModifier, IndexModifier, InputAllModifier, HexColorModifier,
-                        InputNameModifier, InputLnameModifier, AtModifier,
-                        InputValueModifier, InstanceOfModifier, ThisModifier,
-                        IntModifier, InvalidModifier, LengthModifier,
-                        LinkedByModifier, LinkedInModifier, GetterModifier,
-                        LinkedThruModifier, LinkToModifier, ListOfModifier,
-                        MatchModifier, MaxModifier, MaxlengthModifier,
-                        LtModifier, MinModifier, MinlengthModifier, GtModifier,
-                        NegativeModifier, NonnullModifier, NullableModifier,
-                        OneOfModifier, UnionModifier, OnWriteModifier,
-                        OnSaveModifier, OnUpdateModifier, OutputLnameModifier,
-                        OutputNameModifier, OutputValueModifier, IsObjOfModifier,
-                        PositiveModifier, PresentModifier, SetterModifier,
-                        NonnegativeModifier, NonpositiveModifier,
-                        PresentWithModifier, PresentWithoutModifier,
-                        PreserializeModifier, PrimaryModifier, IsThisModifier,
-                        RangeModifier, ReadonlyModifier, ReadwriteModifier,
-                        RefereeModifier, ReferrerModifier, OneIsValidModifier,
-                        RequiredModifier, ResetModifier, SetOnSaveModifier,
-                        FSetOnSaveModifier, AddModifier, SubModifier,
-                        DivModifier, ModModifier, MulModifier, GetOpModifier,
-                        StrModifier, StrictModifier, AssignModifier,
-                        TempModifier, TransformModifier, TrimModifier,
-                        TruncateModifier, ValidateModifier, MongoIdModifier,
-                        Modifier, WriteNonnullModifier, WriteonceModifier,
-                        WriteonlyModifier, DenyModifier, CascadeModifier,
-                        NullifyModifier, AsopModifier, FmtModifier,
-                        AsopdModifier, UrlModifier, EmailModifier,
-                        DigitModifier,AlphaModifier,NumericModifier,
-                        AlnumModifier,ToTitleModifier,ToCapModifier,
-                        ToLowerModifier,ToUpperModifier,RoundModifier,
-                        UnresolvedModifier, AnyModifier, CeilModifier,
-                        FloorModifier, BeforeModifier, AfterModifier,
-                        ReverseModifier, ReplaceModifier, ReplacerModifier,
-                        OddModifier, EvenModifier, AbsModifier,SplitModifier,
-                        JoinModifier, AuthIdentityModifier, SaltModifier,
-                        AuthByModifier, PassinModifier, CheckpwModifier,
-                        ToListModifier, ToBoolModifier, ToFloatModifier,
-                        ToIntModifier, ToStrModifier, RandomDigitsModifier,
-                        RandomAlnumpuncsModifier, RandomAlnumsModifier,
-                        RandomIntModifier, RandomFloatModifier,
-                        ToBoSecModifier, ToBoMinModifier, ToBoHourModifier,
-                        ToNextSecModifier, ToNextMinModifier, UploaderModifier,
-                        ToNextHourModifier, CrossFetchModifier,
-                        ToNextMonModifier, ToNextYearModifier, IsObjModifier,
-                        ToNextDayModifier, ToBoYearModifier, ToBoMonModifier,
-                        ToBoDayModifier, PadStartModifier, PadEndModifier,
-                        UnqueryableModifier, QueryableModifier, PowModifier,
-                        FormatDatetimeModifier, NoCopyModifier, SqrtModifier,
-                        CanCModifier, CanUModifier, CanRModifier, MapModifier,
-                        FilterModifier, HasPrefixModifier, HasSuffixModifier,
-                        InsertAtModifier, AppendModifier, PrependModifier,
-                        WrapIntoListModifier, IsPrefixOfModifier,
-                        IsSuffixOfModifier, InverseModifier, UpperbondModifier,
-                        LowerbondModifier, LenModifier, SecurepwModifier)
+from . import modifiers
+from .modifiers.modifier import Modifier
+from .modifiers.chained_modifier import ChainedModifier
+if TYPE_CHECKING:
+    from .cdef import CDef
 
 Str = str
 Int = int
@@ -78,6 +24,10 @@ class Types:
     """The class of types marks object. Types marks provide necessary
     information about an json object's shape, transformation, validation,
     serialization and sanitization.
+
+    Types are immutable. Chaining a modifier derives a new types whose field
+    definition shares the nested types of the original. Argumentless chains
+    from the root types like `types.str.required` are interned.
     """
 
     def __init__(  # pylint: disable=keyword-arg-before-vararg
@@ -85,29 +35,48 @@ class Types:
         original: Optional[Types] = None,
         *args: Modifier
     ) -> None:
+        self._interned: Optional[dict[str, Types]] = None
         if not original:
             self.fdef = FDef()
             self.modifier = ChainedModifier()
         else:
-            self.fdef = deepcopy(original.fdef)
+            self.fdef = original.fdef.derive()
             modifier = original.modifier
             for arg in args:
                 modifier = modifier.append(arg)
                 arg.define(self.fdef)
             self.modifier = modifier
 
+    def _owned(self: Types, cdef: CDef) -> Types:
+        """Get this types with its field definition owned by a class
+        definition. A types which is interned or owned by another class
+        definition is copied instead of changed.
+        """
+        if self.fdef._cdef is cdef:
+            return self
+        if self._interned is None and self.fdef._cdef is None:
+            self.fdef._cdef = cdef
+            return self
+        types = Types.__new__(Types)
+        types._interned = None
+        types.fdef = self.fdef.derive()
+        types.fdef._cdef = cdef
+        types.modifier = self.modifier
+        return types
+
     @property
     def invalid(self) -> Types:
         """Fields marked with invalid will never be valid, thus these fields
         will never pass validation.
         """
-        return Types(self, InvalidModifier())
+        return Types(self, modifiers.InvalidModifier())
 
     @property
     def primary(self) -> Types:
         """Field marked with primary become the object's primary key.
         """
-        return Types(self, ResetModifier(), PrimaryModifier())
+        return Types(self, modifiers.ResetModifier(),
+                     modifiers.PrimaryModifier())
 
     @property
     def readonly(self) -> Types:
@@ -119,14 +88,14 @@ class Types:
         `writeonce`, `readonly` and `writenonnull` cannot be presented
         together.
         """
-        return Types(self, ReadonlyModifier())
+        return Types(self, modifiers.ReadonlyModifier())
 
     @property
     def writeonly(self) -> Types:
         """Fields marked with writeonly will not be available in outgoing json
         form. Users' password is a great example of writeonly.
         """
-        return Types(self, WriteonlyModifier())
+        return Types(self, modifiers.WriteonlyModifier())
 
     @property
     def readwrite(self) -> Types:
@@ -134,7 +103,7 @@ class Types:
         outputs. This is the default behavior. And this specifier can be
         omitted.
         """
-        return Types(self, ReadwriteModifier())
+        return Types(self, modifiers.ReadwriteModifier())
 
     @property
     def writeonce(self) -> Types:
@@ -146,7 +115,7 @@ class Types:
         `writeonce`, `readonly` and `writenonnull` cannot be presented
         together.
         """
-        return Types(self, WriteonceModifier())
+        return Types(self, modifiers.WriteonceModifier())
 
     @property
     def writenonnull(self) -> Types:
@@ -157,7 +126,7 @@ class Types:
         `writeonce`, `readonly` and `writenonnull` cannot be presented
         together.
         """
-        return Types(self, WriteNonnullModifier())
+        return Types(self, modifiers.WriteNonnullModifier())
 
     @property
     def internal(self) -> Types:
@@ -165,7 +134,8 @@ class Types:
         will not be present in output. These fields are internal and hidden
         from users.
         """
-        return Types(self, ReadonlyModifier(), WriteonlyModifier())
+        return Types(self, modifiers.ReadonlyModifier(),
+                     modifiers.WriteonlyModifier())
 
     @property
     def temp(self) -> Types:
@@ -174,7 +144,7 @@ class Types:
         None. Examples of it's use cases are authentication code validation,
         input validation, etc.
         """
-        return Types(self, TempModifier())
+        return Types(self, modifiers.TempModifier())
 
     @property
     def index(self) -> Types:
@@ -182,13 +152,13 @@ class Types:
         database column index for you. This modifier doesn't have any effect
         around transforming and validating.
         """
-        return Types(self, IndexModifier(False))
+        return Types(self, modifiers.IndexModifier(False))
 
     def cindex(self, index_name: str) -> Types:
         """Fields marked with cindex have compound indexes. This modifier
         doesn't have any effect around transforming and validating.
         """
-        return Types(self, IndexModifier(False, index_name))
+        return Types(self, modifiers.IndexModifier(False, index_name))
 
     @property
     def unique(self) -> Types:
@@ -202,128 +172,136 @@ class Types:
         UniqueFieldException provided by jsonclasses.excs to keep
         consistency with other jsonclasses integrations.
         """
-        return Types(self, IndexModifier(True))
+        return Types(self, modifiers.IndexModifier(True))
 
     def cunique(self, index_name: str) -> Types:
         """Fields marked with cunique have compound indexes. This is a unique
         index. This modifier doesn't have any effect around transforming and
         validating.
         """
-        return Types(self, IndexModifier(True, index_name))
+        return Types(self, modifiers.IndexModifier(True, index_name))
 
     @property
     def queryable(self) -> Types:
         """Fields marked with queryable is queryable. This is the default
         behavior.
         """
-        return Types(self, QueryableModifier())
+        return Types(self, modifiers.QueryableModifier())
 
     @property
     def unqueryable(self) -> Types:
         """Fields marked with unqueryable is not queryable.
         """
-        return Types(self, UnqueryableModifier())
+        return Types(self, modifiers.UnqueryableModifier())
 
     @property
     def embedded(self) -> Types:
         """Instance fields marked with the embedded mark is embedded into the
         hosting document for noSQL databases.
         """
-        return Types(self, EmbeddedModifier())
+        return Types(self, modifiers.EmbeddedModifier())
 
     def getter(self, calc: Callable | Types) -> Types:
         """Getter modifier marks a field as calculated field. It's not stored.
         """
-        return Types(self, GetterModifier(calc))
+        return Types(self, modifiers.GetterModifier(calc))
 
     def setter(self, setter: Callable | Types) -> Types:
         """Setter modifier provides setter to calculated fields.
         """
-        return Types(self, SetterModifier(setter))
+        return Types(self, modifiers.SetterModifier(setter))
 
     @property
     def nocopy(self) -> Types:
         """NoCopy modifier marks fields is nocopy.
         """
-        return Types(self, NoCopyModifier())
+        return Types(self, modifiers.NoCopyModifier())
+
+    @property
+    def packed(self) -> Types:
+        """Packed modifier marks a list field of ints or floats is packed.
+        Items of a packed field are stored in a typed contiguous buffer, which
+        is exposed as a memory view or a NumPy array without copying.
+        """
+        return Types(self, modifiers.PackedModifier())
 
     @property
     def linkto(self) -> Types:
         """In a database relationship, fields marked with linkto save an id of
         the object being referenced at the local table.
         """
-        return Types(self, LinkToModifier())
+        return Types(self, modifiers.LinkToModifier())
 
     def linkedby(self, foreign_key: str) -> Types:
         """In a database relationship, fields marked with linkedby find
         reference from the destination table.
         """
-        return Types(self, LinkedByModifier(foreign_key))
+        return Types(self, modifiers.LinkedByModifier(foreign_key))
 
     def linkedthru(self, foreign_key: str) -> Types:
         """In a database relationship, fields marked with linkedthru save
         relationships to a designated association table and find references
         through it.
         """
-        return Types(self, LinkedThruModifier(foreign_key))
+        return Types(self, modifiers.LinkedThruModifier(foreign_key))
 
     def linkedin(self, cls: Any) -> Types:
         """In a database relationship, fields marked with linkedin save
         relationships to the table under provided class.
         """
-        return Types(self, LinkedInModifier(cls))
+        return Types(self, modifiers.LinkedInModifier(cls))
 
     def referrer(self, referrer_key: str) -> Types:
         """In a many to many database relationship, fields marked with referrer
         has a provided custom key name in the association table.
         """
-        return Types(self, ReferrerModifier(referrer_key))
+        return Types(self, modifiers.ReferrerModifier(referrer_key))
 
     def referee(self, referee_key: str) -> Types:
         """In a many to many database relationship, fields marked with referee
         reference the other side of the relationship with this provided custom
         key name.
         """
-        return Types(self, RefereeModifier(referee_key))
+        return Types(self, modifiers.RefereeModifier(referee_key))
 
     @property
     def nullify(self) -> Types:
         """When an object is deleted, linked objects' references are set to
         null instead of deleted.
         """
-        return Types(self, NullifyModifier())
+        return Types(self, modifiers.NullifyModifier())
 
     @property
     def cascade(self) -> Types:
         """When an object is deleted, linked objects with cascade relationship
         are deleted.
         """
-        return Types(self, CascadeModifier())
+        return Types(self, modifiers.CascadeModifier())
 
     @property
     def deny(self) -> Types:
         """When an object is deleted, linked objects with deny relationship
         prevent this object being deleted.
         """
-        return Types(self, DenyModifier())
+        return Types(self, modifiers.DenyModifier())
 
     @property
     def str(self) -> Types:
         """Fields marked with str should be str type. This is a type modifier.
         """
-        return Types(self, StrModifier())
+        return Types(self, modifiers.StrModifier())
 
-    def match(self, pattern: Str | Callable | Types) -> Types:
+    def match(self, pattern: Str | Pattern | Callable | Types) -> Types:
         """Fields marked with match are tested againest the argument regular
         expression pattern.
         """
-        return Types(self, MatchModifier(pattern))
+        return Types(self, modifiers.MatchModifier(pattern))
 
     def oneof(self, str_list: list[Str]) -> Types:
         """This is the enum equivalent for jsonclasses. Values in the provided
         list are considered valid values.
         """
-        return Types(self, OneOfModifier(str_list))
+        return Types(self, modifiers.OneOfModifier(str_list))
 
     def minlength(self, length: int | Callable | Types) -> Types:
         """The value of iterable should be longer than the provided minlength.
@@ -334,7 +312,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, MinlengthModifier(length))
+        return Types(self, modifiers.MinlengthModifier(length))
 
     def maxlength(self, length: int | Callable | Types) -> Types:
         """The value of iterable should be shorter than the provided maxlength.
@@ -345,7 +323,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, MaxlengthModifier(length))
+        return Types(self, modifiers.MaxlengthModifier(length))
 
     def length(self, minlength: int, maxlength: Optional[int] = None) -> Types:
         """Fields marked with length should have a length which is between the
@@ -359,463 +337,499 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, LengthModifier(minlength, maxlength))
+        return Types(self, modifiers.LengthModifier(minlength, maxlength))
 
     def add(self, by: int | float | Callable | Types) -> Types:
         """This modifier adds int or float value to original value
 
         """
-        return Types(self, EagerModifier(), AddModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.AddModifier(by))
 
     def sub(self, by: int | float | Callable | Types) -> Types:
         """This modifier for Int or float value subs original value
         """
-        return Types(self, EagerModifier(), SubModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.SubModifier(by))
 
     def mul(self, by: int | float | Callable | Types) -> Types:
         """This modifier for Int or float value muls by original value
         """
-        return Types(self, EagerModifier(), MulModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.MulModifier(by))
 
     def pow(self, by: int | float | Callable | Types) -> Types:
         """This modifer is used to transform the value of the int or float value
         to the power of the original value
         """
-        return Types(self, EagerModifier(), PowModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.PowModifier(by))
 
     def div(self, by: int | float | Callable | Types) -> Types:
         """This modifier for Int or float value divs by original value
         """
-        return Types(self, EagerModifier(), DivModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.DivModifier(by))
 
     def mod(self, by: int | float | Callable | Types) -> Types:
         """This modifier for Int or float value mods original value
         """
-        return Types(self, EagerModifier(), ModModifier(by))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ModModifier(by))
 
     def map(self, validate_callable: Callable) -> Types:
         """This modifier is used to getting a map object of the results
         """
-        return Types(self, EagerModifier(), MapModifier(validate_callable))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.MapModifier(validate_callable))
 
     def filter(self, validate_callable: Callable) -> Types:
         """This modifier is used to filter the given sequence
         """
-        return Types(self, EagerModifier(), FilterModifier(validate_callable))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.FilterModifier(validate_callable))
 
     def hasprefix(self, validate_prefix: str | list[str | int] | Callable | Types) -> Types:
         """Hasprefix modifier validates if a string is prefix of another string
         or a list is prefix of another list
         """
-        return Types(self, HasPrefixModifier(validate_prefix))
+        return Types(self, modifiers.HasPrefixModifier(validate_prefix))
 
     def hassuffix(self, validate_suffix: str | list[str | int] | Callable | Types) -> Types:
         """Hassuffix modifier validates if a string is suffix of another string
         or a list is suffix of another list
         """
-        return Types(self, HasSuffixModifier(validate_suffix))
+        return Types(self, modifiers.HasSuffixModifier(validate_suffix))
 
     def isprefixof(self, prefix: str | list[str | int] | Callable | Types) -> Types:
         """Hassuffix modifier validates if a string is suffix of another string
         or a list is suffix of another list
         """
-        return Types(self, IsPrefixOfModifier(prefix))
+        return Types(self, modifiers.IsPrefixOfModifier(prefix))
 
     def issuffixof(self, suffix: str | list[str | int] | Callable | Types) -> Types:
         """Hassuffix modifier validates if a string is suffix of another string
         or a list is suffix of another list
         """
-        return Types(self, IsSuffixOfModifier(suffix))
+        return Types(self, modifiers.IsSuffixOfModifier(suffix))
 
     def insertat(self, item: Any | Callable | Types, index: int | Callable | Types) -> Types:
         """
         """
-        return Types(self, EagerModifier(), InsertAtModifier(item, index))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.InsertAtModifier(item, index))
 
     def prepend(self, item: str | int | float | Callable | Types) -> Types:
         """
         """
-        return Types(self, EagerModifier(), PrependModifier(item))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.PrependModifier(item))
 
     def append(self, item: str | int | float | Callable | Types) -> Types:
         """
         """
-        return Types(self, EagerModifier(), AppendModifier(item))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.AppendModifier(item))
 
     @property
     def len(self) -> Types:
         """Return the length of value.
         """
-        return Types(self, EagerModifier(), LenModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.LenModifier())
 
     def upperbond(self, max_value: int | float | Callable | Types) -> Types:
         """Decrease the value of the field to upperbond if the value of the
         field is larger than upperbond.
         """
-        return Types(self, EagerModifier(), UpperbondModifier(max_value))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.UpperbondModifier(max_value))
 
     def lowerbond(self, min_value: int | float | Callable | Types) -> Types:
         """Increase the value of the field to lowerbond if the value of the
         field is smaller than lowerbond.
         """
-        return Types(self, EagerModifier(), LowerbondModifier(min_value))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.LowerbondModifier(min_value))
 
     @property
     def inverse(self) -> Types:
         """Change the value to false if value is true, vice versa.
         """
-        return Types(self, EagerModifier(), InverseModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.InverseModifier())
 
     @property
     def wrapintolist(self) -> Types:
         """
         """
-        return Types(self, WrapIntoListModifier())
+        return Types(self, modifiers.WrapIntoListModifier())
 
     @property
     def sqrt(self) -> Types:
         """This modifier is used to transform the square root of any number.
         """
-        return Types(self, EagerModifier(), SqrtModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.SqrtModifier())
 
     @property
     def url(self) -> Types:
         """Fields marked with url should be valid url string.
         """
-        return Types(self, UrlModifier())
+        return Types(self, modifiers.UrlModifier())
 
     @property
     def digit(self) -> Types:
         """Values of fields marked with digit should be valid digit string.
         """
-        return Types(self, DigitModifier())
+        return Types(self, modifiers.DigitModifier())
 
     @property
     def alpha(self) -> Types:
         """Values of fields marked with alpha should be valid alpha string.
         """
-        return Types(self, AlphaModifier())
+        return Types(self, modifiers.AlphaModifier())
 
     @property
     def numeric(self) -> Types:
         """Values of fields marked with numeric should be valid numeric string.
         """
-        return Types(self, NumericModifier())
+        return Types(self, modifiers.NumericModifier())
 
     @property
     def email(self) -> Types:
         """Values of fields marked with email should be valid email format.
         """
-        return Types(self, EmailModifier())
+        return Types(self, modifiers.EmailModifier())
 
     @property
     def hexcolor(self) -> Types:
         """Values of fields marked with hexcolor should be valid hexcolor format.
         """
-        return Types(self, HexColorModifier())
+        return Types(self, modifiers.HexColorModifier())
 
     @property
     def securepw(self) -> Types:
         """Values of fields marked with password should be valid secure password
         format.
         """
-        return Types(self, SecurepwModifier())
+        return Types(self, modifiers.SecurepwModifier())
 
     @property
     def alnum(self) -> Types:
         """Values fields marked with alnum should be valid alnum strings.
         """
-        return Types(self, AlnumModifier())
+        return Types(self, modifiers.AlnumModifier())
 
     @property
     def int(self) -> Types:
         """Fields marked with int should be int type. This is a type modifier.
         """
-        return Types(self, IntModifier())
+        return Types(self, modifiers.IntModifier())
 
     @property
     def odd(self) -> Types:
         """Fields marked with int should be odd. This is a int type modifier.
         """
-        return Types(self, OddModifier())
+        return Types(self, modifiers.OddModifier())
 
     @property
     def even(self) -> Types:
         """Fields marked with int should be even. This is a int type modifier.
         """
-        return Types(self, EvenModifier())
+        return Types(self, modifiers.EvenModifier())
 
     @property
     def float(self) -> Types:
         """Fields marked with float should be float type. This is a type
         modifier.
         """
-        return Types(self, FloatModifier())
+        return Types(self, modifiers.FloatModifier())
 
     def min(self, value: Float | Callable | Types) -> Types:
         """Fields marked with min are tested again this value. Values less than
         the argument value are considered invalid.
         """
-        return Types(self, MinModifier(value))
+        return Types(self, modifiers.MinModifier(value))
 
     def max(self, value: Float | Callable | Types) -> Types:
         """Fields marked with max are tested again this value. Values greater
         than the argument value are considered invalid.
         """
-        return Types(self, MaxModifier(value))
+        return Types(self, modifiers.MaxModifier(value))
 
     def lte(self, value: Float | Callable | Types) -> Types:
         """Fields marked with lte are tested again this value. Values greater
         than the argument value are considered invalid.
         """
-        return Types(self, MaxModifier(value))
+        return Types(self, modifiers.MaxModifier(value))
 
     def gte(self, value: Float | Callable | Types) -> Types:
         """Fields marked with gte are tested again this value. Values less than
         the argument value are considered invalid.
         """
-        return Types(self, MinModifier(value))
+        return Types(self, modifiers.MinModifier(value))
 
     def lt(self, value: Float | Callable | Types) -> Types:
         """Fields marked with lt are tested again this value. Values greater
         or equal than the argument value are considered invalid.
         """
-        return Types(self, LtModifier(value))
+        return Types(self, modifiers.LtModifier(value))
 
     def gt(self, value: Float | Callable | Types) -> Types:
         """Fields marked with gt are tested again this value. Values less than
         or equal than the argument value are considered invalid.
         """
-        return Types(self, GtModifier(value))
+        return Types(self, modifiers.GtModifier(value))
 
 
     def range(self, min_value: Float | Callable | Types, max_value: Float | Callable | Types) -> Types:
         """Fields marked with range are tested again argument values. Only
         values between the arguments range are considered valid.
         """
-        return Types(self, RangeModifier(min_value, max_value))
+        return Types(self, modifiers.RangeModifier(min_value, max_value))
 
     @property
     def negative(self) -> Types:
         """Fields marked with negative should have a value less than zero.
         """
-        return Types(self, NegativeModifier())
+        return Types(self, modifiers.NegativeModifier())
 
     @property
     def positive(self) -> Types:
         """Fields marked with negative should have a value greater than zero.
         """
-        return Types(self, PositiveModifier())
+        return Types(self, modifiers.PositiveModifier())
 
     @property
     def nonnegative(self) -> Types:
         """Fields marked with nonnegative should have a value greater than or
         equal to zero.
         """
-        return Types(self, NonnegativeModifier())
+        return Types(self, modifiers.NonnegativeModifier())
 
     @property
     def nonpositive(self) -> Types:
         """Fields marked with nonnegative should have a value less than or
         equal to zero.
         """
-        return Types(self, NonpositiveModifier())
+        return Types(self, modifiers.NonpositiveModifier())
 
     @property
     def bool(self) -> Types:
         """Fields marked with bool should be bool type. This is a type modifier.
         """
-        return Types(self, BoolModifier())
+        return Types(self, modifiers.BoolModifier())
 
     @property
     def date(self) -> Types:
         """Fields marked with date should be date type. This is a type modifier.
         """
-        return Types(self, DateModifier())
+        return Types(self, modifiers.DateModifier())
 
     @property
     def datetime(self) -> Types:
         """Fields marked with datetime should be datetime type. This is a type
         modifier.
         """
-        return Types(self, DatetimeModifier())
+        return Types(self, modifiers.DatetimeModifier())
 
     def before(self, point: Date | Datetime | Callable | Types) -> Types:
         """InputDate should be before the date. This is a date modifier
         """
-        return Types(self, BeforeModifier(point))
+        return Types(self, modifiers.BeforeModifier(point))
 
     def after(self, point: Date | Datetime | Callable | Types) -> Types:
         """InputDate should be after the date. This is a date modifier
         """
-        return Types(self, AfterModifier(point))
+        return Types(self, modifiers.AfterModifier(point))
 
     @property
     def tobosec(self) -> Types:
         """This modifier empty the microsecond in datetime.
         """
-        return Types(self, EagerModifier(), ToBoSecModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoSecModifier())
 
     @property
     def tobomin(self) -> Types:
         """This modifier empty the microsecond and second in datetime
         """
-        return Types(self, EagerModifier(), ToBoMinModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoMinModifier())
 
     @property
     def tobohour(self) -> Types:
         """This modifier empty microsecond, second and minute in datetime
         """
-        return Types(self, EagerModifier(), ToBoHourModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoHourModifier())
 
     @property
     def tonextsec(self) -> Types:
         """This modifier Go to the next second in datetime
         """
-        return Types(self, EagerModifier(), ToNextSecModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextSecModifier())
 
     @property
     def tonextmin(self) -> Types:
         """This modifier Go to the next minute in datetime
         """
-        return Types(self, EagerModifier(), ToNextMinModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextMinModifier())
 
     @property
     def tonexthour(self) -> Types:
         """This modifier Go to the next hour in datetime
         """
-        return Types(self, EagerModifier(), ToNextHourModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextHourModifier())
 
     @property
     def tonextyear(self) -> Types:
         """This modifier Go to the next year in datetime or in date
         """
-        return Types(self, EagerModifier(), ToNextYearModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextYearModifier())
 
     @property
     def tonextmon(self) -> Types:
         """This modifier Go to the next month in datetime or in date
         """
-        return Types(self, EagerModifier(), ToNextMonModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextMonModifier())
 
     @property
     def tonextday(self) -> Types:
         """This modifier Go to the next day in datetime or in date
         """
-        return Types(self, EagerModifier(), ToNextDayModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToNextDayModifier())
 
     @property
     def toboyear(self) -> Types:
         """This modifier empty microsecond, second, minute, hour, day and month
         in datetime or empty day, month in date
         """
-        return Types(self, EagerModifier(), ToBoYearModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoYearModifier())
 
     @property
     def tobomon(self) -> Types:
         """This modifier empty microsecond, second, minute, hour and day in
         datetime or empty day in date
         """
-        return Types(self, EagerModifier(), ToBoMonModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoMonModifier())
 
     @property
     def toboday(self) -> Types:
         """This modifier empty microsecond, second, minute and hour in
         datetime or return date directly
         """
-        return Types(self, EagerModifier(), ToBoDayModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoDayModifier())
 
     def fmtd(self, format: str | Callable | Types) -> Types:
         """This modifier format datetime or date value.
         """
-        return Types(self, FormatDatetimeModifier(format))
+        return Types(self, modifiers.FormatDatetimeModifier(format))
 
     def enum(self, enum_class: type[Enum] | str) -> Types:
         """Fields marked with enum should be enum value of provided enum type.
         This is a type modifier.
         """
-        return Types(self, EnumModifier(enum_class))
+        return Types(self, modifiers.EnumModifier(enum_class))
 
     @property
     def inputall(self) -> Types:
         """Inputall makes enum field to accept all kinds of acceptable enum
         values in any forms.
         """
-        return Types(self, InputAllModifier())
+        return Types(self, modifiers.InputAllModifier())
 
     @property
     def inputlname(self) -> Types:
         """Inputlname makes enum field to accept enum's lowercase name as
         input.
         """
-        return Types(self, InputLnameModifier())
+        return Types(self, modifiers.InputLnameModifier())
 
     @property
     def inputname(self) -> Types:
         """Inputlname makes enum field to accept enum's uppercase name as
         input.
         """
-        return Types(self, InputNameModifier())
+        return Types(self, modifiers.InputNameModifier())
 
     @property
     def inputvalue(self) -> Types:
         """Inputlname makes enum field to accept enum's value as input.
         """
-        return Types(self, InputValueModifier())
+        return Types(self, modifiers.InputValueModifier())
 
     @property
     def outputlname(self) -> Types:
         """Outputlname makes enum field to output lowercase name as display
         value.
         """
-        return Types(self, OutputLnameModifier())
+        return Types(self, modifiers.OutputLnameModifier())
 
     @property
     def outputname(self) -> Types:
         """Outputname makes enum field to output uppercase name as display
         value.
         """
-        return Types(self, OutputNameModifier())
+        return Types(self, modifiers.OutputNameModifier())
 
     @property
     def outputvalue(self) -> Types:
         """Outputvalue makes enum field to output value as display value.
         """
-        return Types(self, OutputValueModifier())
+        return Types(self, modifiers.OutputValueModifier())
 
     def listof(self, item_types: Any) -> Types:
         """Fields marked with listof should be a list of the given type. This
         is a type modifier.
         """
-        return Types(self, ListOfModifier(item_types))
+        return Types(self, modifiers.ListOfModifier(item_types))
 
     def dictof(self, item_types: Any) -> Types:
         """Fields marked with listof should be a str keyed dict of the given
         type. This is a type modifier.
         """
-        return Types(self, DictOfModifier(item_types))
+        return Types(self, modifiers.DictOfModifier(item_types))
 
     @property
     def strict(self) -> Types:
         """Object fields marked with strict disallow undefined keys.
         """
-        return Types(self, StrictModifier())
+        return Types(self, modifiers.StrictModifier())
 
     def objof(self, jcls: Any) -> Types:
         """Fields marked with objof are objects of given class.
         """
-        return Types(self, InstanceOfModifier(jcls))
+        return Types(self, modifiers.InstanceOfModifier(jcls))
 
-    def union(self, type_list: list[Any]) -> Types:
+    def union(self, type_list: list[Any],
+              discriminator: Optional[str] = None) -> Types:
         """Fields marked with union accepts value from these types.
+
+        Args:
+          type_list (list[Any]): The types of this union field.
+          discriminator (Optional[str]): For unions of JSON classes, the key \
+            of which value of an object input names the class to transform \
+            into.
+
+        Returns:
+          Types: A new types chained with this modifier.
         """
-        return Types(self, UnionModifier(type_list))
+        return Types(self, modifiers.UnionModifier(type_list, discriminator))
 
     @property
     def any(self) -> Types:
         """Fields marked with any can be any value.
         """
-        return Types(self, AnyModifier())
+        return Types(self, modifiers.AnyModifier())
 
     @property
     def required(self) -> Types:
@@ -824,7 +838,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, RequiredModifier())
+        return Types(self, modifiers.RequiredModifier())
 
     @property
     def nullable(self) -> Types:
@@ -836,7 +850,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, NullableModifier())
+        return Types(self, modifiers.NullableModifier())
 
     @property
     def present(self) -> Types:
@@ -844,7 +858,7 @@ class Types:
         if it has a None value. This is useful for foreign key fields to do
         required validation.
         """
-        return Types(self, PresentModifier())
+        return Types(self, modifiers.PresentModifier())
 
     def presentwith(self, referring_key: str) -> Types:
         """Fields marked with presentwith modifier are forced presented if
@@ -852,7 +866,7 @@ class Types:
         field's value is optional. If referring field has non None value, value
         of this field is required.
         """
-        return Types(self, PresentWithModifier(referring_key))
+        return Types(self, modifiers.PresentWithModifier(referring_key))
 
     def presentwithout(self, referring_keys: Str | list[Str]) -> Types:
         """Fields marked with presentwithout modifier are forced presented if
@@ -860,7 +874,7 @@ class Types:
         field's value should be present. If referring field has non None value,
         value of this field is not forced to be present.
         """
-        return Types(self, PresentWithoutModifier(referring_keys))
+        return Types(self, modifiers.PresentWithoutModifier(referring_keys))
 
     def validate(self, validator: Callable | Types) -> Types:
         """The validate modifier takes a modifier callable as its sole
@@ -875,7 +889,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, ValidateModifier(validator))
+        return Types(self, modifiers.ValidateModifier(validator))
 
     def v(self, validator: Callable | Types) -> Types:
         """The validate modifier takes a modifier callable as its sole
@@ -890,7 +904,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, ValidateModifier(validator))
+        return Types(self, modifiers.ValidateModifier(validator))
 
     def vmsg(self, validator: Callable | Types, message: str) -> Types:
         """The validate modifier takes a modifier callable as its sole
@@ -906,7 +920,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, ValidateModifier(validator, message))
+        return Types(self, modifiers.ValidateModifier(validator, message))
 
     def compare(self, compare_callable: Callable) -> Types:
         """The compare modifier takes a modifier callable as its sole
@@ -923,8 +937,8 @@ class Types:
             Types: A new types chained with this modifier.
         """
         return Types(self,
-                     ResetModifier(),
-                     CompareModifier(compare_callable))
+                     modifiers.ResetModifier(),
+                     modifiers.CompareModifier(compare_callable))
 
     # transformers
 
@@ -939,7 +953,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, DefaultModifier(value))
+        return Types(self, modifiers.DefaultModifier(value))
 
     def truncate(self, max_length: Int | Callable | Types) -> Types:
         """During initialization and set, if string value is too long, it's
@@ -951,7 +965,8 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), TruncateModifier(max_length))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.TruncateModifier(max_length))
 
     @property
     def trim(self) -> Types:
@@ -961,7 +976,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), TrimModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.TrimModifier())
 
     @property
     def totitle(self) -> Types:
@@ -970,7 +985,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToTitleModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToTitleModifier())
 
     @property
     def tocap(self) -> Types:
@@ -979,7 +995,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToCapModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToCapModifier())
 
     @property
     def tolower(self) -> Types:
@@ -988,7 +1005,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToLowerModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToLowerModifier())
 
     @property
     def toupper(self) -> Types:
@@ -997,7 +1015,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToUpperModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToUpperModifier())
 
     def padstart(self, char: str | Callable | Types, length: int | Callable | Types) -> Types:
         """This modifier padstart string.
@@ -1005,7 +1024,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), PadStartModifier(char, length))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.PadStartModifier(char, length))
 
     def padend(self, char: str | Callable | Types, length: int | Callable | Types) -> Types:
         """This modifier padstart string.
@@ -1013,7 +1033,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), PadEndModifier(char, length))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.PadEndModifier(char, length))
 
     @property
     def tolist(self) -> Types:
@@ -1022,7 +1043,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToListModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToListModifier())
 
     @property
     def tobool(self) -> Types:
@@ -1031,7 +1053,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToBoolModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToBoolModifier())
 
     @property
     def tofloat(self) -> Types:
@@ -1040,7 +1063,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToFloatModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToFloatModifier())
 
     @property
     def toint(self) -> Types:
@@ -1049,7 +1073,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToIntModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToIntModifier())
 
     @property
     def tostr(self) -> Types:
@@ -1058,34 +1083,39 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ToStrModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ToStrModifier())
 
     def replace(self, old: Str | Callable | Types, new: Str | Callable | Types) -> Types:
         """Replace modifier replaces occurance with substitutions.
         """
-        return Types(self, EagerModifier(), ReplaceModifier(old, new))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ReplaceModifier(old, new))
 
-    def replacer(self, reg: Str | Callable | Types, rep: Str | Callable | Types) -> Types:
+    def replacer(self, reg: Str | Pattern | Callable | Types, rep: Str | Callable | Types) -> Types:
         """Replacer modifier replaces occurance matches regular expression with
         replacement string.
         """
-        return Types(self, EagerModifier(), ReplacerModifier(reg, rep))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ReplacerModifier(reg, rep))
 
-    def split(self, sep: Str | Callable | Types) -> Types:
+    def split(self, sep: Str | Pattern | Callable | Types) -> Types:
         """Split modifier splits string into a list of strings.
         """
-        return Types(self, EagerModifier(), SplitModifier(sep))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.SplitModifier(sep))
 
     def join(self, sep: Str | Callable | Types) -> Types:
         """Join modifier concatenates a list of strings into a single string.
         """
-        return Types(self, EagerModifier(), JoinModifier(sep))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.JoinModifier(sep))
 
     @property
     def salt(self) -> Types:
         """Salt modifier add salt to a string.
         """
-        return Types(self, EagerModifier(), SaltModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.SaltModifier())
 
     @property
     def round(self) -> Types:
@@ -1094,7 +1124,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), RoundModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.RoundModifier())
 
     @property
     def ceil(self) -> Types:
@@ -1103,7 +1134,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), CeilModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.CeilModifier())
 
     @property
     def floor(self) -> Types:
@@ -1112,7 +1143,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), FloorModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.FloorModifier())
 
     @property
     def abs(self) -> Types:
@@ -1121,7 +1153,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), AbsModifier())
+        return Types(self, modifiers.EagerModifier(), modifiers.AbsModifier())
 
     def transform(self, transformer: Callable | Types) -> Types:
         """This modifier applies transfromer on the value. When value is None,
@@ -1135,7 +1167,8 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), TransformModifier(transformer))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.TransformModifier(transformer))
 
     def t(self, transformer: Callable | Types) -> Types:
         """This modifier applies transfromer on the value. When value is None,
@@ -1149,7 +1182,8 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), TransformModifier(transformer))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.TransformModifier(transformer))
 
     def fmt(self, formatter: Callable | Types) -> Types:
         """Fmt formats value.
@@ -1160,7 +1194,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, FmtModifier(formatter))
+        return Types(self, modifiers.FmtModifier(formatter))
 
     def reverse(self) -> Types:
         """This modifier reverse iterable value
@@ -1168,7 +1202,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), ReverseModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.ReverseModifier())
 
     def uploader(self, uploader: Callable | str) -> Types:
         """Uploader is barely a syntax alias for transformer. Uploaded files
@@ -1182,7 +1217,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, EagerModifier(), UploaderModifier(uploader))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.UploaderModifier(uploader))
 
     def asop(self, asop_transformer: Callable) -> Types:
         """Asop modifier assigns transformed operator value to this field. When
@@ -1196,7 +1232,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, AsopModifier(asop_transformer))
+        return Types(self, modifiers.AsopModifier(asop_transformer))
 
     @property
     def asopd(self) -> Types:
@@ -1207,7 +1243,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, AsopdModifier())
+        return Types(self, modifiers.AsopdModifier())
 
     def setonsave(self, setter: Callable) -> Types:
         """Setonsave modifier marks a field to be updated just before
@@ -1221,7 +1257,8 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, PreserializeModifier(), SetOnSaveModifier(setter))
+        return Types(self, modifiers.PreserializeModifier(),
+                     modifiers.SetOnSaveModifier(setter))
 
     def fsetonsave(self, setter: Callable) -> Types:
         """Fsetonsave modifier marks a field to be updated just before
@@ -1234,7 +1271,8 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, PreserializeModifier(), FSetOnSaveModifier(setter))
+        return Types(self, modifiers.PreserializeModifier(),
+                     modifiers.FSetOnSaveModifier(setter))
 
     def onsave(self, callback: Callable) -> Types:
         """Onsave inserts a callback into the modifier chain. If save action
@@ -1247,7 +1285,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, OnSaveModifier(callback))
+        return Types(self, modifiers.OnSaveModifier(callback))
 
     def onupdate(self, callback: Callable) -> Types:
         """Onupdate is a callback modifier. If value updated when saving, this
@@ -1259,7 +1297,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, ResetModifier(), OnUpdateModifier(callback))
+        return Types(self, modifiers.ResetModifier(),
+                     modifiers.OnUpdateModifier(callback))
 
     def onwrite(self, callback: Callable) -> Types:
         """Onwrite is a callback modifier. Whenever a new value is being
@@ -1271,7 +1310,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, OnWriteModifier(callback))
+        return Types(self, modifiers.OnWriteModifier(callback))
 
     @property
     def nonnull(self) -> Types:
@@ -1284,7 +1323,7 @@ class Types:
         Returns:
           Types: A new types chained with this modifier.
         """
-        return Types(self, NonnullModifier())
+        return Types(self, modifiers.NonnullModifier())
 
     # compound
 
@@ -1292,22 +1331,24 @@ class Types:
     def mongoid(self: Types) -> Types:
         """This modifier assigns a default bson object id to the field.
         """
-        return Types(self, MongoIdModifier())
+        return Types(self, modifiers.MongoIdModifier())
 
     @property
     def tscreated(self: Types) -> Types:
         """This modifier adds a default current time to the field.
         """
-        return Types(self, DefaultModifier(lambda: datetime.now(timezone.utc)))
+        return Types(self, modifiers.DefaultModifier(
+            lambda: datetime.now(timezone.utc)))
 
     @property
     def tsupdated(self: Types) -> Types:
         """This modifier adds a default current time and a set on save.
         """
         return Types(self,
-                     DefaultModifier(datetime.now),
-                     PreserializeModifier(),
-                     SetOnSaveModifier(lambda: datetime.now(timezone.utc)))
+                     modifiers.DefaultModifier(datetime.now),
+                     modifiers.PreserializeModifier(),
+                     modifiers.SetOnSaveModifier(
+                         lambda: datetime.now(timezone.utc)))
 
     def umininterval(self: Types, interval: timedelta) -> Types:
         """This modifier compares old and new value against the time interval.
@@ -1317,8 +1358,8 @@ class Types:
                 return None
             return 'time interval too short'
         return Types(self,
-                     ResetModifier(),
-                     CompareModifier(compare_callable))
+                     modifiers.ResetModifier(),
+                     modifiers.CompareModifier(compare_callable))
 
     # authorization
 
@@ -1326,18 +1367,19 @@ class Types:
     def authidentity(self: Types) -> Types:
         """Fields marked with authidentity are used for authorization.
         """
-        return Types(self, AuthIdentityModifier())
+        return Types(self, modifiers.AuthIdentityModifier())
 
     def authby(self: Types, checker: Types) -> Types:
         """Fields marked with authby are used for authorization.
         """
-        return Types(self, AuthByModifier(checker))
+        return Types(self, modifiers.AuthByModifier(checker))
 
     @property
     def authbycheckpw(self: Types) -> Types:
         """This is a shortcut to `authby(types.checkpw(types.passin))`.
         """
-        return Types(self, AuthByModifier(types.checkpw(types.passin)))
+        return Types(self,
+                     modifiers.AuthByModifier(types.checkpw(types.passin)))
 
 
     def canc(self, checker: Callable | Types) -> Types:
@@ -1356,7 +1398,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, CanCModifier(checker))
+        return Types(self, modifiers.CanCModifier(checker))
 
     def canu(self, checker: Callable | Types) -> Types:
         """CanU modifier validates value against the operator object user
@@ -1374,7 +1416,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, CanUModifier(checker))
+        return Types(self, modifiers.CanUModifier(checker))
 
     def canw(self, checker: Callable | Types) -> Types:
         """CanW modifier validates value against the operator object user
@@ -1392,7 +1434,8 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, CanCModifier(checker), CanUModifier(checker))
+        return Types(self, modifiers.CanCModifier(checker),
+                     modifiers.CanUModifier(checker))
 
     def canr(self, checker: Callable | Types) -> Types:
         """CanR modifier validates value against the operator object user
@@ -1410,7 +1453,7 @@ class Types:
         Returns:
             Types: A new types chained with this modifier.
         """
-        return Types(self, CanRModifier(checker))
+        return Types(self, modifiers.CanRModifier(checker))
 
     # calc pipeline
 
@@ -1418,108 +1461,110 @@ class Types:
     def passin(self: Types) -> Types:
         """Pass in modifier users passin value as the result.
         """
-        return Types(self, EagerModifier(), PassinModifier())
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.PassinModifier())
 
     def checkpw(self: Types, against: Types) -> Types:
         """Checkpw modifier uses bcrypt's checkpw function to validate str
         value.
         """
-        return Types(self, CheckpwModifier(against))
+        return Types(self, modifiers.CheckpwModifier(against))
 
     def randomdigits(self: Types, length: int | Callable | Types) -> Types:
         """Random digits modifier generates a random digits string of length.
         """
-        return Types(self, RandomDigitsModifier(length))
+        return Types(self, modifiers.RandomDigitsModifier(length))
 
     def randomalnums(self: Types, length: Int | Callable | Types) -> Types:
         """Random alnums modifier generates a random alnums string of length.
         """
-        return Types(self, RandomAlnumsModifier(length))
+        return Types(self, modifiers.RandomAlnumsModifier(length))
 
     def randomalnumpuncs(self: Types, length: int | Callable | Types) -> Types:
         """Random alnumpuncs modifier generates a random alnumpuncs string of
         length.
         """
-        return Types(self, RandomAlnumpuncsModifier(length))
+        return Types(self, modifiers.RandomAlnumpuncsModifier(length))
 
     def randomint(self: Types, min_value: int | float | Callable | Types,
                     max_value: int | float | Callable | Types) -> Types:
         """Random int modifier generates a random int value."""
-        return Types(self, RandomIntModifier(min_value, max_value))
+        return Types(self, modifiers.RandomIntModifier(min_value, max_value))
 
     def randomfloat(self: Types, min_value: int | float | Callable | Types,
                     max_value: int | float | Callable | Types) -> Types:
         """Random float modifier generates a random float value."""
-        return Types(self, EagerModifier(), RandomFloatModifier(min_value, max_value))
+        return Types(self, modifiers.EagerModifier(),
+                     modifiers.RandomFloatModifier(min_value, max_value))
 
     def crossfetch(self, cn: str, sk: str, fk: Optional[str] = None) -> Types:
         """Fetch a class with value matches this object's value at key.
         """
-        return Types(self, CrossFetchModifier(cn, sk, fk))
+        return Types(self, modifiers.CrossFetchModifier(cn, sk, fk))
 
     def fval(self: Types, field_name: str | Callable | Types) -> Types:
         """Get value at field from a JSONClass object.
         """
-        return Types(self, FValModifier(field_name))
+        return Types(self, modifiers.FValModifier(field_name))
 
     def fobj(self: Types, field_name: str | Callable | Types) -> Types:
         """Get referenced object at field from a JSONClass object. Include it if
         it's not exist.
         """
-        return Types(self, FObjModifier(field_name))
+        return Types(self, modifiers.FObjModifier(field_name))
 
     def eq(self: Types, val: Any | Callable | Types) -> Types:
         """Eq modifier validates value by equal testing.
         """
-        return Types(self, EqModifier(val))
+        return Types(self, modifiers.EqModifier(val))
 
     def neq(self: Types, val: Any | Types | Callable) -> Types:
         """Neq modifier validates value by unequal testing.
         """
-        return Types(self, NeqModifier(val))
+        return Types(self, modifiers.NeqModifier(val))
 
     @property
     def this(self: Types) -> Types:
         """Get the owner object of this field.
         """
-        return Types(self, ThisModifier())
+        return Types(self, modifiers.ThisModifier())
 
     def at(self: Types, index: Any | Callable | Types) -> Types:
         """At modifier returns result with subscription index.
         """
-        return Types(self, AtModifier(index))
+        return Types(self, modifiers.AtModifier(index))
 
     def assign(self: Types, name: str, value: Any | Types | Callable) -> Types:
         """Assign value to name of object.
         """
-        return Types(self, AssignModifier(name, value))
+        return Types(self, modifiers.AssignModifier(name, value))
 
     @property
     def isthis(self: Types) -> Types:
         """Check whether the current value is the owner object.
         """
-        return Types(self, IsThisModifier())
+        return Types(self, modifiers.IsThisModifier())
 
     def oneisvalid(self: Types, subroutines: list[Callable | Types]) -> Types:
         """One is valid is valid if one of subroutines is valid.
         """
-        return Types(self, OneIsValidModifier(subroutines))
+        return Types(self, modifiers.OneIsValidModifier(subroutines))
 
     def isobj(self: Types, getter: Types) -> Types:
         """Valid if objects are equal.
         """
-        return Types(self, IsObjModifier(getter))
+        return Types(self, modifiers.IsObjModifier(getter))
 
     def isobjof(self: Types, cls: type[JObject] | str) -> Types:
         """Valid if the value is object of a class.
         """
-        return Types(self, IsObjOfModifier(cls))
+        return Types(self, modifiers.IsObjOfModifier(cls))
 
     @property
     def getop(self: Types) -> Types:
         """Get the operator of this action.
         """
-        return Types(self, GetOpModifier())
+        return Types(self, modifiers.GetOpModifier())
 
     # internal
 
@@ -1527,7 +1572,28 @@ class Types:
         """This modifier marks unresolved status. This is used internally. Do
         not use this.
         """
-        return Types(self, UnresolvedModifier(arg))
+        return Types(self, modifiers.UnresolvedModifier(arg))
+
+
+def _interned_property(name: str, prop: property) -> property:
+    fget = prop.fget
+
+    def get(self: Types) -> Types:
+        interned = self._interned
+        if interned is None:
+            return fget(self)
+        result = interned.get(name)
+        if result is None:
+            result = fget(self)
+            result._interned = {}
+            interned[name] = result
+        return result
+    return property(get, doc=prop.__doc__)
+
+
+for _name, _prop in list(vars(Types).items()):
+    if isinstance(_prop, property):
+        setattr(Types, _name, _interned_property(_name, _prop))
 
 
 types = Types()
@@ -1540,3 +1606,4 @@ like this:
     enabled: bool = types.bool.readonly.required
     password: str = types.str.writeonly.length(8, 16).salt.required
 """
+types._interned = {}
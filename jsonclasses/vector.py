@@ -0,0 +1,149 @@
+"""This module defines the bulk evaluation of numeric list items, thus a
+context isn't built for each item. Lists of ints or floats are validated by
+checking constant bounds against the minimum and the maximum of the items.
+Lists of floats are transformed with array arithmetic if NumPy is installed.
+NumPy also locates invalid items if it's installed. It's imported on first use.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from operator import ge, gt, le, lt
+
+
+Bound = tuple[str, 'int | float']
+VectorValidator = Callable[[list], Optional[list[int]]]
+VectorTransformer = Callable[[list], Optional[list]]
+VectorStep = tuple[Optional[Callable[[Any], Any]], tuple[Bound, ...]]
+
+
+BOUND_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    'ge': ge, 'gt': gt, 'le': le, 'lt': lt
+}
+
+
+_numpy_module: Any = False
+
+
+def _numpy() -> Any:
+    """Import NumPy on first use. Returns None if it's not installed."""
+    global _numpy_module
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def isnumber(value: Any) -> bool:
+    """Check whether a value is an int or a float."""
+    return type(value) is int or type(value) is float
+
+
+def isexactfloat(value: Any) -> bool:
+    """Check whether a value is a float or an int which is exactly converted
+    to a float.
+    """
+    return type(value) is float or (type(value) is int
+                                    and abs(value) <= 2 ** 53)
+
+
+def vector_validator(cls: type,
+                     bounds: list[Bound]) -> Optional[VectorValidator]:
+    """Create a validator of lists of numbers.
+
+    The validator takes a list and returns the indices of the items which
+    may be invalid. The items of the indices should be validated one by one
+    to get the error messages. If the items are not all of the type, the
+    validator returns None and every item should be validated.
+
+    Args:
+        cls (type): The type of the items, int or float.
+        bounds (list[Bound]): The bounds which valid items satisfy.
+
+    Returns:
+        Optional[VectorValidator]: The validator or None if the type is not \
+            a number type.
+    """
+    if cls is not int and cls is not float:
+        return None
+    lows = [(BOUND_OPS[op], b) for op, b in bounds if op in ('ge', 'gt')]
+    highs = [(BOUND_OPS[op], b) for op, b in bounds if op in ('le', 'lt')]
+    checks = [*lows, *highs]
+
+    def validator(values: list) -> Optional[list[int]]:
+        if len(values) == 0:
+            return []
+        if set(map(type, values)) != {cls}:
+            return None
+        if not checks:
+            return []
+        if lows:
+            lo = min(values)
+            if not all(op(lo, b) for op, b in lows):
+                return _suspects(values, cls, checks)
+        if highs:
+            hi = max(values)
+            if not all(op(hi, b) for op, b in highs):
+                return _suspects(values, cls, checks)
+        return []
+    return validator
+
+
+def _suspects(values: list, cls: type, checks: list) -> list[int]:
+    numpy = _numpy()
+    if numpy is not None:
+        try:
+            arr = numpy.asarray(values, numpy.float64 if cls is float
+                                else numpy.int64)
+            valid = numpy.ones(len(values), dtype=bool)
+            for op, b in checks:
+                valid &= op(arr, b)
+            return numpy.flatnonzero(~valid).tolist()
+        except OverflowError:
+            # ints out of the int64 range are compared by Python
+            pass
+    return [i for i, v in enumerate(values)
+            if not all(op(v, b) for op, b in checks)]
+
+
+def vector_transformer(
+        steps: list[VectorStep]) -> Optional[VectorTransformer]:
+    """Create a transformer of lists of floats from array functions.
+
+    The transformer takes a list and returns the transformed list. If NumPy
+    is not installed, the items are not all floats, or a transformed item
+    doesn't satisfy a bound of a step, the transformer returns None and
+    items should be transformed one by one.
+
+    Args:
+        steps (list[VectorStep]): Each step has a function which takes and \
+            returns float64 arrays or None, and the bounds which transformed \
+            items satisfy.
+
+    Returns:
+        Optional[VectorTransformer]: The transformer or None if there isn't \
+            any function to apply.
+    """
+    if all(fn is None for fn, _ in steps):
+        return None
+    checks = [(fn, [(BOUND_OPS[op], b) for op, b in bounds])
+              for fn, bounds in steps]
+
+    def transformer(values: list) -> Optional[list]:
+        if len(values) == 0:
+            return None
+        numpy = _numpy()
+        if numpy is None:
+            return None
+        if set(map(type, values)) != {float}:
+            return None
+        arr = numpy.asarray(values, numpy.float64)
+        for fn, bounds in checks:
+            if fn is not None:
+                arr = fn(arr)
+            for op, b in bounds:
+                if not op(arr, b).all():
+                    return None
+        return arr.tolist()
+    return transformer
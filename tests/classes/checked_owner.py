@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional, TYPE_CHECKING
+from jsonclasses import jsonclass, types
+from jsonclasses.types import Types
+from jsonclasses.modifiers.modifier import Modifier
+if TYPE_CHECKING:
+    from jsonclasses.ctx import Ctx
+
+
+checked_values: list[str] = []
+
+
+def check(value: str) -> Optional[str]:
+    checked_values.append(value)
+    return 'too long' if len(value) > 10 else None
+
+
+class CheckModifier(Modifier):
+    """Check modifier is a built-in like pure validator which records the
+    values it checks.
+    """
+
+    def validate(self, ctx: Ctx) -> None:
+        msg = self.pure_validator()(ctx.val)
+        if msg is not None:
+            ctx.raise_vexc(msg)
+
+    def pure_validator(self) -> Optional[Callable[[Any], Optional[str]]]:
+        return lambda v: None if v is None else check(v)
+
+
+checked_str = Types(types.str, CheckModifier())
+allowed_names: set[str] = set()
+
+
+@jsonclass
+class CheckedOwner:
+    name: str = checked_str.required
+    reports: list[CheckedReport] = types.listof('CheckedReport') \
+                                        .linkedby('owner')
+
+
+@jsonclass
+class CheckedReport:
+    title: str = checked_str.required
+    tags: list[str] = types.listof(checked_str)
+    owner: Optional[CheckedOwner] = types.objof('CheckedOwner').linkto
+
+
+@jsonclass(compact=True)
+class CheckedCompact:
+    name: str = checked_str.required
+
+
+def check_limit(value: str, ctx: Ctx) -> Optional[str]:
+    checked_values.append(value)
+    return 'too long' if len(value) > ctx.owner.board.limit else None
+
+
+@jsonclass
+class CheckedBoard:
+    limit: int = types.int.required
+    posts: list[CheckedPost] = types.listof('CheckedPost').linkedby('board')
+
+
+@jsonclass
+class CheckedPost:
+    name: str = types.str.validate(check_limit).required
+    board: CheckedBoard = types.objof('CheckedBoard').linkto.required
+
+
+@jsonclass
+class CheckedTag:
+    name: str = types.str.validate(lambda v: v in allowed_names).required
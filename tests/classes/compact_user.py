@@ -0,0 +1,21 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass(compact=True)
+class CompactUser:
+    id: int = types.int.primary.required
+    name: str
+    score: Optional[float]
+    tags: list[str] = types.nonnull.listof(str)
+    first_name: str = types.str.getter(lambda u: u.name.split(' ')[0])
+    posts: list[CompactPost] = types.nonnull.listof('CompactPost') \
+                                    .linkedby('user')
+
+
+@jsonclass(compact=True, reset_all_fields=True)
+class CompactPost:
+    id: int = types.int.primary.required
+    title: str
+    user: Optional[CompactUser] = types.objof('CompactUser').linkto
@@ -0,0 +1,9 @@
+from __future__ import annotations
+from datetime import date, datetime
+from jsonclasses import jsonclass
+
+
+@jsonclass
+class DatetimeSeries:
+    stamps: list[datetime]
+    days: list[date]
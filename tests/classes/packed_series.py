@@ -0,0 +1,10 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class PackedSeries:
+    values: Optional[list[float]] = types.listof(float).packed
+    counts: Optional[list[int]] = types.listof(types.int.min(0)).packed
+    plain: Optional[list[float]] = types.listof(float)
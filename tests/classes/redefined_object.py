@@ -0,0 +1,10 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass
+from tests.classes.abstract_object import AbstractObject
+
+
+@jsonclass
+class RedefinedObject(AbstractObject):
+    id: Optional[int]
+    name: Optional[str]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class SaltedAccount:
+    name: str
+    password: str = types.str.salt.checkpw(types.this.fval('attempt')) \
+                                   .required
+    attempt: Optional[str]
+
+
+@jsonclass
+class SaltedLogin:
+    password: str = types.str.salt
+    pin: str = types.str.salt
@@ -0,0 +1,11 @@
+from __future__ import annotations
+from typing import Optional
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class SensorReadings:
+    levels: Optional[list[int]] = types.listof(types.int.range(0, 100))
+    temps: Optional[list[float]] = types.listof(types.float.min(-40).max(85))
+    scaled: Optional[list[float]] = types.listof(types.float.abs.mul(2).add(1))
+    counts: Optional[list[int]] = types.listof(types.int.positive)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+from re import compile
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class StringValidators:
+    email: str = types.str.email
+    url: str = types.str.url
+    color: str = types.str.hexcolor
+    code: str = types.str.alnum
+    digits: str = types.str.digit
+
+
+@jsonclass
+class CompiledPatterns:
+    name: str = types.str.match(compile('^[a-z]+$'))
+    words: list[str] = types.split(compile(r'\s*,\s*')).listof(str)
+    slug: str = types.str.replacer(compile(r'\s+'), '-')
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from typing import Any
+from jsonclasses import jsonclass, types
+
+
+@jsonclass
+class TaggedCat:
+    kind: str = types.str.default('TaggedCat')
+    name: str
+    lives: int = types.int.default(9)
+
+
+@jsonclass
+class TaggedDog:
+    kind: str = types.str.default('TaggedDog')
+    name: str
+    good: bool = types.bool.default(True)
+
+
+@jsonclass
+class TaggedOwner:
+    pet: Any = types.union(['TaggedCat', 'TaggedDog'], discriminator='kind')
+    payload: Any = types.union([str, int, 'TaggedCat', 'TaggedDog'])
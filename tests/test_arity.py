@@ -0,0 +1,37 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.arity import arity, _arities
+from jsonclasses.modifiers.validate_modifier import ValidateModifier
+from jsonclasses.modifiers.compare_modifier import CompareModifier
+
+
+class Checker:
+
+    def check(self, a, b):
+        return True
+
+
+class TestArity(TestCase):
+
+    def test_arity_counts_parameters(self):
+        self.assertEqual(arity(lambda: None), 0)
+        self.assertEqual(arity(lambda a: None), 1)
+        self.assertEqual(arity(lambda a, b, c: None), 3)
+
+    def test_arity_is_remembered(self):
+        def fn(a, b):
+            return None
+        self.assertEqual(arity(fn), 2)
+        self.assertEqual(_arities[fn], 2)
+
+    def test_arity_counts_bound_methods_without_self(self):
+        self.assertEqual(arity(Checker().check), 2)
+        self.assertEqual(_arities[Checker.check], 3)
+
+    def test_arity_counts_callables_without_weak_references(self):
+        self.assertEqual(arity(divmod), 2)
+
+    def test_arity_is_resolved_when_modifier_is_constructed(self):
+        self.assertEqual(ValidateModifier(lambda v: True).params_len, 1)
+        self.assertEqual(ValidateModifier(lambda v, c: True).params_len, 2)
+        self.assertEqual(CompareModifier(lambda o, n, c: True).params_len, 3)
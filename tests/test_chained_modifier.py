@@ -0,0 +1,96 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses import types
+from jsonclasses.ctx import Ctx, CtxCfg
+from jsonclasses.excs import ValidationException
+from jsonclasses.modifiers.chained_modifier import ChainedModifier
+from jsonclasses.modifiers.trim_modifier import TrimModifier
+from jsonclasses.modifiers.eager_modifier import EagerModifier
+from jsonclasses.modifiers.preserialize_modifier import PreserializeModifier
+from jsonclasses.modifiers.str_modifier import StrModifier
+from jsonclasses.modifiers.required_modifier import RequiredModifier
+from jsonclasses.modifiers.fmt_modifier import FmtModifier
+from jsonclasses.modifiers.fused_modifier import FusedModifier
+from jsonclasses.modifiers.maxlength_modifier import MaxlengthModifier
+from jsonclasses.modifiers.min_modifier import MinModifier
+from jsonclasses.modifiers.tolower_modifier import ToLowerModifier
+from tests.classes.simple_article import SimpleArticle
+
+
+class TestChainedModifier(TestCase):
+
+    def test_chained_modifier_stages_are_built_once(self):
+        str_modifier = StrModifier()
+        trim = TrimModifier()
+        eager = EagerModifier()
+        required = RequiredModifier()
+        preserialize = PreserializeModifier()
+        fmt = FmtModifier(lambda v: v.upper())
+        modifier = ChainedModifier([str_modifier, trim, eager, required,
+                                    preserialize, fmt])
+        self.assertEqual(modifier._tvs, (str_modifier, trim))
+        self.assertEqual(modifier._nvs, (eager, required))
+        self.assertEqual(modifier._pvs, (preserialize, fmt))
+
+    def test_chained_modifier_leaves_out_modifiers_without_hooks(self):
+        str_modifier = StrModifier()
+        trim = TrimModifier()
+        eager = EagerModifier()
+        required = RequiredModifier()
+        fmt = FmtModifier(lambda v: v.upper())
+        modifier = ChainedModifier([str_modifier, trim, required, eager, fmt])
+        self.assertEqual(modifier._ttvs[0].vs, [str_modifier, trim])
+        self.assertEqual(modifier._ttvs[1:], (required,))
+        self.assertEqual(modifier._ntvs, ())
+        self.assertEqual(modifier._nvvs, ())
+        self.assertEqual(modifier._jvs, (fmt,))
+
+    def test_chained_modifier_tojson_without_hooks_returns_value(self):
+        modifier = types.required.modifier
+        self.assertEqual(modifier._jvs, ())
+        ctx = Ctx.rootctx(SimpleArticle(), CtxCfg(), 'abc')
+        self.assertEqual(modifier.tojson(ctx), 'abc')
+
+    def test_chained_modifier_runs_stages_in_order(self):
+        modifier = types.str.trim.maxlength(3).required.modifier
+        ctx = Ctx.rootctx(SimpleArticle(), CtxCfg(), ' abc ')
+        self.assertEqual(modifier.transform(ctx), 'abc')
+        with self.assertRaises(ValidationException):
+            modifier.validate(Ctx.rootctx(SimpleArticle(), CtxCfg(), 'abcd'))
+
+    def test_chained_modifier_fuses_pure_modifiers(self):
+        trim = TrimModifier()
+        tolower = ToLowerModifier()
+        maxlength = MaxlengthModifier(3)
+        minimum = MinModifier(2)
+        modifier = ChainedModifier([trim, tolower, maxlength, minimum])
+        self.assertEqual(len(modifier._ntvs), 1)
+        self.assertIsInstance(modifier._ntvs[0], FusedModifier)
+        self.assertEqual(modifier._ntvs[0].vs, [trim, tolower])
+        self.assertEqual(len(modifier._nvvs), 1)
+        self.assertEqual(modifier._nvvs[0].vs, [maxlength, minimum])
+        ctx = Ctx.rootctx(SimpleArticle(), CtxCfg(), ' AB ')
+        self.assertEqual(modifier.transform(ctx), 'ab')
+
+    def test_chained_modifier_does_not_fuse_context_params(self):
+        maxlength = MaxlengthModifier(lambda: 3)
+        minimum = MinModifier(2)
+        modifier = ChainedModifier([maxlength, minimum])
+        self.assertEqual(modifier._nvvs, (maxlength, minimum))
+
+    def test_fused_validators_keep_messages(self):
+        modifier = types.str.maxlength(3).match('^a').modifier
+        with self.assertRaises(ValidationException) as context:
+            modifier.validate(Ctx.rootctx(SimpleArticle(), CtxCfg(), 'bcde'))
+        self.assertEqual(context.exception.keypath_messages[''],
+                         'length of value is not less than or equal 3')
+        ctx = Ctx.rootctx(SimpleArticle(), CtxCfg(all_fields=True), 'bcde')
+        with self.assertRaises(ValidationException) as context:
+            modifier.validate(ctx)
+        self.assertEqual(context.exception.keypath_messages[''],
+                         'value does not match \'^a\'')
+
+    def test_fused_eager_modifiers_validate_each_step(self):
+        modifier = types.str.trim.maxlength(3).modifier
+        ctx = Ctx.rootctx(SimpleArticle(), CtxCfg(), ' abc ')
+        self.assertEqual(modifier.transform(ctx), 'abc')
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.compact import FLAG_NEW, FLAG_MODIFIED, SlotFieldDescriptor
+from jsonclasses.excs import ValidationException
+from tests.classes.compact_user import CompactUser, CompactPost
+
+
+class TestCompact(TestCase):
+
+    def test_compact_class_is_slotted(self):
+        self.assertIn('name', CompactUser.__slots__)
+        self.assertIn('_flags', CompactUser.__slots__)
+        self.assertNotIn('first_name', CompactUser.__slots__)
+        self.assertIsInstance(CompactUser.__dict__['name'],
+                              SlotFieldDescriptor)
+
+    def test_compact_object_stores_fields_in_slots(self):
+        user = CompactUser(id=1, name='John Lee', score=1.5)
+        self.assertEqual(user.name, 'John Lee')
+        self.assertEqual(user.score, 1.5)
+        self.assertEqual(user.tags, [])
+        self.assertEqual(user.first_name, 'John')
+        self.assertEqual(user.__dict__, {})
+
+    def test_compact_object_packs_status_into_flags(self):
+        user = CompactUser(id=1, name='John')
+        self.assertEqual(user._flags, FLAG_NEW)
+        self.assertTrue(user.is_new)
+        user._mark_unmodified()
+        self.assertEqual(user._flags, 0)
+        user.name = 'Peter'
+        self.assertEqual(user._flags, FLAG_MODIFIED)
+        self.assertTrue(user.is_modified)
+        self.assertFalse(user.is_new)
+        self.assertEqual(user.modified_fields, ('name',))
+
+    def test_compact_object_allocates_containers_lazily(self):
+        user = CompactUser(id=1, name='John')
+        member = CompactUser.__dict__['_previous_values'].member
+        self.assertRaises(AttributeError, member.__get__, user)
+        self.assertEqual(user.previous_values, {})
+        self.assertEqual(member.__get__(user), {})
+
+    def test_compact_object_records_previous_values(self):
+        post = CompactPost(id=1, title='A')
+        post._mark_unmodified()
+        post.title = 'B'
+        self.assertEqual(post.previous_values, {'title': 'A'})
+        post.reset()
+        self.assertEqual(post.title, 'A')
+
+    def test_compact_object_outputs_json(self):
+        user = CompactUser(id=1, name='John', tags=['a'])
+        self.assertEqual(user.tojson(), {'id': 1, 'name': 'John',
+                                         'tags': ['a'], 'firstName': 'John',
+                                         'posts': []})
+
+    def test_compact_object_validates(self):
+        user = CompactUser(id=1)
+        self.assertRaises(ValidationException, user.validate)
+
+    def test_compact_objects_link_references(self):
+        user = CompactUser(id=1, name='John')
+        post = CompactPost(id=2, title='A', user=user)
+        self.assertEqual(user.posts, [post])
+        self.assertEqual(post.user_id, 1)
+        self.assertEqual(post._data_dict, {'id': 2, 'title': 'A', 'user': user})
+        post.user_id = 5
+        self.assertIsNone(post.user)
+        self.assertEqual(post.user_id, 5)
+
+    def test_compact_object_accepts_extra_attributes(self):
+        user = CompactUser(id=1, name='John')
+        user.extra = 1
+        self.assertEqual(user.extra, 1)
+
+    def test_compact_object_allocates_graph_lazily(self):
+        user = CompactUser(id=1, name='John')
+        self.assertIsNone(user._ograph)
+        self.assertEqual(list(user._graph), [user])
+        post = CompactPost(id=1, title='P')
+        post.user = user
+        self.assertIs(user._graph, post._graph)
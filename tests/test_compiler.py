@@ -0,0 +1,51 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.compiler import has_tojson_hook
+from tests.classes.simple_secret import SimpleSecret
+from tests.classes.simple_user import SimpleUser
+from tests.classes.linked_author import LinkedAuthor
+from tests.classes.linked_article import LinkedArticle
+
+
+class TestCompiler(TestCase):
+
+    def test_compiled_transform_is_compiled_once(self):
+        SimpleSecret(name='1')
+        compiled = SimpleSecret.cdef.compiled_transform
+        SimpleSecret(name='2')
+        self.assertIs(SimpleSecret.cdef.compiled_transform, compiled)
+
+    def test_compiled_transform_is_invalidated_when_refs_resolve(self):
+        cdef = LinkedAuthor.cdef
+        cdef._compiled_transform = None
+        cdef._ref_types_resolved = False
+        compiled = cdef.compiled_transform
+        cdef._resolve_types()
+        self.assertIsNone(cdef._compiled_transform)
+        self.assertIsNot(cdef.compiled_transform, compiled)
+
+    def test_compiled_transform_assigns_json_named_values(self):
+        author = LinkedAuthor(name='A', articles=[{'name': 'B'}])
+        self.assertEqual(author.name, 'A')
+        self.assertIsInstance(author.articles[0], LinkedArticle)
+        self.assertEqual(author.articles[0].author, author)
+
+    def test_compiled_transform_respects_write_rules(self):
+        secret = SimpleSecret(name=' 1 ', message='2')
+        self.assertEqual(secret._data_dict, {'name': '1', 'message': None})
+
+    def test_compiled_tojson_is_compiled_once(self):
+        SimpleUser(name='A').tojson()
+        compiled = SimpleUser.cdef.compiled_tojson
+        SimpleUser(name='B').tojson()
+        self.assertIs(SimpleUser.cdef.compiled_tojson, compiled)
+
+    def test_compiled_tojson_detects_tojson_hooks(self):
+        cdef = LinkedAuthor.cdef
+        self.assertFalse(has_tojson_hook(cdef.field_named('name')))
+        self.assertTrue(has_tojson_hook(cdef.field_named('articles')))
+
+    def test_compiled_tojson_outputs_scalar_and_nested_values(self):
+        author = LinkedAuthor(name='A', articles=[{'name': 'B'}])
+        self.assertEqual(author.tojson(),
+                         {'name': 'A', 'articles': [{'name': 'B'}]})
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.ctx import Ctx, CtxCfg
+from tests.classes.linked_author import LinkedAuthor
+from tests.classes.linked_article import LinkedArticle
+
+
+class TestCtx(TestCase):
+
+    def setUp(self):
+        self.author = LinkedAuthor(name='A')
+        self.article = LinkedArticle(name='B')
+        self.fdef = LinkedAuthor.cdef.field_named('name').fdef
+
+    def test_root_ctx_has_empty_keypaths(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        self.assertIsNone(ctx.kp)
+        self.assertEqual(ctx.keypathr, [])
+        self.assertEqual(ctx.keypatho, [])
+        self.assertEqual(ctx.keypathp, [])
+        self.assertEqual(ctx.keypathh, [])
+
+    def test_root_ctxs_share_the_root_fdef_of_the_class(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        ctxp = Ctx.rootctxp(LinkedAuthor(name='C'), 'name', 'C', None)
+        self.assertIs(ctx.fdef, LinkedAuthor.cdef.root_fdef)
+        self.assertIs(ctxp.fdef, ctx.fdef)
+        self.assertIs(ctx.fdef.cdef, LinkedAuthor.cdef)
+        self.assertIs(ctx.fdef.inst_cls, LinkedAuthor)
+
+    def test_root_ctx_with_key_has_key_in_keypaths(self):
+        ctx = Ctx.rootctxp(self.author, 'name', 'A', None)
+        self.assertEqual(ctx.keypathr, ['name'])
+        self.assertEqual(ctx.keypatho, ['name'])
+        self.assertEqual(ctx.keypathp, ['name'])
+        self.assertEqual(ctx.keypathh, ['name'])
+
+    def test_keypaths_are_suffixes_of_root_keypath(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        ctx = ctx.nextv([self.article], 'articles', self.fdef)
+        ctx = ctx.colval(self.article, 0, self.fdef, [self.article])
+        ctx = ctx.nexto(self.article, 0, self.fdef)
+        ctx = ctx.nextv('B', 'name', self.fdef)
+        self.assertEqual(ctx.keypathr, ['articles', 0, 0, 'name'])
+        self.assertEqual(ctx.keypatho, ['name'])
+        self.assertEqual(ctx.keypathp, ['name'])
+        self.assertEqual(ctx.keypathh, [0, 'name'])
+        self.assertEqual(ctx.skeypathr, 'articles.0.0.name')
+
+    def test_collection_value_keypath_is_relative_to_collection(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        ctx = ctx.nextv([[1]], 'items', self.fdef)
+        ctx = ctx.colval([1], 0, self.fdef, [[1]])
+        ctx = ctx.colval(1, 0, self.fdef, [1])
+        self.assertEqual(ctx.keypathr, ['items', 0, 0])
+        self.assertEqual(ctx.keypathp, [0])
+        self.assertEqual(ctx.keypatho, ['items', 0, 0])
+
+    def test_formatted_keypaths_use_owner_key_strategy(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        ctx = ctx.nextv([1], 'created_at', self.fdef)
+        ctx = ctx.colval(1, 'some_key', self.fdef, [1])
+        self.assertEqual(ctx.keypathr, ['created_at', 'some_key'])
+        self.assertEqual(ctx.fkeypathr, ['createdAt', 'some_key'])
+        self.assertEqual(ctx.sfkeypathr, 'createdAt.some_key')
+
+    def test_descending_shares_parent_keys(self):
+        ctx = Ctx.rootctx(self.author, CtxCfg())
+        ctx = ctx.nextv('A', 'name', self.fdef)
+        child1 = ctx.nextv(1, 'a', self.fdef)
+        child2 = ctx.nextv(2, 'b', self.fdef)
+        self.assertIs(child1.kp.parent, ctx.kp)
+        self.assertIs(child2.kp.parent, ctx.kp)
+        self.assertEqual(child1.keypathr, ['name', 'a'])
+        self.assertEqual(child2.keypathr, ['name', 'b'])
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from unittest import TestCase
+from datetime import date, datetime, timedelta, timezone
+from jsonclasses.dtutils import (
+    tzof, parse_datetime, parse_date, format_datetime, format_date
+)
+from jsonclasses.excs import ValidationException
+from tests.classes.datetime_series import DatetimeSeries
+
+
+class TestDtutils(TestCase):
+
+    def test_parse_datetime_parses_z_as_utc(self):
+        dt = parse_datetime('2021-10-16T13:43:28.099Z')
+        self.assertEqual(dt, datetime(2021, 10, 16, 13, 43, 28, 99000,
+                                      tzinfo=timezone.utc))
+        self.assertIs(dt.tzinfo, timezone.utc)
+
+    def test_parse_datetime_keeps_offset(self):
+        dt = parse_datetime('2021-10-16T13:43:28.099+08:00')
+        self.assertEqual(dt.utcoffset(), timedelta(hours=8))
+        self.assertEqual(dt, datetime(2021, 10, 16, 5, 43, 28, 99000,
+                                      tzinfo=timezone.utc))
+
+    def test_parse_datetime_caches_timezones(self):
+        dt1 = parse_datetime('2021-10-16T13:43:28.099-05:00')
+        dt2 = parse_datetime('2021-01-01T00:00:00-05:00')
+        self.assertIs(dt1.tzinfo, dt2.tzinfo)
+        self.assertIs(dt1.tzinfo, tzof(timedelta(hours=-5)))
+        self.assertIs(parse_datetime('2021-01-01T00:00:00+00:00').tzinfo,
+                      timezone.utc)
+
+    def test_parse_datetime_raises_on_invalid_strings(self):
+        with self.assertRaises(ValueError):
+            parse_datetime('2021-10-16T13:43:28+08:00Z')
+        with self.assertRaises(ValueError):
+            parse_datetime('yesterday')
+
+    def test_format_datetime_formats_whole_seconds(self):
+        dt = datetime(2021, 10, 16, 13, 43, 28, tzinfo=timezone.utc)
+        self.assertEqual(format_datetime(dt), '2021-10-16T13:43:28.000Z')
+        self.assertEqual(format_datetime(datetime(2021, 10, 16)),
+                         '2021-10-16T00:00:00.000Z')
+
+    def test_format_datetime_keeps_offset(self):
+        dt = parse_datetime('2021-10-16T13:43:28.099+08:00')
+        self.assertEqual(format_datetime(dt), '2021-10-16T13:43:28.099+08:00')
+
+    def test_parse_and_format_date(self):
+        self.assertEqual(parse_date('2021-10-16T13:43:28.099Z'),
+                         date(2021, 10, 16))
+        self.assertEqual(format_date(date(2021, 10, 16)),
+                         '2021-10-16T00:00:00.000Z')
+
+    def test_datetime_list_is_transformed_in_bulk(self):
+        series = DatetimeSeries(stamps=['2021-10-16T13:43:28.099Z',
+                                        '2021-10-16T13:43:29+08:00',
+                                        date(2021, 10, 16)],
+                                days=['2021-10-16', '2021-10-17T00:00:00Z'])
+        self.assertEqual(series.stamps, [
+            datetime(2021, 10, 16, 13, 43, 28, 99000, tzinfo=timezone.utc),
+            datetime(2021, 10, 16, 13, 43, 29,
+                     tzinfo=timezone(timedelta(hours=8))),
+            datetime(2021, 10, 16, tzinfo=timezone.utc)])
+        self.assertEqual(series.days, [date(2021, 10, 16), date(2021, 10, 17)])
+        self.assertEqual(series.tojson(), {
+            'stamps': ['2021-10-16T13:43:28.099Z',
+                       '2021-10-16T13:43:29.000+08:00',
+                       '2021-10-16T00:00:00.000Z'],
+            'days': ['2021-10-16T00:00:00.000Z', '2021-10-17T00:00:00.000Z']})
+
+    def test_datetime_list_reports_invalid_item(self):
+        with self.assertRaises(ValidationException) as context:
+            DatetimeSeries(stamps=['2021-10-16T13:43:28.099Z', 'yesterday'],
+                           days=[])
+        self.assertEqual(context.exception.keypath_messages['stamps.1'],
+                         'wrong datetime format')
@@ -1,8 +1,16 @@
 from __future__ import annotations
 from unittest import TestCase
-from jsonclasses import JSONEncoder
-from json import dumps
+from io import StringIO
+from unittest.mock import patch
+from jsonclasses import JSONEncoder, iter_tojson, dump_ndjson
+from json import dumps, loads
+from jsonclasses.modifiers.collection_type_modifier import (
+    CollectionTypeModifier
+)
+from jsonclasses.modifiers.instanceof_modifier import InstanceOfModifier
 from tests.classes.simple_user import SimpleUser
+from tests.classes.author import Author
+from tests.classes.article import Article
 
 
 class TestEncoder(TestCase):
@@ -19,3 +27,58 @@ class TestEncoder(TestCase):
         self.assertEqual(
             json_str,
             '[{"name": "John", "age": 7}, {"name": "Peter", "age": 8}]')
+
+    def test_iter_tojson_yields_json_array_chunks(self):
+        user1 = SimpleUser(name='John', age=7)
+        user2 = SimpleUser(name='Peter', age=8)
+        chunks = list(iter_tojson([user1, user2]))
+        self.assertEqual(chunks[0], '[')
+        self.assertEqual(chunks[-1], ']')
+        self.assertEqual(
+            ''.join(chunks),
+            '[{"name": "John", "age": 7}, {"name": "Peter", "age": 8}]')
+
+    def test_iter_tojson_yields_empty_array(self):
+        self.assertEqual(''.join(iter_tojson([])), '[]')
+
+    def test_iter_tojson_consumes_generators_lazily(self):
+        consumed = []
+
+        def users():
+            for i in range(3):
+                consumed.append(i)
+                yield SimpleUser(name='John', age=i)
+        chunks = iter_tojson(users())
+        next(chunks)
+        self.assertEqual(consumed, [])
+        next(chunks)
+        self.assertEqual(consumed, [0])
+
+    def test_iter_tojson_accepts_tojson_options(self):
+        user = SimpleUser(name='John')
+        self.assertEqual(''.join(iter_tojson([user], output_null=True)),
+                         '[{"name": "John", "age": null}]')
+
+    def test_dump_ndjson_writes_one_object_a_line(self):
+        user1 = SimpleUser(name='John', age=7)
+        user2 = SimpleUser(name='Peter', age=8)
+        fp = StringIO()
+        count = dump_ndjson([user1, user2], fp)
+        self.assertEqual(count, 2)
+        self.assertEqual(fp.getvalue(),
+                         '{"name": "John", "age": 7}\n'
+                         '{"name": "Peter", "age": 8}\n')
+        self.assertEqual([loads(l) for l in fp.getvalue().splitlines()],
+                         [user1.tojson(), user2.tojson()])
+
+    def test_iter_tojson_streams_held_lists_and_objects(self):
+        author = Author(name='K', articles=[
+            Article(title=str(i), content='C') for i in range(3)])
+        expected = dumps([author.tojson(output_null=True)])
+        with patch.object(CollectionTypeModifier, 'tojson',
+                          side_effect=AssertionError), \
+             patch.object(InstanceOfModifier, 'tojson',
+                          side_effect=AssertionError):
+            chunks = list(iter_tojson([author], output_null=True))
+        self.assertEqual(''.join(chunks), expected)
+        self.assertGreater(len(chunks), 20)
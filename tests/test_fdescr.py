@@ -0,0 +1,103 @@
+from __future__ import annotations
+from unittest import TestCase
+from unittest.mock import patch
+from jsonclasses.types import Types
+from jsonclasses.fdescr import (CalcFieldDescriptor, FieldDescriptor,
+                                set_scalar, set_field)
+from tests.classes.calc_user import CalcUser, SetterUser
+from tests.classes.simple_user import SimpleUser
+from tests.classes.linked_author import LinkedAuthor
+from tests.classes.linked_article import LinkedArticle
+from tests.classes.redefined_object import RedefinedObject
+
+
+class TestFDescr(TestCase):
+
+    def test_calc_fields_have_descriptors_installed(self):
+        descr = CalcUser.__dict__['first_name']
+        self.assertIsInstance(descr, CalcFieldDescriptor)
+        self.assertNotIsInstance(CalcUser.__dict__.get('name'),
+                                 CalcFieldDescriptor)
+
+    def test_calc_field_descriptor_returns_types_on_class(self):
+        self.assertIsInstance(CalcUser.first_name, Types)
+
+    def test_attribute_reads_take_default_path(self):
+        self.assertIs(SimpleUser.__getattribute__, object.__getattribute__)
+
+    def test_calc_field_descriptor_runs_getter(self):
+        user = CalcUser(name='Peter Layber', base_score=1)
+        self.assertEqual(user.first_name, 'Peter')
+        self.assertEqual(user.last_name, 'Layber')
+        self.assertEqual(user.score, 2)
+        self.assertNotIn('first_name', user.__dict__)
+
+    def test_calc_field_descriptor_runs_setter(self):
+        user = SetterUser(name='Peter Layber', base_score=1)
+        user.first_name = 'John'
+        user.score = 10
+        self.assertEqual(user.name, 'John Layber')
+        self.assertEqual(user.base_score, 5)
+        self.assertNotIn('first_name', user.__dict__)
+
+    def test_calc_field_descriptor_raises_without_setter(self):
+        user = CalcUser(name='Peter Layber', base_score=1)
+        with self.assertRaisesRegex(Exception, 'readonly calculation field'):
+            user.first_name = 'John'
+
+    def test_stored_fields_have_set_only_descriptors_installed(self):
+        descr = SimpleUser.__dict__['name']
+        self.assertIsInstance(descr, FieldDescriptor)
+        self.assertFalse(hasattr(FieldDescriptor, '__get__'))
+
+    def test_local_keys_have_descriptors_installed(self):
+        LinkedArticle(name='A')
+        descr = LinkedArticle.__dict__['author_id']
+        self.assertIsInstance(descr, FieldDescriptor)
+        self.assertTrue(descr.local_key)
+
+    def test_field_descriptor_picks_setter_by_field_kind(self):
+        user = SimpleUser(name='John', age=5)
+        user.name = 'Peter'
+        self.assertIs(SimpleUser.__dict__['name'].setters[SimpleUser],
+                      set_scalar)
+        author = LinkedAuthor(name='A')
+        author.articles = []
+        self.assertIs(LinkedAuthor.__dict__['articles'].setters[LinkedAuthor],
+                      set_field)
+
+    def test_setting_equal_value_does_not_modify(self):
+        user = SimpleUser(name='John', age=5)
+        user._mark_not_new()
+        user.name = 'John'
+        self.assertFalse(user.is_modified)
+        user.name = 'Peter'
+        self.assertTrue(user.is_modified)
+        self.assertEqual(user.modified_fields, ('name',))
+
+    def test_setting_same_object_skips_equality_check(self):
+        author = LinkedAuthor(name='A', articles=[{'name': 'B'}])
+        author._mark_not_new()
+        articles = author.articles
+        with patch.object(type(articles), '__eq__') as eq:
+            author.articles = articles
+        eq.assert_not_called()
+        self.assertFalse(author.is_modified)
+
+    def test_field_descriptor_links_references(self):
+        author = LinkedAuthor(name='A')
+        article = LinkedArticle(name='B')
+        article.author = author
+        self.assertEqual(author.articles, [article])
+
+    def test_non_field_attributes_are_set_directly(self):
+        user = SimpleUser(name='John', age=5)
+        user.extra = 1
+        self.assertEqual(user.__dict__['extra'], 1)
+
+    def test_redefined_field_does_not_default_to_descriptor(self):
+        field = RedefinedObject.cdef.field_named('id')
+        self.assertIsNone(field.default)
+        obj = RedefinedObject(id=1, name='A')
+        self.assertEqual(obj.id, 1)
+        self.assertEqual(obj.tojson(), {'id': 1, 'name': 'A'})
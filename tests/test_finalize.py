@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import Optional
+from enum import Enum
+from unittest import TestCase
+from jsonclasses import jsonclass, jsonenum, types
+from jsonclasses.cgraph import CGraph
+from jsonclasses.fdef import FinalFDef
+from jsonclasses.jfield import FinalJField
+from jsonclasses.excs import JSONClassNotFoundException
+
+
+@jsonenum(class_graph='test_finalize')
+class FinalizeColor(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+@jsonclass(class_graph='test_finalize')
+class FinalizeAuthor:
+    name: str
+    color: Optional[FinalizeColor] = types.enum('FinalizeColor')
+    articles: list[FinalizeArticle] = types.listof('FinalizeArticle') \
+                                           .linkedby('author')
+
+
+@jsonclass(class_graph='test_finalize')
+class FinalizeArticle:
+    title: str
+    author: Optional[FinalizeAuthor] = types.objof('FinalizeAuthor').linkto
+
+
+class TestFinalize(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        CGraph('test_finalize').finalize()
+
+    def test_finalize_resolves_fields_ahead_of_time(self):
+        articles = FinalizeAuthor.cdef.field_named('articles')
+        self.assertIsInstance(articles, FinalJField)
+        self.assertIsInstance(articles.fdef, FinalFDef)
+        self.assertIsInstance(articles.fdef.item_types.fdef, FinalFDef)
+        self.assertIs(articles.fdef.item_types.fdef.inst_cls, FinalizeArticle)
+        self.assertIs(articles.foreign_class, FinalizeArticle)
+        self.assertEqual(articles.foreign_field.name, 'author')
+        color = FinalizeAuthor.cdef.field_named('color')
+        self.assertIs(color.fdef.enum_class, FinalizeColor)
+
+    def test_finalized_classes_work(self):
+        author = FinalizeAuthor(name='A', color='RED',
+                                articles=[{'title': 'B'}])
+        self.assertIs(author.articles[0].author, author)
+        self.assertEqual(author.tojson(), {
+            'name': 'A', 'color': 'RED',
+            'articles': [{'title': 'B'}]})
+        author.validate()
+
+    def test_deriving_from_finalized_types_creates_plain_fdef(self):
+        fdef = FinalizeAuthor.cdef.field_named('name').fdef
+        self.assertIsInstance(fdef, FinalFDef)
+        self.assertIs(type(fdef.derive()), type(types.str.fdef))
+
+    def test_finalize_raises_on_unresolved_names(self):
+        @jsonclass(class_graph='test_finalize_unresolved')
+        class FinalizeOrphan:
+            parent: Optional[FinalizeMissing] = types.objof('FinalizeMissing')
+
+        with self.assertRaises(JSONClassNotFoundException):
+            CGraph('test_finalize_unresolved').finalize()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from unittest import TestCase
+from time import perf_counter
+from jsonclasses.excs import (AbstractJSONClassException,
+                              ValidationException)
+from tests.classes.linked_song import LinkedSong, LinkedSinger
+from tests.classes.simple_article import SimpleArticle
+from tests.classes.simple_employee import SimpleEmployee
+from tests.classes.author import Author
+from tests.classes.article import Article
+
+
+class TestFromMany(TestCase):
+
+    def test_from_many_initializes_objects_in_order(self):
+        articles = SimpleArticle.from_many([{'title': 'A'}, {'title': 'B'}])
+        self.assertEqual(len(articles), 2)
+        self.assertIsInstance(articles[0], SimpleArticle)
+        self.assertEqual(articles[0].title, 'A')
+        self.assertEqual(articles[1].title, 'B')
+        self.assertIsNot(articles[0], articles[1])
+
+    def test_from_many_accepts_empty_list(self):
+        self.assertEqual(SimpleArticle.from_many([]), [])
+
+    def test_from_many_shares_objects_with_same_primary_key(self):
+        songs = LinkedSong.from_many([
+            {'id': 1, 'name': 'A', 'singers': [{'id': 1, 'name': 'S'}]},
+            {'id': 2, 'name': 'B', 'singers': [{'id': 1, 'name': 'S'}]}
+        ])
+        self.assertIs(songs[0].singers[0], songs[1].singers[0])
+        singer = songs[0].singers[0]
+        self.assertIsInstance(singer, LinkedSinger)
+        self.assertEqual(singer.songs, [songs[0], songs[1]])
+
+    def test_from_many_updates_previous_item_with_same_primary_key(self):
+        songs = LinkedSong.from_many([
+            {'id': 1, 'name': 'A'},
+            {'id': 1, 'name': 'B'}
+        ])
+        self.assertIs(songs[0], songs[1])
+        self.assertEqual(songs[0].name, 'B')
+
+    def test_from_many_does_not_validate_by_default(self):
+        articles = SimpleArticle.from_many([{'title': 'A'}, {}])
+        self.assertEqual(len(articles), 2)
+
+    def test_from_many_reports_indexed_validation_errors(self):
+        with self.assertRaises(ValidationException) as context:
+            SimpleArticle.from_many([{'title': 'A', 'content': 'B'},
+                                     {'title': 'A'},
+                                     {'content': 'B'}], validate=True)
+        self.assertEqual(context.exception.keypath_messages,
+                         {'1.content': "value required",
+                          '2.title': "value required"})
+        self.assertEqual(len(context.exception.root), 3)
+
+    def test_from_many_rejects_undefined_keys(self):
+        with self.assertRaises(ValidationException) as context:
+            SimpleArticle.from_many([{'title': 'A'}, {'dzimsikai': 'B'}])
+        self.assertEqual(context.exception.keypath_messages,
+                         {'dzimsikai': 'key is not allowed'})
+
+    def test_from_many_accepts_nested_keypaths(self):
+        author = Author(name='Kieng')
+        articles = Article.from_many([
+            {'title': 'A', 'author': author},
+            {'title': 'B', 'author': author, 'author.name': 'abc.def'}
+        ])
+        self.assertIs(articles[1].author, author)
+        self.assertEqual(author.name, 'abc.def')
+
+    def test_from_many_raises_for_abstract_class(self):
+        self.assertRaises(AbstractJSONClassException,
+                          SimpleEmployee.from_many, [{}])
+
+    def test_from_many_objects_match_objects_initialized_one_by_one(self):
+        items = [{'id': 1, 'name': 'A', 'singers': [{'id': 1, 'name': 'S'}]}]
+        song = LinkedSong.from_many(items)[0]
+        expected = LinkedSong(**items[0])
+        self.assertEqual(song.is_new, expected.is_new)
+        self.assertEqual(song.is_modified, expected.is_modified)
+        self.assertEqual(song.modified_fields, expected.modified_fields)
+        self.assertEqual(song.tojson(), expected.tojson())
+        self.assertIs(song.singers.owner, song)
+
+    def test_from_many_is_faster_than_initializing_one_by_one(self):
+        items = [{'title': f't{i}', 'content': 'c'} for i in range(1000)]
+        loops, batches = [], []
+        for _ in range(5):
+            start = perf_counter()
+            [SimpleArticle(**item) for item in items]
+            loops.append(perf_counter() - start)
+            start = perf_counter()
+            SimpleArticle.from_many(items)
+            batches.append(perf_counter() - start)
+        self.assertGreater(min(loops) / min(batches), 3)
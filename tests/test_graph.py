@@ -45,3 +45,32 @@ class TestGraph(TestCase):
         post_new._mark_not_new()
         with self.assertRaises(JSONClassGraphMergeConflictException):
             user.posts = [post_new]
+
+    def test_graph_is_not_allocated_until_accessed(self):
+        user = User(id=1, name='Phuê Ê')
+        self.assertIsNone(user.__dict__['_ograph'])
+        self.assertEqual(list(user._graph), [user])
+        self.assertIs(user.__dict__['_ograph'], user._graph)
+
+    def test_graph_merges_keep_one_root(self):
+        user = User(id=1, name='Phuê Ê')
+        posts = [Post(id=i, name=f'Post {i}') for i in range(1, 11)]
+        for post in posts:
+            user.posts.append(post)
+        for post in posts:
+            self.assertIs(post._graph, user._graph)
+        self.assertEqual(len(user._graph), 11)
+        self.assertEqual(list(user._graph), [*reversed(posts), user])
+
+    def test_graph_is_unchanged_on_conflict(self):
+        post = Post(id=1, name='M Tsai Tai Kha Kui Ê Lang',
+                    updated_at=datetime(2021, 3, 10, 0, 0, 0))
+        user = User(id=1, name='Phuê Ê', posts=[post])
+        post_new = Post(id=1, name='Koh Kin Tiu Koh Tsin Ki Thai',
+                        updated_at=datetime(2021, 3, 11, 0, 0, 0))
+        graph = user._graph
+        with self.assertRaises(JSONClassGraphMergeConflictException):
+            graph.merged_graph(post_new._graph)
+        self.assertEqual(list(graph), [user, post])
+        self.assertEqual(list(post_new._graph), [post_new])
+        self.assertIsNot(post_new._graph, graph)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from unittest import TestCase
+from subprocess import run
+from sys import executable
+from json import loads
+
+
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import jsonclasses
+duration = time.perf_counter() - start
+modifiers = [n for n in sys.modules if n.startswith('jsonclasses.modifiers.')]
+print(json.dumps({'duration': duration, 'modifiers': modifiers,
+                  'numpy': 'numpy' in sys.modules}))
+'''
+
+
+class TestImportTime(TestCase):
+
+    def import_jsonclasses(self) -> dict:
+        result = run([executable, '-c', SCRIPT], capture_output=True,
+                     text=True, check=True)
+        return loads(result.stdout)
+
+    def test_import_is_within_the_time_budget(self):
+        durations = [self.import_jsonclasses()['duration'] for _ in range(3)]
+        self.assertLess(min(durations), 0.5)
+
+    def test_import_doesnt_load_unused_modifiers(self):
+        modifiers = self.import_jsonclasses()['modifiers']
+        self.assertLess(len(modifiers), 20)
+        self.assertNotIn('jsonclasses.modifiers.salt_modifier', modifiers)
+        self.assertNotIn('jsonclasses.modifiers.uploader_modifier', modifiers)
+
+    def test_import_doesnt_load_numpy(self):
+        self.assertFalse(self.import_jsonclasses()['numpy'])
+
+    def test_modifiers_are_loaded_on_first_use(self):
+        from jsonclasses import modifiers
+        from jsonclasses.modifiers.salt_modifier import SaltModifier
+        self.assertIs(modifiers.SaltModifier, SaltModifier)
+        self.assertIn('SaltModifier', dir(modifiers))
+        with self.assertRaises(AttributeError):
+            modifiers.UnknownModifier
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.excs import ValidationException
+from tests.classes.checked_owner import (
+    CheckedOwner, CheckedReport, CheckedCompact, CheckedBoard, CheckedPost,
+    CheckedTag, allowed_names, checked_values
+)
+
+
+class TestIncrementalValidate(TestCase):
+
+    def setUp(self) -> None:
+        checked_values.clear()
+
+    def test_validate_is_skipped_if_nothing_changed(self):
+        owner = CheckedOwner(name='A')
+        owner.validate()
+        self.assertEqual(checked_values, ['A'])
+        owner.validate()
+        self.assertTrue(owner.is_valid)
+        self.assertEqual(checked_values, ['A'])
+
+    def test_validate_runs_again_if_a_field_is_changed(self):
+        owner = CheckedOwner(name='A')
+        owner.validate()
+        owner.name = 'B' * 11
+        self.assertFalse(owner.is_valid)
+        with self.assertRaises(ValidationException) as context:
+            owner.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'name': 'too long'})
+
+    def test_validate_runs_again_if_a_list_is_mutated(self):
+        report = CheckedReport(title='R', tags=['a'])
+        report.validate()
+        report.tags.append('b' * 11)
+        with self.assertRaises(ValidationException) as context:
+            report.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'tags.1': 'too long'})
+
+    def test_validate_runs_again_if_a_linked_object_is_changed(self):
+        owner = CheckedOwner(name='A')
+        report = CheckedReport(title='R', owner=owner)
+        owner.validate()
+        self.assertTrue(report.is_valid)
+        report.title = 'R' * 11
+        with self.assertRaises(ValidationException) as context:
+            owner.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'reports.0.title': 'too long'})
+
+    def test_validate_skips_fields_of_unchanged_objects(self):
+        owner = CheckedOwner(name='A')
+        reports = [CheckedReport(title=f'R{i}', owner=owner)
+                   for i in range(3)]
+        for obj in [owner, *reports]:
+            obj._mark_unmodified()
+        reports[0].title = 'T'
+        owner.validate()
+        checked_values.clear()
+        reports[1].title = 'S'
+        owner.validate()
+        self.assertEqual(checked_values, ['S'])
+
+    def test_validate_runs_every_validator_of_new_objects(self):
+        owner = CheckedOwner(name='A')
+        reports = [CheckedReport(title=f'R{i}', owner=owner)
+                   for i in range(3)]
+        owner.validate()
+        checked_values.clear()
+        reports[1].title = 'S'
+        owner.validate()
+        self.assertEqual(checked_values, ['A', 'R0', 'S', 'R2'])
+
+    def test_validate_runs_context_validators_of_unchanged_objects(self):
+        board = CheckedBoard(limit=10)
+        post = CheckedPost(name='P' * 5, board=board)
+        post.validate()
+        board.limit = 3
+        with self.assertRaises(ValidationException) as context:
+            post.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'name': 'too long'})
+        self.assertFalse(post.is_valid)
+
+    def test_validate_runs_user_callables_of_unchanged_objects(self):
+        allowed_names.add('a')
+        tag = CheckedTag(name='a')
+        tag.validate()
+        allowed_names.clear()
+        self.assertFalse(tag.is_valid)
+        with self.assertRaises(ValidationException) as context:
+            tag.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'name': 'invalid value'})
+
+    def test_failed_validation_is_not_remembered(self):
+        owner = CheckedOwner(name='A' * 11)
+        self.assertFalse(owner.is_valid)
+        self.assertFalse(owner.is_valid)
+        self.assertEqual(checked_values, ['A' * 11, 'A' * 11])
+
+    def test_mark_new_makes_validation_run_again(self):
+        owner = CheckedOwner(name='A')
+        owner.validate()
+        owner._mark_new()
+        owner.validate()
+        self.assertEqual(checked_values, ['A', 'A'])
+
+    def test_compact_object_validation_is_skipped_if_nothing_changed(self):
+        obj = CheckedCompact(name='A')
+        obj.validate()
+        obj.validate()
+        self.assertEqual(checked_values, ['A'])
+        obj.name = 'B' * 11
+        self.assertFalse(obj.is_valid)
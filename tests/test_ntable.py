@@ -0,0 +1,53 @@
+from __future__ import annotations
+from unittest import TestCase
+from jsonclasses.ntable import NTable
+from jsonclasses.keypath import camelize_key
+from tests.classes.linked_author import LinkedAuthor
+from tests.classes.linked_article import LinkedArticle
+from tests.classes.simple_employee import SimpleEmployee
+
+
+class TestNTable(TestCase):
+
+    def test_ntable_encodes_added_names(self):
+        ntable = NTable(camelize_key)
+        self.assertEqual(ntable.add('created_at'), 'createdAt')
+        self.assertEqual(ntable.encode('created_at'), 'createdAt')
+        self.assertIn('created_at', ntable._encoded)
+
+    def test_ntable_translates_dynamic_keys_with_strategy(self):
+        ntable = NTable(camelize_key)
+        self.assertEqual(ntable.encode('some_key'), 'someKey')
+        self.assertNotIn('some_key', ntable._encoded)
+
+    def test_ntable_remembers_bounded_dynamic_keys(self):
+        calls = []
+
+        def strategy(key: str) -> str:
+            calls.append(key)
+            return key.upper()
+        ntable = NTable(strategy, maxsize=2)
+        ntable.encode('a')
+        ntable.encode('a')
+        self.assertEqual(calls, ['a'])
+        ntable.encode('b')
+        ntable.encode('c')
+        ntable.encode('a')
+        self.assertEqual(calls, ['a', 'b', 'c', 'a'])
+
+    def test_cdef_ntable_records_field_names(self):
+        ntable = LinkedArticle.cdef.ntable
+        self.assertEqual(ntable._encoded['name'], 'name')
+        self.assertEqual(ntable._encoded['author'], 'author')
+        ntable = LinkedAuthor.cdef.ntable
+        self.assertEqual(ntable._encoded['articles'], 'articles')
+
+    def test_cdef_ntable_records_reference_names(self):
+        cdef = LinkedArticle.cdef
+        cdef._resolve_ref_names_if_needed()
+        self.assertEqual(cdef.ntable._encoded['author_id'], 'authorId')
+
+    def test_cdef_ntable_uses_class_key_strategies(self):
+        ntable = SimpleEmployee.cdef.ntable
+        field = SimpleEmployee.cdef.fields[0]
+        self.assertEqual(ntable.encode(field.name), field.name)
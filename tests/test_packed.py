@@ -0,0 +1,80 @@
+from __future__ import annotations
+from unittest import TestCase
+from array import array
+from jsonclasses.plist import PackedList
+from jsonclasses.olist import OwnedList
+from jsonclasses.excs import ValidationException
+from tests.classes.packed_series import PackedSeries
+
+
+class TestPacked(TestCase):
+
+    def test_packed_list_field_stores_packed_list(self):
+        series = PackedSeries(values=[1.5, 2.5], counts=[1, 2], plain=[1.5])
+        self.assertIsInstance(series.values, PackedList)
+        self.assertEqual(series.values.typecode, 'd')
+        self.assertIsInstance(series.counts, PackedList)
+        self.assertEqual(series.counts.typecode, 'q')
+        self.assertIsInstance(series.plain, OwnedList)
+        self.assertEqual(series.values, [1.5, 2.5])
+
+    def test_packed_list_field_packs_transformed_items(self):
+        series = PackedSeries(values=[1, 2.5])
+        self.assertIsInstance(series.values, PackedList)
+        self.assertEqual(series.values, [1.0, 2.5])
+
+    def test_packed_list_field_keeps_invalid_items_unpacked(self):
+        series = PackedSeries(counts=[1, 'a'])
+        self.assertIsInstance(series.counts, OwnedList)
+        with self.assertRaises(ValidationException) as context:
+            series.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'counts.1': 'value is not int'})
+
+    def test_packed_list_field_is_validated(self):
+        series = PackedSeries(counts=[1, 2])
+        series.validate()
+        series.counts.append(-1)
+        with self.assertRaises(ValidationException) as context:
+            series.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'counts.2': 'value is not greater than or equal 0'})
+
+    def test_packed_list_field_outputs_json_arrays(self):
+        series = PackedSeries(values=[1.5, 2.5], counts=[3])
+        self.assertEqual(series.tojson(),
+                         {'values': [1.5, 2.5], 'counts': [3]})
+
+    def test_packed_list_field_is_modified_if_mutated(self):
+        series = PackedSeries(values=[1.5, 2.5])
+        series._mark_not_new()
+        series.values.append(3.5)
+        self.assertEqual(series.modified_fields, ('values',))
+        self.assertEqual(series.is_modified, True)
+
+    def test_packed_list_supports_list_mutations(self):
+        series = PackedSeries(values=[3.0, 1.0, 2.0])
+        values = series.values
+        values.sort()
+        self.assertEqual(values, [1.0, 2.0, 3.0])
+        values.insert(0, 0.5)
+        values[1] = 1.5
+        values[2:4] = [4.0, 5.0, 6.0]
+        self.assertEqual(values, [0.5, 1.5, 4.0, 5.0, 6.0])
+        del values[0]
+        values.remove(6.0)
+        self.assertEqual(values.pop(), 5.0)
+        values += [7.0]
+        values.reverse()
+        self.assertEqual(values, [7.0, 4.0, 1.5])
+        values.clear()
+        self.assertEqual(len(values), 0)
+
+    def test_packed_list_exposes_buffer_without_copying(self):
+        series = PackedSeries(values=[1.5, 2.5])
+        view = series.values.memoryview()
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(view.tolist(), [1.5, 2.5])
+        series.values.buffer[0] = 0.5
+        self.assertEqual(view[0], 0.5)
+        self.assertIsInstance(series.values.buffer, array)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from unittest import TestCase
+from unittest.mock import patch
+from time import perf_counter
+from types import SimpleNamespace
+from re import compile
+import re
+from jsonclasses.excs import ValidationException
+from jsonclasses.rcache import (RPattern, rcompile, rengine, set_rengine,
+                                 _rcompile)
+from tests.classes.string_validators import StringValidators, CompiledPatterns
+
+
+class TestRCache(TestCase):
+
+    def test_rcompile_remembers_patterns(self):
+        self.assertIs(rcompile('^abc+$'), rcompile('^abc+$'))
+
+    def test_rcompile_returns_compiled_patterns(self):
+        pattern = compile('^a')
+        self.assertIs(rcompile(pattern), pattern)
+
+    def test_set_rengine_raises_for_unknown_engines(self):
+        with self.assertRaises(ValueError):
+            set_rengine('pcre')
+        self.assertEqual(rengine(), 're')
+
+    def test_set_rengine_raises_if_engine_is_not_installed(self):
+        try:
+            import re2
+        except ImportError:
+            _rcompile.cache_clear()
+            with self.assertRaises(ModuleNotFoundError):
+                set_rengine('re2')
+            self.assertEqual(rengine(), 're')
+
+    def test_set_rengine_recompiles_compiled_patterns(self):
+        sources = []
+        def compile_with_re2(pattern):
+            sources.append(pattern)
+            return re.compile(pattern)
+        re2 = SimpleNamespace(__name__='re2', compile=compile_with_re2)
+        pattern = RPattern('^compiled$')
+        obj = StringValidators(email='john@example.com')
+        obj.validate()
+        with patch('jsonclasses.rcache.import_module', return_value=re2):
+            set_rengine('re2')
+        try:
+            self.assertEqual(rengine(), 're2')
+            self.assertIsNotNone(pattern.compiled.match('compiled'))
+            StringValidators(email='john@example.com').validate()
+            self.assertIn('^compiled$', sources)
+            self.assertEqual(len(sources), 2)
+        finally:
+            set_rengine('re')
+        self.assertIs(pattern.compiled, re.compile('^compiled$'))
+
+    def test_set_rengine_accepts_the_current_engine(self):
+        rcompile('^compiled$')
+        set_rengine('re')
+        self.assertEqual(rengine(), 're')
+
+    def test_match_accepts_compiled_patterns(self):
+        CompiledPatterns(name='abc').validate()
+        with self.assertRaisesRegex(ValidationException, 'does not match'):
+            CompiledPatterns(name='Abc').validate()
+
+    def test_split_and_replacer_accept_compiled_patterns(self):
+        obj = CompiledPatterns(words='a , b,c', slug='a b  c')
+        self.assertEqual(obj.words, ['a', 'b', 'c'])
+        self.assertEqual(obj.slug, 'a-b-c')
+
+    def test_string_validators_dont_compile_patterns_on_validation(self):
+        valid = StringValidators(email='john@example.com',
+                                 url='https://www.example.com/a?b=c',
+                                 color='#ffaa00', code='abc123',
+                                 digits='0123')
+        invalids = [('email', 'john@example'), ('url', 'example.com'),
+                    ('color', 'ffaa0'), ('code', 'abc-123'),
+                    ('digits', '01a')]
+        misses = _rcompile.cache_info().misses
+        valid.validate()
+        for name, value in invalids:
+            obj = StringValidators(**{**valid.tojson(), name: value})
+            with self.assertRaises(ValidationException):
+                obj.validate()
+        self.assertEqual(_rcompile.cache_info().misses, misses)
+
+    def test_string_validators_are_within_the_time_budget(self):
+        valid = {'email': 'john@example.com',
+                 'url': 'https://www.example.com/a?b=c',
+                 'color': '#ffaa00', 'code': 'abc123', 'digits': '0123'}
+        invalids = [('email', 'john@example'), ('url', 'example.com'),
+                    ('color', 'ffaa0'), ('code', 'abc-123'),
+                    ('digits', '01a')]
+        durations = []
+        for _ in range(3):
+            objs = [StringValidators(**valid) for _ in range(500)]
+            for name, value in invalids:
+                objs.extend(StringValidators(**{**valid, name: value})
+                            for _ in range(100))
+            start = perf_counter()
+            for obj in objs:
+                try:
+                    obj.validate()
+                except ValidationException:
+                    pass
+            durations.append(perf_counter() - start)
+        self.assertLess(min(durations), 0.5)
@@ -1,12 +1,66 @@
 from __future__ import annotations
 from unittest import TestCase
+from unittest.mock import patch
+from asyncio import run, wait_for
+from jsonclasses.excs import ValidationException
+from jsonclasses import pwhash
+from jsonclasses.pwhash import configure, rounds
 from tests.classes.super_str import SuperStr
+from tests.classes.salted_account import SaltedAccount, SaltedLogin
 from bcrypt import checkpw
 
 
 class TestSalt(TestCase):
 
+    def setUp(self) -> None:
+        self.rounds = rounds()
+        configure(rounds=4)
+
+    def tearDown(self) -> None:
+        configure(rounds=self.rounds)
+
     def test_salt_add_salt_to_a_string(self):
         ss = SuperStr(password='123456')
         self.assertNotEqual(ss.password, '123456')
         self.assertTrue(checkpw('123456'.encode(), ss.password.encode()))
+
+    def test_salt_uses_the_configured_cost_factor(self):
+        ss = SuperStr(password='123456')
+        self.assertTrue(ss.password.startswith('$2b$04$'))
+
+    def test_salt_hashes_passwords_of_from_many_in_batch(self):
+        accounts = SaltedAccount.from_many([
+            {'name': 'a', 'password': 'pw1'},
+            {'name': 'b', 'password': 'pw2'},
+            {'name': 'c', 'password': 'pw1'},
+        ])
+        for account, pw in zip(accounts, ['pw1', 'pw2', 'pw1']):
+            self.assertTrue(checkpw(pw.encode(), account.password.encode()))
+        self.assertNotEqual(accounts[0].password, accounts[2].password)
+
+    def test_salt_hashes_passwords_of_aset_on_thread_pool(self):
+        account = SaltedAccount(name='a')
+        result = run(account.aset(password='123456'))
+        self.assertIs(result, account)
+        self.assertTrue(checkpw(b'123456', account.password.encode()))
+
+    def test_checkpw_validates_on_thread_pool_with_avalidate(self):
+        account = SaltedAccount(name='a', password='123456', attempt='123456')
+        self.assertIs(run(account.avalidate()), account)
+        account.attempt = '654321'
+        with self.assertRaises(ValidationException) as context:
+            run(account.avalidate())
+        self.assertEqual(context.exception.keypath_messages['password'],
+                         'value is incorrect')
+
+    def test_aset_hashes_many_passwords_on_a_single_worker(self):
+        login = SaltedLogin()
+        with patch.multiple(pwhash, _executor=None, _max_workers=1):
+            run(wait_for(login.aset(password='x', pin='y'), 5))
+        self.assertTrue(checkpw(b'x', login.password.encode()))
+        self.assertTrue(checkpw(b'y', login.pin.encode()))
+
+    def test_avalidate_checks_passwords_on_a_single_worker(self):
+        account = SaltedAccount(name='a', password='123456', attempt='123456')
+        with patch.multiple(pwhash, _executor=None, _max_workers=1):
+            self.assertIs(run(wait_for(account.avalidate(), 5)), account)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from unittest import TestCase
+from unittest.mock import patch, PropertyMock
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import jsonclasses.snapshot
+from jsonclasses.snapshot import load_snapshot, save_snapshot
+from jsonclasses.compiler import compile_tojson, compile_transform
+from jsonclasses.cdef import CDef
+from jsonclasses.jconf import JConf
+from jsonclasses.ctx import Ctx, CtxCfg
+from tests.classes.simple_book import SimpleBook
+from tests.classes.linked_author import LinkedAuthor
+from tests.classes.linked_article import LinkedArticle
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self) -> None:
+        self.dir = TemporaryDirectory()
+        self.path = Path(self.dir.name) / 'schema.snap'
+        self.modules = ['tests.classes.simple_book',
+                        'tests.classes.linked_author',
+                        'tests.classes.linked_article']
+
+    def tearDown(self) -> None:
+        jsonclasses.snapshot._snapshot = None
+        self.dir.cleanup()
+
+    def test_snapshot_keeps_compiled_pipelines(self):
+        snapshot = load_snapshot(self.path, self.modules)
+        self.assertEqual(snapshot.codes, {})
+        compile_transform(SimpleBook.cdef)
+        compile_tojson(SimpleBook.cdef)
+        self.assertEqual(len(snapshot.codes), 2)
+        save_snapshot()
+        self.assertTrue(self.path.is_file())
+
+    def test_saved_snapshot_is_reused_by_a_later_load(self):
+        load_snapshot(self.path, self.modules)
+        compile_tojson(SimpleBook.cdef)
+        save_snapshot()
+        loaded = load_snapshot(self.path, self.modules)
+        self.assertEqual(len(loaded.codes), 1)
+        tojson = compile_tojson(SimpleBook.cdef)
+        self.assertFalse(loaded.changed)
+        book = SimpleBook(name='A')
+        ctx = Ctx.rootctx(book, CtxCfg())
+        self.assertEqual(tojson(ctx, book),
+                         {'name': 'A', 'published': False})
+
+    def test_saving_snapshots_leaves_no_temporary_files(self):
+        first = load_snapshot(self.path, self.modules)
+        compile_tojson(SimpleBook.cdef)
+        second = load_snapshot(self.path, self.modules)
+        compile_tojson(SimpleBook.cdef)
+        first.save()
+        second.save()
+        self.assertEqual(list(Path(self.dir.name).iterdir()), [self.path])
+
+    def test_snapshot_keeps_resolved_class_definitions(self):
+        snapshot = load_snapshot(self.path, self.modules)
+        cdef = CDef(LinkedArticle, LinkedArticle.cdef.jconf)
+        self.assertEqual(cdef.reference_names, {'author_id'})
+        name = 'default:tests.classes.linked_article.LinkedArticle'
+        self.assertEqual(snapshot.cdefs[name], {
+            'names': {'name': 'name', 'author': 'author',
+                      'author_id': 'authorId'},
+            'refs': [('instance', 'author_id', 'author')]})
+        self.assertTrue(snapshot.changed)
+
+    def test_saved_class_definitions_are_restored_by_name(self):
+        load_snapshot(self.path, self.modules)
+        CDef(LinkedArticle, LinkedArticle.cdef.jconf).finalize()
+        CDef(LinkedAuthor, LinkedAuthor.cdef.jconf).finalize()
+        save_snapshot()
+        loaded = load_snapshot(self.path, self.modules)
+        self.assertEqual(len(loaded.cdefs), 2)
+        def strategy(*args):
+            raise AssertionError('strategy is run')
+        with patch.object(JConf, 'output_key_strategy', strategy), \
+                patch.object(JConf, 'ref_name_strategy',
+                             new_callable=PropertyMock,
+                             return_value=strategy):
+            cdef = CDef(LinkedArticle, LinkedArticle.cdef.jconf)
+            self.assertEqual(cdef.reference_names, {'author_id'})
+            self.assertEqual(cdef.available_names,
+                             {'name', 'author', 'author_id', 'authorId'})
+            self.assertIs(cdef.rname_to_jfield('author_id'),
+                          cdef.field_named('author'))
+            self.assertEqual(cdef.ntable.encode('author_id'), 'authorId')
+        self.assertFalse(loaded.changed)
+
+    def test_snapshot_of_other_sources_is_discarded(self):
+        load_snapshot(self.path, self.modules)
+        compile_tojson(SimpleBook.cdef)
+        save_snapshot()
+        other = load_snapshot(self.path, ['tests.classes.simple_secret'])
+        self.assertEqual(other.codes, {})
+
+    def test_snapshot_of_missing_module_raises(self):
+        with self.assertRaises(ModuleNotFoundError):
+            load_snapshot(self.path, ['tests.classes.no_such_module'])
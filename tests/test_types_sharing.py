@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import Optional
+from unittest import TestCase
+from jsonclasses import jsonclass, types
+
+
+class TestTypesSharing(TestCase):
+
+    def test_argumentless_chains_from_root_are_interned(self):
+        self.assertIs(types.str, types.str)
+        self.assertIs(types.int.required, types.int.required)
+        self.assertIsNot(types.str.minlength(2), types.str.minlength(2))
+
+    def test_chains_from_non_interned_types_are_not_interned(self):
+        base = types.str.minlength(2)
+        self.assertIsNot(base.required, base.required)
+
+    def test_chaining_doesnt_change_the_original(self):
+        base = types.str.trim
+        required = base.required
+        self.assertFalse(base.fdef._required)
+        self.assertTrue(required.fdef._required)
+        self.assertIsNot(base.fdef, required.fdef)
+
+    def test_chaining_copies_index_names(self):
+        base = types.str.cindex('a')
+        indexed = base.cindex('b')
+        self.assertEqual(base.fdef._cindex_names, ['a'])
+        self.assertEqual(indexed.fdef._cindex_names, ['a', 'b'])
+
+    def test_interned_types_are_not_owned_by_classes(self):
+        @jsonclass(class_graph='test_types_sharing')
+        class SharingA:
+            name: str = types.str.required
+            tags: list[str] = types.listof(types.str.required)
+
+        @jsonclass(class_graph='test_types_sharing')
+        class SharingB:
+            name: Optional[str] = types.str.required
+
+        self.assertIsNone(types.str.required.fdef._cdef)
+        afdef = SharingA.cdef.field_named('name').fdef
+        bfdef = SharingB.cdef.field_named('name').fdef
+        self.assertIs(afdef.cdef, SharingA.cdef)
+        self.assertIs(bfdef.cdef, SharingB.cdef)
+        item_types = SharingA.cdef.field_named('tags').fdef.item_types
+        self.assertIs(item_types.fdef.cdef, SharingA.cdef)
+        self.assertEqual(SharingA(name='a', tags=['b']).tags, ['b'])
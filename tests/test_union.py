@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from unittest import TestCase
 from jsonclasses.excs import ValidationException
 from tests.classes.simple_mixed import SimpleMixed, SimpleMixedT, SimpleMixedU
+from tests.classes.tagged_union import TaggedOwner, TaggedCat, TaggedDog
 
 
 class TestUnion(TestCase):
@@ -31,3 +32,31 @@ class TestUnion(TestCase):
         self.assertEqual(two.value, '123')
         self.assertEqual(one.tojson()['value'], '2021-10-16T13:43:28.099Z')
         self.assertEqual(two.tojson()['value'], '123')
+
+    def test_union_dispatches_by_runtime_type(self):
+        owner = TaggedOwner(payload=5)
+        self.assertEqual(owner.payload, 5)
+        owner = TaggedOwner(payload='5')
+        self.assertEqual(owner.payload, '5')
+        owner = TaggedOwner(payload={'name': 'Mimi'})
+        self.assertIsInstance(owner.payload, TaggedCat)
+        owner.validate()
+        self.assertEqual(owner.tojson()['payload'],
+                         {'kind': 'TaggedCat', 'name': 'Mimi', 'lives': 9})
+
+    def test_union_dispatches_objects_by_discriminator(self):
+        owner = TaggedOwner(pet={'kind': 'TaggedDog', 'name': 'Lucky'})
+        self.assertIsInstance(owner.pet, TaggedDog)
+        self.assertEqual(owner.pet.name, 'Lucky')
+        owner.validate()
+        self.assertEqual(owner.tojson()['pet'],
+                         {'kind': 'TaggedDog', 'name': 'Lucky', 'good': True})
+
+    def test_union_without_matched_discriminator_tries_in_order(self):
+        owner = TaggedOwner(pet={'name': 'Mimi'})
+        self.assertIsInstance(owner.pet, TaggedCat)
+
+    def test_union_raises_if_no_candidate_of_runtime_type(self):
+        owner = TaggedOwner(payload=5.5)
+        with self.assertRaises(ValidationException):
+            owner.validate()
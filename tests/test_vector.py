@@ -0,0 +1,76 @@
+from __future__ import annotations
+from unittest import TestCase
+from unittest.mock import patch
+from jsonclasses import vector
+from jsonclasses.excs import ValidationException
+from tests.classes.sensor_readings import SensorReadings
+
+
+class TestVector(TestCase):
+
+    def test_vector_validator_is_built_for_numeric_chains(self):
+        fields = SensorReadings.cdef.field_named
+        for name in ['levels', 'temps', 'counts']:
+            modifier = fields(name).fdef.item_types.modifier
+            self.assertIsNotNone(modifier.vector_validator)
+        modifier = fields('scaled').fdef.item_types.modifier
+        self.assertIsNotNone(modifier.bulk_transformer)
+        self.assertIsNotNone(vector.vector_transformer([(abs, ())]))
+        self.assertIsNone(vector.vector_transformer([(None, ())]))
+
+    def test_vector_validator_returns_indices_of_invalid_items(self):
+        validator = vector.vector_validator(int, [('ge', 0), ('le', 100)])
+        self.assertEqual(validator([1, 50, 100]), [])
+        self.assertEqual(validator([1, -1, 50, 101]), [1, 3])
+        self.assertIsNone(validator([1, 2.5]))
+        self.assertIsNone(validator([1, None]))
+        self.assertIsNone(vector.vector_validator(str, []))
+
+    def test_vector_validator_works_without_numpy(self):
+        with patch.object(vector, '_numpy', lambda: None):
+            validator = vector.vector_validator(float, [('gt', 0)])
+            self.assertEqual(validator([1.5, 2.5]), [])
+            self.assertEqual(validator([1.5, 0.0, -2.5]), [1, 2])
+
+    def test_numeric_list_reports_invalid_items_with_keypaths(self):
+        readings = SensorReadings(levels=[0, 50, 101, 30, -1],
+                                  temps=[20.5, 90.0], counts=[1, 2, 3])
+        with self.assertRaises(ValidationException) as context:
+            readings.validate(all_fields=True)
+        self.assertEqual(context.exception.keypath_messages, {
+            'levels.2': 'value is not less than or equal 100',
+            'levels.4': 'value is not greater than or equal 0',
+            'temps.1': 'value is not less than or equal 85'})
+
+    def test_numeric_list_reports_first_invalid_item(self):
+        readings = SensorReadings(counts=[1, 2, 0, -1])
+        with self.assertRaises(ValidationException) as context:
+            readings.validate()
+        self.assertEqual(context.exception.keypath_messages,
+                         {'counts.2': 'value is not positive'})
+
+    def test_numeric_list_with_mixed_items_is_validated_item_by_item(self):
+        readings = SensorReadings(levels=[1, 'a', None])
+        with self.assertRaises(ValidationException) as context:
+            readings.validate(all_fields=True)
+        self.assertEqual(context.exception.keypath_messages, {
+            'levels.1': 'value is not int',
+            'levels.2': 'value required'})
+
+    def test_valid_numeric_list_is_valid(self):
+        readings = SensorReadings(levels=list(range(101)),
+                                  temps=[-40.0, 0.0, 85.0], counts=[1])
+        readings.validate()
+
+    def test_numeric_list_reports_invalid_item_when_transformed(self):
+        with self.assertRaises(ValidationException) as context:
+            SensorReadings(scaled=[1.5, 'a'])
+        self.assertEqual(context.exception.keypath_messages,
+                         {'scaled.1': 'value is not float'})
+
+    def test_numeric_list_is_transformed(self):
+        readings = SensorReadings(scaled=[1.5, -2.0, 3])
+        self.assertEqual(readings.scaled, [4.0, 5.0, 7.0])
+        with patch.object(vector, '_numpy', lambda: None):
+            readings = SensorReadings(scaled=[1.5, -2.0, 3])
+        self.assertEqual(readings.scaled, [4.0, 5.0, 7.0])